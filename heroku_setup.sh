@@ -11,4 +11,7 @@ fi
 # Patch Streamlit's index.html for better Google search appearance
 STREAMLIT_INDEX=$(python -c "import streamlit; import os; print(os.path.join(os.path.dirname(streamlit.__file__), 'static', 'index.html'))")
 sed -i "s|<title>Streamlit</title>|<title>Sudokudos - Solvers, scores, and snazzy charts</title>|g" "$STREAMLIT_INDEX"
-sed -i "s|</title>|</title><meta name=\"description\" content=\"Explore results, rankings, and solver performance from the World Sudoku Championship (WSC) and Sudoku Grand Prix (GP).\">|g" "$STREAMLIT_INDEX"
\ No newline at end of file
+sed -i "s|</title>|</title><meta name=\"description\" content=\"Explore results, rankings, and solver performance from the World Sudoku Championship (WSC) and Sudoku Grand Prix (GP).\">|g" "$STREAMLIT_INDEX"
+# Build the data snapshots up front so the first visitor does not wait for the full ingest
+python -c "import shared.data.loaders.gp as gp; gp.load_gp_snapshot()"
+python -c "import shared.data.loaders.store as store; store.build_store()"
@@ -10,15 +10,12 @@ import shared.data.loaders.cached
 import shared.plots.eventoriented
 import shared.presentation
 import shared.queryparams
-import shared.utils
 
 def present_gp():
     """Create the GP page."""
     shared.presentation.global_setup_and_display("Sudoku Grand Prix")
 
-    combined_df = shared.data.loaders.cached.load_gp()
-
-    years = list(reversed(shared.utils.all_available_years(combined_df)))
+    years = list(reversed(shared.data.loaders.cached.load_gp_years()))
 
     # For years, 0 will be the most recent year
     chosen_index = shared.queryparams.retrieve_query_value_with_default("year", years, 0)
@@ -47,7 +44,9 @@ def present_gp():
         args=("year", "year_selector"),
         key="year_selector")
 
-    year_subset = combined_df.filter(pl.col("year") == selected_year)
+    # The selected year is filtered from the cached GP snapshot, which is read once per process;
+    # the participant chart needs every year, but only a handful of columns.
+    year_subset = shared.data.loaders.cached.load_gp_year(selected_year)
 
     st.subheader("Summary")
 
@@ -71,12 +70,12 @@ def present_gp():
     cols = st.columns(2)
     with cols[0]:
         fig_leaderboard = shared.plots.eventoriented.create_leaderboard_chart(
-            combined_df, year=selected_year, top_n=selected_top_n)
+            year_subset, year=selected_year, top_n=selected_top_n)
         st.pyplot(fig_leaderboard, use_container_width=True)
 
     with cols[1]:
         fig_participants = shared.plots.eventoriented.create_participant_volume_chart(
-            combined_df, year=selected_year)
+            shared.data.loaders.cached.load_gp_participation(), year=selected_year)
         st.pyplot(fig_participants, use_container_width=True)
 
     st.subheader("Solver tracker")
@@ -102,21 +101,21 @@ def present_gp():
     cols = st.columns(2)
     with cols[0]:
         fig_violin = shared.plots.eventoriented.create_violin_chart(
-            combined_df, selected_solvers, year_subset=[selected_year])
+            year_subset, selected_solvers, year_subset=[selected_year],
+            statistics=shared.data.loaders.cached.load_competition_round_statistics("GP"))
         st.pyplot(fig_violin, use_container_width=True)
 
     with cols[1]:
         if len(selected_solvers) >= 1:
             trend_chart = shared.plots.eventoriented.create_point_trend_chart(
-                combined_df, selected_solvers, year=selected_year)
+                year_subset, selected_solvers, year=selected_year)
             st.pyplot(trend_chart, use_container_width=True)
 
-    criteria = pl.col("year") == selected_year
-    subset = combined_df.filter(criteria).drop(["year", "source_file"]).sort("Rank")
+    subset = year_subset.drop(["year", "source_file"]).sort("Rank")
 
     subset_selected = subset.filter(pl.col("user_pseudo_id").is_in(selected_solvers))
 
-    unshown_columns = ["#", "user_pseudo_id"]
+    unshown_columns = ["#", "user_pseudo_id", "solver_id"]
 
     if len(subset_selected) > 0:
         st.dataframe(subset_selected.drop(unshown_columns), hide_index=True)
@@ -19,15 +19,18 @@ def present_other_events():
     """Create the Other Events page."""
     shared.presentation.global_setup_and_display("Other Events")
 
-    esc_raw = shared.data.loaders.cached.load_eurosudoku()
-    gp = shared.data.loaders.cached.load_gp()
-    esc = shared.data.attempted_mapping(
-        esc_raw, gp, manual_override=shared.competitions.ESC_NAME_TO_GP_ID_OVERRIDE)
-
     selected_event = st.selectbox("Select event", list(AVAILABLE_EVENTS.keys()))
     competition_key, year = AVAILABLE_EVENTS[selected_event]
 
+    # Only the selected event is read, along with the GP identity columns needed to map names.
+    gp = shared.data.loaders.cached.load_results(
+        "GP", columns=("Name", "Country", "Nick", "user_pseudo_id"))
+    event_raw = shared.data.loaders.cached.load_results(competition_key, years=(year,))
+
     if competition_key == "ESC":
+        esc = shared.data.attempted_mapping(
+            event_raw, gp, manual_override=shared.competitions.ESC_NAME_TO_GP_ID_OVERRIDE,
+            name_index=shared.data.loaders.cached.load_gp_name_index())
         _present_esc(esc, year)
 
 
@@ -77,7 +80,8 @@ def _present_esc(esc, year):
     cols = st.columns(2)
     with cols[0]:
         fig_violin = shared.plots.eventoriented.create_violin_chart(
-            esc, selected_solvers, year_subset=[year], competition="ESC")
+            esc, selected_solvers, year_subset=[year], competition="ESC",
+            statistics=shared.data.loaders.cached.load_competition_round_statistics("ESC"))
         st.pyplot(fig_violin, use_container_width=True)
 
     with cols[1]:
@@ -9,33 +9,6 @@ import shared.presentation
 import shared.queryparams
 
 
-def _extract_name_parts(df: pl.DataFrame) -> pl.DataFrame:
-    """Add Name, Nick, Country columns by parsing user_pseudo_id."""
-    uids = df["user_pseudo_id"].to_list()
-    names, nicks, countries = [], [], []
-    for uid in uids:
-        if " - " in uid:
-            name_part, country = uid.rsplit(" - ", 1)
-        else:
-            name_part, country = uid, ""
-        if "(" in name_part and ")" in name_part:
-            nick_start = name_part.index("(")
-            nick_end = name_part.index(")")
-            nick = name_part[nick_start + 1:nick_end]
-            name = name_part[:nick_start].strip()
-        else:
-            nick = ""
-            name = name_part.strip()
-        names.append(name)
-        nicks.append(nick)
-        countries.append(country)
-    return df.with_columns([
-        pl.Series("Name", names),
-        pl.Series("Nick", nicks),
-        pl.Series("Country", countries),
-    ])
-
-
 def present_ratings():
     """Create the ratings page."""
     shared.presentation.global_setup_and_display("Ratings")
@@ -96,9 +69,6 @@ def present_ratings():
     st.divider()
 
     # --- Leaderboards side by side ---
-    cur_named = _extract_name_parts(current_lb)
-    at_named = _extract_name_parts(alltime_lb)
-
     cols = st.columns(2)
 
     # Build peak column for all-time leaderboard
@@ -115,7 +85,7 @@ def present_ratings():
 
     with cols[0]:
         st.subheader("Current leaderboard")
-        cur_with_last = cur_named.join(last_comp, on="user_pseudo_id", how="left")
+        cur_with_last = current_lb.join(last_comp, on="user_pseudo_id", how="left")
         summary = cur_with_last.head(20).select([
             pl.col("rank").alias("#"),
             "Name",
@@ -139,7 +109,7 @@ def present_ratings():
 
     with cols[1]:
         st.subheader("All-time leaderboard")
-        at_summary = at_named.head(20).select([
+        at_summary = alltime_lb.head(20).select([
             pl.col("rank").alias("#"),
             "Name",
             peak_col,
@@ -149,7 +119,7 @@ def present_ratings():
                      column_config=peak_rating_fmt)
 
         with st.expander("See full table"):
-            at_full = at_named.select([
+            at_full = alltime_lb.select([
                 pl.col("rank").alias("#"),
                 "Name", "Nick", "Country",
                 pl.col("peak_rating").round(0).cast(pl.Int64).alias("Peak rating"),
@@ -163,9 +133,10 @@ def present_ratings():
 
     # --- Solver Showdown ---
     st.subheader("Solver showdown")
-    available = current_lb["user_pseudo_id"].to_list()
+    search_index = shared.data.loaders.cached.load_ratings_search_index()
     chosen_solvers = shared.queryparams.extract_query_param_list(
-        "solvers", available, default=available[:3]
+        "solvers", set(current_lb["user_pseudo_id"]),
+        default=current_lb["user_pseudo_id"].head(3).to_list()
     )
     try:
         if "year_min" in st.query_params:
@@ -179,9 +150,11 @@ def present_ratings():
     except ValueError:
         pass
 
+    solver_options = shared.presentation.solver_search_options(
+        search_index, "solvers_search", always_include=chosen_solvers)
     selected_solvers = st.multiselect(
         "Select solvers to compare",
-        available,
+        solver_options,
         default=chosen_solvers,
         on_change=shared.queryparams.update_query_param,
         args=("solvers", "solvers_selector", True),
@@ -229,7 +202,7 @@ def present_ratings():
     _leader_lines = []
     for _label, _df, _col in _record_metrics:
         _row = _df.sort(_col, descending=True).head(1)
-        _name = _extract_name_parts(_row)["Name"][0]
+        _name = _row["Name"][0]
         _val = int(round(_row[_col][0]))
         _leader_lines.append(
             f'🥇 **{_label}**: <span style="color: #DAA520">{_name}</span> ({_val})'
@@ -249,15 +222,13 @@ def present_ratings():
     _included_uids = (set(_top_adj_uids) | set(_top_wins_uids)
                       | set(_top_rounds_uids) | set(_top_rating_uids) | set(_ones_uids))
     records_display = (
-        _extract_name_parts(
-            records
-            .filter(pl.col("user_pseudo_id").is_in(_included_uids))
-            .sort(["ones_count", "best_streak"], descending=True)
-            .join(
-                alltime_lb.select(["user_pseudo_id",
-                                   pl.col("peak_rating").round(0).cast(pl.Int64)]),
-                on="user_pseudo_id", how="left",
-            )
+        records
+        .filter(pl.col("user_pseudo_id").is_in(_included_uids))
+        .sort(["ones_count", "best_streak"], descending=True)
+        .join(
+            alltime_lb.select(["user_pseudo_id",
+                               pl.col("peak_rating").round(0).cast(pl.Int64)]),
+            on="user_pseudo_id", how="left",
         )
         .select([
             "Name", "Nick", "Country",
@@ -2,50 +2,48 @@
 
 import streamlit as st
 
-import shared.competitions
-import shared.data
 import shared.data.loaders.cached
 import shared.plots.ratingoriented
 import shared.plots.solveroriented
 import shared.presentation
 import shared.queryparams
+import shared.solvers
 import shared.utils
 
 def present_solver():
     """Create the solver page."""
     shared.presentation.global_setup_and_display("Solver Analysis")
 
-    wsc_unmapped = shared.data.loaders.cached.load_wsc()
     gp = shared.data.loaders.cached.load_gp()
-    esc_unmapped = shared.data.loaders.cached.load_eurosudoku()
-    wsc = shared.data.attempted_mapping(wsc_unmapped, gp)
-    esc = shared.data.attempted_mapping(
-        esc_unmapped, gp,
-        manual_override=shared.competitions.ESC_NAME_TO_GP_ID_OVERRIDE)
+    wsc = shared.data.loaders.cached.load_mapped_wsc()
+    esc = shared.data.loaders.cached.load_mapped_esc()
     timeseries = shared.data.loaders.cached.load_ratings_timeseries()
 
-    combined_with_wsc = shared.data.merge_unflat_datasets(gp, wsc, extra_datasets=[esc])
+    # The merge across competitions and the solvers ordered by total points in all of them.
+    combined_with_wsc, available = shared.data.loaders.cached.load_combined()
 
-    # List solvers by total points in all competitions
-    available = shared.data.ids_by_total_points(combined_with_wsc)
+    search_index = shared.data.loaders.cached.load_solver_search_index()
+    known_solvers = set(available)
 
-    chosen_index = None
-    if "solver" in st.query_params and st.query_params["solver"] in available:
-        chosen_index = available.index(st.query_params["solver"])
+    if "solver" in st.query_params and st.query_params["solver"] in known_solvers:
+        current_solver = st.query_params["solver"]
     else:
-        chosen_index = 0
+        current_solver = available[0]
+
+    solver_options = shared.presentation.solver_search_options(
+        search_index, "solver_search", always_include=[current_solver])
 
     selected_solver = st.selectbox(
         "Select solver",
-        available,
-        index=chosen_index,
+        solver_options,
+        index=solver_options.index(current_solver),
         on_change=shared.queryparams.update_query_param,
         args=("solver", "user_selector"),
         key="user_selector")
 
     st.divider()
 
-    chosen_additional = shared.queryparams.extract_query_param_list("additional", available)
+    chosen_additional = shared.queryparams.extract_query_param_list("additional", known_solvers)
 
     # Show the events in upper case even though we represent them in lowercase internally.
     supported_events = [event.upper() for event in shared.utils.supported_competitions()]
@@ -65,9 +63,11 @@ def present_solver():
     cols = st.columns(2)
 
     with cols[0]:
+        additional_options = shared.presentation.solver_search_options(
+            search_index, "additional_search", always_include=chosen_additional)
         additional_solvers = st.multiselect(
             "Select additional solvers to compare",
-            available,
+            additional_options,
             default=chosen_additional,
             on_change=shared.queryparams.update_query_param,
             args=("additional", "additional_selector", True),
@@ -78,12 +78,12 @@ def present_solver():
         smoothing_level = 8
         if "smoothing" in st.query_params:
             value = int(st.query_params["smoothing"])
-            if 1 <= value <= 20:
+            if value in shared.solvers.SMOOTHING_WINDOWS:
                 smoothing_level = value
 
         smoothing = st.select_slider(
             "Periods for smoothing",
-            options=(range(1, 21)),
+            options=shared.solvers.SMOOTHING_WINDOWS,
             value=smoothing_level,
             on_change=shared.queryparams.update_query_param,
             args=("smoothing", "smoothing_selector"),
@@ -95,7 +95,9 @@ def present_solver():
             metric="points",
             as_percent_of_max=True,
             window_size=smoothing,
-            included_events=events_lower)
+            included_events=events_lower,
+            chart_data=shared.data.loaders.cached.load_trend_chart_data(
+                tuple(joint_solvers), "points", True, tuple(events_lower)))
         if fig_points is not None:
             st.pyplot(fig_points, use_container_width=True)
 
@@ -104,13 +106,16 @@ def present_solver():
             joint_solvers,
             metric="position",
             window_size=smoothing,
-            included_events=events_lower)
+            included_events=events_lower,
+            chart_data=shared.data.loaders.cached.load_trend_chart_data(
+                tuple(joint_solvers), "position", False, tuple(events_lower)))
         if fig_position is not None:
             st.pyplot(fig_position, use_container_width=True)
 
     with cols[1]:
         fig_rank = shared.plots.solveroriented.create_rank_chart(
-            combined_with_wsc, selected_solver, included_events=events_lower)
+            combined_with_wsc, selected_solver, included_events=events_lower,
+            performance_table=shared.data.loaders.cached.load_performance_table())
         if fig_rank is not None:
             st.pyplot(fig_rank, use_container_width=True)
 
@@ -1,12 +1,12 @@
 """This generates the WSC page."""
 
 import polars as pl
+import polars.selectors as cs
 
 import streamlit as st
 
-import shared.competitions
-import shared.data
 import shared.data.loaders.cached
+import shared.data.rounds
 import shared.plots.eventoriented
 import shared.presentation
 import shared.queryparams
@@ -16,9 +16,8 @@ def present_wsc():
     """Create the WSC page."""
     shared.presentation.global_setup_and_display("World Sudoku Championship")
 
-    gp = shared.data.loaders.cached.load_gp()
     wsc_unmapped = shared.data.loaders.cached.load_wsc()
-    wsc = shared.data.attempted_mapping(wsc_unmapped, gp)
+    wsc = shared.data.loaders.cached.load_mapped_wsc()
 
     years = list(reversed(shared.utils.all_available_years(wsc)))
 
@@ -99,7 +98,8 @@ def present_wsc():
     cols = st.columns(2)
     with cols[0]:
         fig_violin = shared.plots.eventoriented.create_violin_chart(
-            wsc, selected_solvers, year_subset=[selected_year], competition="WSC")
+            wsc, selected_solvers, year_subset=[selected_year], competition="WSC",
+            statistics=shared.data.loaders.cached.load_competition_round_statistics("WSC"))
         st.pyplot(fig_violin, use_container_width=True)
 
     with cols[1]:
@@ -108,19 +108,17 @@ def present_wsc():
                 wsc, selected_solvers, year=selected_year, competition="WSC")
             st.pyplot(trend_chart, use_container_width=True)
 
-    max_round_plus_one = shared.competitions.MAXIMUM_ROUND + 1
+    # Every year has columns for every possible round, so only show the rounds held that year,
+    # which are those with a result for some competitor.
+    year_rounds = shared.data.rounds.round_results(year_subset, "WSC")
+    round_columns = [f"WSC_t{competition_round} points" for competition_round in
+                     shared.data.rounds.rounds_held(year_rounds, "WSC", selected_year)]
+    unheld_round_columns = (cs.matches(r"^WSC_t\d+ points$") - cs.by_name(round_columns))
 
     # Generate a clean dataset of the selected users
     year_data_mapped = year_subset
-    kept_columns = ["Name", "Official", "Official_rank", "WSC_total", "user_pseudo_id"]
-    for wsc_round in range(1, max_round_plus_one):
-        colname = f"WSC_t{wsc_round} points"
-        if colname in year_data_mapped:
-            # Some rounds don't exist in all years, but they still have columns because
-            # all years are represented in one large table that contains a column for
-            # every possible round.
-            if year_data_mapped.get_column(colname).is_null().sum() != len(year_data_mapped):
-                kept_columns.append(colname)
+    kept_columns = ["Name", "Official", "Official_rank", "WSC_total", "user_pseudo_id",
+                    *round_columns]
 
     year_data_mapped = year_data_mapped.select(kept_columns)
     matching_users = year_data_mapped.filter(pl.col("user_pseudo_id").is_in(selected_solvers))
@@ -129,13 +127,9 @@ def present_wsc():
 
     st.subheader("All competitors")
 
-    year_data = wsc_unmapped.filter(pl.col("year") == selected_year).drop(["year", "WSC_entry"])
-
-    for wsc_round in range(1, max_round_plus_one):
-        colname = f"WSC_t{wsc_round} points"
-        if colname in year_data:
-            if year_data.get_column(colname).is_null().sum() == len(year_data):
-                year_data = year_data.drop(colname)
+    year_data = (wsc_unmapped.filter(pl.col("year") == selected_year)
+                 .drop(["year", "WSC_entry"])
+                 .drop(unheld_round_columns))
 
     st.dataframe(year_data, hide_index=True)
 
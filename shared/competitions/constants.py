@@ -5,7 +5,8 @@
 MAXIMUM_ROUND = 16
 
 # These were identified partially by hand and partially with a utility
-# function using difflib.
+# function using difflib. New candidates can be proposed in bulk with
+# utilities/propose_name_matches.py (see shared.data.fuzzy_match).
 WSC_NAME_TO_GP_ID_OVERRIDE = {
     "Zvěřina Jan": "Jan Zverina (Nickless) - Czech Rep.",
     "Jan Zvěřina": "Jan Zverina (Nickless) - Czech Rep.",
@@ -2,6 +2,7 @@
 
 from .manipulation import (
     create_flat_dataset,
+    round_statistics,
     merge_unflat_datasets,
     merge_flat_datasets,
     attempted_mapping,
@@ -0,0 +1,150 @@
+"""Fuzzy matching of WSC and ESC names to GP solvers, for proposing identity links in bulk.
+
+Names that the name index cannot resolve (see `shared.data.name_index`) used to be matched by
+comparing them against every GP name with difflib, which is quadratic. Here a name is only
+compared with GP names that have a word starting with the same letters (blocking), and each such
+pair is scored by the Dice coefficient of the character trigrams of their words. The score
+ignores word order, accents, and case, so "Zvěřina Jan" and "Jan Zverina" score 1.0.
+
+The result is a candidate table meant for review: the best candidates for each name, with the
+top one provisionally accepted when its score is high enough. After review, the accepted rows
+can be passed to `attempted_mapping` as `manual_override`, in place of a hand-written dictionary.
+"""
+
+import polars as pl
+
+from .name_index import comparable_name, normalized_name
+
+# Names are only compared if they have a word starting with the same letters.
+BLOCK_PREFIX = 4
+
+# Blocks holding more GP names than this (common first names) are too broad to narrow down the
+# candidates, so they are not used.
+MAX_BLOCK_SIZE = 100
+
+CANDIDATE_SCHEMA = {
+    "Name": pl.String,
+    "rank": pl.UInt32,
+    "score": pl.Float64,
+    "candidate_name": pl.String,
+    "user_pseudo_id": pl.String,
+    "accepted": pl.Boolean,
+}
+
+
+def _words(df, column):
+    """Return the (column, word) pairs of each name's comparable words."""
+    return (
+        df.select(column, comparable_name(pl.col(column)).str.split(" ").alias("word"))
+        .explode("word")
+        .filter(pl.col("word").str.len_chars() > 0)
+    )
+
+
+def _blocks(words, column):
+    """Return the distinct (column, block) pairs, blocking on the first letters of each word."""
+    return (words.select(column, pl.col("word").str.slice(0, BLOCK_PREFIX).alias("block"))
+            .unique())
+
+
+def _trigrams(words, column):
+    """Return the distinct (column, gram) pairs of each word's padded character trigrams."""
+    padded = words.select(column, (pl.lit(" ") + pl.col("word") + pl.lit(" ")).alias("padded"))
+    return (
+        padded
+        .with_columns(pl.int_ranges(0, pl.col("padded").str.len_chars() - 2).alias("offset"))
+        .explode("offset")
+        .select(column, pl.col("padded").str.slice(pl.col("offset"), 3).alias("gram"))
+        .unique()
+    )
+
+
+def propose_matches(names, gp_df, top_n=3, min_score=0.5, accept_score=0.8,
+                    max_block_size=MAX_BLOCK_SIZE):
+    """Propose GP solvers for each name, as a table for review.
+
+    Args:
+        names: Series of names as written in the WSC or ESC results
+        gp_df: DataFrame with Name and user_pseudo_id columns
+        top_n: Candidates kept per name
+        min_score: Candidates scoring below this are dropped
+        accept_score: The best candidate is marked accepted if it scores at least this, and
+            strictly better than the runner-up
+        max_block_size: Blocks holding more GP names than this are not used
+
+    Returns:
+        DataFrame with the columns of `CANDIDATE_SCHEMA`, ordered by name and rank. Names with
+        no candidate above `min_score` are absent.
+    """
+    queries = pl.DataFrame({"Name": names}, schema={"Name": pl.String}).drop_nulls().unique()
+    solvers = (gp_df.select(pl.col("Name").alias("candidate_name"), "user_pseudo_id")
+               .drop_nulls()
+               .unique())
+
+    query_words = _words(queries, "Name")
+    solver_words = _words(solvers.select("candidate_name").unique(), "candidate_name")
+
+    solver_blocks = _blocks(solver_words, "candidate_name")
+    solver_blocks = solver_blocks.filter(pl.len().over("block") <= max_block_size)
+    pairs = (_blocks(query_words, "Name")
+             .join(solver_blocks, on="block", how="inner")
+             .select("Name", "candidate_name")
+             .unique())
+
+    query_grams = _trigrams(query_words, "Name")
+    solver_grams = _trigrams(solver_words, "candidate_name")
+
+    query_sizes = query_grams.group_by("Name").len("query_size")
+    solver_sizes = solver_grams.group_by("candidate_name").len("candidate_size")
+
+    shared = (
+        pairs
+        .join(query_grams, on="Name", how="inner")
+        .join(solver_grams, on=["candidate_name", "gram"], how="inner")
+        .group_by(["Name", "candidate_name"])
+        .len("shared")
+    )
+
+    candidates = (
+        shared
+        .join(query_sizes, on="Name")
+        .join(solver_sizes, on="candidate_name")
+        .with_columns(
+            (2 * pl.col("shared") / (pl.col("query_size") + pl.col("candidate_size")))
+            .alias("score"))
+        .filter(pl.col("score") >= min_score)
+        .join(solvers, on="candidate_name")
+        .sort(["Name", "score", "candidate_name", "user_pseudo_id"],
+              descending=[False, True, False, False])
+        .with_columns(pl.int_range(1, pl.len() + 1, dtype=pl.UInt32).over("Name").alias("rank"))
+        .filter(pl.col("rank") <= top_n)
+    )
+
+    runner_up = pl.col("score").shift(-1).over("Name").fill_null(0.0)
+    return (
+        candidates
+        .with_columns(((pl.col("rank") == 1)
+                       & (pl.col("score") >= accept_score)
+                       & (pl.col("score") > runner_up)).alias("accepted"))
+        .select(list(CANDIDATE_SCHEMA))
+        .cast(CANDIDATE_SCHEMA)
+    )
+
+
+def overrides_from_candidates(candidates):
+    """Turn the accepted rows of a reviewed candidate table into a name override dictionary.
+
+    Names are normalized as `attempted_mapping` normalizes them before applying overrides.
+
+    Raises:
+        ValueError: If a name has more than one accepted candidate
+    """
+    accepted = (candidates.filter(pl.col("accepted"))
+                .select(normalized_name(pl.col("Name")).alias("Name"), "user_pseudo_id")
+                .unique())
+
+    conflicts = accepted.filter(pl.col("Name").is_duplicated()).get_column("Name").unique()
+    if len(conflicts) > 0:
+        raise ValueError(f"Several accepted candidates for {sorted(conflicts.to_list())}")
+
+    return dict(zip(accepted.get_column("Name"), accepted.get_column("user_pseudo_id")))
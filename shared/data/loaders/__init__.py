@@ -2,8 +2,12 @@
 
 Direct imports available via explicit module paths:
 - from shared.data.loaders.gp import load_gp
+- from shared.data.loaders.gp import load_gp_snapshot (Parquet snapshot keyed by input fingerprint)
+- from shared.data.loaders.gp import ingest_gp_round (fold a new round file into the snapshot)
 - from shared.data.loaders.wsc import load_wsc
-- from shared.data.loaders.cached import load_gp, load_wsc (streamlit-cached)
+- from shared.data.loaders.combined import load_combined (merged GP/WSC/ESC, snapshotted)
+- from shared.data.loaders.store import build_store, read_results, scan_results (partitioned Parquet store)
+- from shared.data.loaders.cached import load_gp, load_wsc, load_combined, load_results (streamlit-cached)
 - from shared.data.loaders.ratings import load_ratings_timeseries, ...
 - from shared.data.loaders.cached import load_ratings_timeseries, ... (streamlit-cached)
 """
@@ -2,11 +2,33 @@
 
 from typing import Optional
 
+import polars as pl
 import streamlit as st
 
+import shared.data.registry
+import shared.data.solver_search
+import shared.solvers
+
+from .combined import (
+    load_combined as _load_combined,
+    load_competition_round_statistics as _load_competition_round_statistics,
+    load_mapped_esc as _load_mapped_esc,
+    load_mapped_wsc as _load_mapped_wsc,
+    load_round_statistics as _load_round_statistics,
+)
 from .eurosudoku import load_eurosudoku as _load_eurosudoku
-from .gp import load_gp as _load_gp
+from .gp import (
+    gp_years as _gp_years,
+    load_gp as _load_gp,
+    load_gp_name_index as _load_gp_name_index,
+    load_gp_snapshot as _load_gp_snapshot,
+)
 from .wsc import load_wsc as _load_wsc
+from .store import (
+    ensure_current as _ensure_current,
+    read_results as _read_results,
+    DEFAULT_STORE_DIR,
+)
 from .ratings import (
     load_ratings_timeseries as _load_ratings_timeseries,
     load_current_leaderboard as _load_current_leaderboard,
@@ -19,8 +41,42 @@ from .ratings import (
 
 @st.cache_data
 def load_gp(csv_directory="data/processed/gp", verbose=False, output_csv=None):
-    """Load GP data with Streamlit caching."""
-    return _load_gp(csv_directory, verbose, output_csv)
+    """Load GP data with Streamlit caching.
+
+    Reads from the on-disk snapshot when the GP inputs are unchanged, so that a fresh process
+    does not redo the full ingest.
+    """
+    if output_csv:
+        return _load_gp(csv_directory, verbose, output_csv)
+    return _load_gp_snapshot(csv_directory, verbose=verbose)
+
+
+@st.cache_data
+def load_gp_name_index(csv_directory="data/processed/gp"):
+    """Load the GP name index with Streamlit caching, shared across sessions."""
+    return _load_gp_name_index(csv_directory)
+
+
+@st.cache_data
+def load_gp_years(csv_directory="data/processed/gp"):
+    """List the GP years with Streamlit caching, without reading any results."""
+    return _gp_years(csv_directory)
+
+
+@st.cache_data
+def load_gp_year(year, csv_directory="data/processed/gp"):
+    """Load a single GP year with Streamlit caching, filtered from the GP snapshot."""
+    return load_gp(csv_directory).filter(pl.col("year") == year)
+
+
+@st.cache_data
+def load_gp_participation(csv_directory="data/processed/gp"):
+    """Load which solvers played which GP rounds with Streamlit caching.
+
+    Only the identity and round position columns are kept from the GP snapshot.
+    """
+    return load_gp(csv_directory).select(
+        pl.col("year", "user_pseudo_id"), pl.col(r"^GP_t\d+ position$"), pl.col("solver_id"))
 
 
 @st.cache_data
@@ -35,6 +91,109 @@ def load_eurosudoku(csv_directory="data/raw/eurosudoku"):
     return _load_eurosudoku(csv_directory)
 
 
+@st.cache_data
+def load_mapped_wsc(gp_directory="data/processed/gp", wsc_directory="data/raw/wsc/"):
+    """Load WSC data mapped to GP identifiers with Streamlit caching."""
+    return _load_mapped_wsc(gp_directory, wsc_directory)
+
+
+@st.cache_data
+def load_mapped_esc(gp_directory="data/processed/gp", esc_directory="data/raw/eurosudoku"):
+    """Load ESC data mapped to GP identifiers with Streamlit caching."""
+    return _load_mapped_esc(gp_directory, esc_directory)
+
+
+@st.cache_data
+def load_combined(gp_directory="data/processed/gp", wsc_directory="data/raw/wsc/",
+                  esc_directory="data/raw/eurosudoku"):
+    """Load the merged GP, WSC, and ESC dataset and its ordered solvers with Streamlit caching.
+
+    Widget interactions on the solver page reuse the merged frame instead of redoing the
+    cross-competition merge. It is rebuilt only when its inputs change.
+    """
+    return _load_combined(gp_directory, wsc_directory, esc_directory)
+
+
+@st.cache_data
+def load_solver_search_index(gp_directory="data/processed/gp", wsc_directory="data/raw/wsc/",
+                             esc_directory="data/raw/eurosudoku"):
+    """Build the search index over every solver with Streamlit caching.
+
+    Solvers are listed by total points in all competitions, as in `load_combined`.
+    """
+    _, solvers = load_combined(gp_directory, wsc_directory, esc_directory)
+    return shared.data.solver_search.build_search_index(solvers)
+
+
+@st.cache_data
+def load_round_statistics(metric="points", gp_directory="data/processed/gp",
+                          wsc_directory="data/raw/wsc/", esc_directory="data/raw/eurosudoku"):
+    """Load the distribution statistics of every round with Streamlit caching.
+
+    Charts read round maxima and distributions from here instead of scanning all solvers.
+    """
+    return _load_round_statistics(metric, gp_directory, wsc_directory, esc_directory)
+
+
+@st.cache_data
+def load_competition_round_statistics(competition, metric="points",
+                                      gp_directory="data/processed/gp",
+                                      wsc_directory="data/raw/wsc/",
+                                      esc_directory="data/raw/eurosudoku"):
+    """Load the distribution statistics of one competition's rounds with Streamlit caching.
+
+    Only that competition's results are loaded, never the merged dataset.
+    """
+    return _load_competition_round_statistics(
+        competition, metric, gp_directory, wsc_directory, esc_directory)
+
+
+@st.cache_data
+def load_trend_chart_data(solvers, metric="points", as_percent_of_max=False,
+                          included_events=("gp", "wsc"), gp_directory="data/processed/gp",
+                          wsc_directory="data/raw/wsc/", esc_directory="data/raw/eurosudoku"):
+    """Calculate the trend chart data of a group of solvers with Streamlit caching.
+
+    The moving averages are computed for every window size of the smoothing slider, so moving
+    the slider only redraws the chart.
+
+    Note: solvers and included_events must be tuples (not lists) for hashability.
+    """
+    combined, _ = load_combined(gp_directory, wsc_directory, esc_directory)
+    return shared.solvers.trend_chart_data(
+        combined, metric, as_percent_of_max, list(solvers), list(included_events),
+        statistics=load_round_statistics(metric, gp_directory, wsc_directory, esc_directory))
+
+
+@st.cache_data
+def load_performance_table(gp_directory="data/processed/gp", wsc_directory="data/raw/wsc/",
+                           esc_directory="data/raw/eurosudoku", use_gp_playoffs=True):
+    """Rank every solver in every competition and year with Streamlit caching.
+
+    The ranks are computed once per data version, so a solver's rank chart only looks them up.
+    """
+    combined, _ = load_combined(gp_directory, wsc_directory, esc_directory)
+    return shared.solvers.build_performance_table(combined, use_gp_playoffs=use_gp_playoffs)
+
+
+@st.cache_data
+def load_results(
+    competition: str,
+    years: Optional[tuple[int, ...]] = None,
+    columns: Optional[tuple[str, ...]] = None,
+    store_dir: str = DEFAULT_STORE_DIR,
+):
+    """Read results from the partitioned store with Streamlit caching.
+
+    Only the requested years and columns are read. A competition missing from the store, or
+    stored from inputs that have since changed, is (re)built first.
+
+    Note: years and columns must be tuples (not lists) for hashability.
+    """
+    _ensure_current(competition, store_dir)
+    return _read_results(competition, years, columns, store_dir)
+
+
 @st.cache_data
 def load_ratings_timeseries(
     data_dir: str = DEFAULT_RATINGS_DIR,
@@ -70,3 +229,10 @@ def load_records(data_dir: str = DEFAULT_RATINGS_DIR):
 def load_ratings_metadata(data_dir: str = DEFAULT_RATINGS_DIR):
     """Load ratings metadata with Streamlit caching."""
     return _load_ratings_metadata(data_dir)
+
+
+@st.cache_data
+def load_ratings_search_index(data_dir: str = DEFAULT_RATINGS_DIR):
+    """Build the search index over the current leaderboard with Streamlit caching."""
+    return shared.data.solver_search.build_search_index(
+        load_current_leaderboard(data_dir).get_column("user_pseudo_id"))
@@ -0,0 +1,146 @@
+"""Cross-competition datasets built from the GP, WSC, and ESC loaders.
+
+WSC and ESC names are mapped to GP identifiers, and the three competitions are merged into a
+single solver-year frame, from which the per-round statistics (see `round_statistics`) are
+also derived. Building the merged frame is the most expensive step behind the solver page, and
+it only depends on the source data, so it is snapshotted under a fingerprint of every input
+(see `shared.data.loaders.snapshot`).
+Pages about a single competition read its round statistics from its own loader instead.
+"""
+
+import shared.competitions
+import shared.data.fuzzy_match
+import shared.data.manipulation
+import shared.data.name_index
+import shared.data.registry
+
+from . import eurosudoku, schemas, snapshot, wsc
+from .gp import gp_fingerprint, load_gp_name_index, load_gp_snapshot
+
+
+def combined_fingerprint(gp_directory="data/processed/gp", wsc_directory="data/raw/wsc/",
+                         esc_directory="data/raw/eurosudoku"):
+    """Digest everything that determines the output of `load_combined`.
+
+    That is the GP inputs (see `gp_fingerprint`), the WSC and ESC CSVs, the name override tables,
+    and the modules that type, load, map, and merge the data or derive tables from it.
+    """
+    return snapshot.compute_fingerprint(
+        gp_fingerprint(gp_directory),
+        snapshot.fingerprint_directory(wsc_directory),
+        snapshot.fingerprint_directory(esc_directory),
+        shared.competitions.WSC_NAME_TO_GP_ID_OVERRIDE,
+        shared.competitions.ESC_NAME_TO_GP_ID_OVERRIDE,
+        snapshot.fingerprint_files([
+            schemas.__file__,
+            wsc.__file__,
+            eurosudoku.__file__,
+            shared.data.manipulation.__file__,
+            shared.data.name_index.__file__,
+            shared.data.fuzzy_match.__file__,
+        ]),
+    )
+
+
+def load_mapped_wsc(gp_directory="data/processed/gp", wsc_directory="data/raw/wsc/"):
+    """Return the WSC results with the GP identifiers of their solvers."""
+    return shared.data.manipulation.attempted_mapping(
+        wsc.load_wsc(wsc_directory),
+        load_gp_snapshot(gp_directory),
+        name_index=load_gp_name_index(gp_directory),
+    )
+
+
+def load_mapped_esc(gp_directory="data/processed/gp", esc_directory="data/raw/eurosudoku"):
+    """Return the ESC results with the GP identifiers of their solvers."""
+    return shared.data.manipulation.attempted_mapping(
+        eurosudoku.load_eurosudoku(esc_directory),
+        load_gp_snapshot(gp_directory),
+        manual_override=shared.competitions.ESC_NAME_TO_GP_ID_OVERRIDE,
+        name_index=load_gp_name_index(gp_directory),
+    )
+
+
+def load_combined(gp_directory="data/processed/gp", wsc_directory="data/raw/wsc/",
+                  esc_directory="data/raw/eurosudoku", snapshot_dir=snapshot.DEFAULT_SNAPSHOT_DIR):
+    """Return the merged GP, WSC, and ESC dataset and its solvers ordered by total points.
+
+    The merged frame is read from a Parquet snapshot when the inputs are unchanged. The
+    `solver_id` column is attached after reading, so it always follows the current registry.
+
+    Returns:
+        Tuple of the `merge_unflat_datasets` output and the `ids_by_total_points` list
+    """
+    def build():
+        return shared.data.manipulation.merge_unflat_datasets(
+            load_gp_snapshot(gp_directory, snapshot_dir),
+            load_mapped_wsc(gp_directory, wsc_directory),
+            extra_datasets=[load_mapped_esc(gp_directory, esc_directory)],
+        )
+
+    merged = snapshot.load_or_build(
+        "combined",
+        combined_fingerprint(gp_directory, wsc_directory, esc_directory),
+        build,
+        snapshot_dir,
+    )
+    combined = shared.data.registry.with_solver_ids(merged).select(merged.columns)
+    return combined, shared.data.manipulation.ids_by_total_points(combined)
+
+
+def load_round_statistics(metric="points", gp_directory="data/processed/gp",
+                          wsc_directory="data/raw/wsc/", esc_directory="data/raw/eurosudoku",
+                          snapshot_dir=snapshot.DEFAULT_SNAPSHOT_DIR):
+    """Return the distribution statistics of every round in all three competitions.
+
+    They only change with the merged dataset, so they are snapshotted under the same
+    fingerprint, and pages that only need the statistics do not read the merged dataset.
+    """
+    def build():
+        combined, _ = load_combined(gp_directory, wsc_directory, esc_directory, snapshot_dir)
+        return shared.data.manipulation.round_statistics(combined, metric=metric)
+
+    return snapshot.load_or_build(
+        f"round_statistics_{metric}",
+        combined_fingerprint(gp_directory, wsc_directory, esc_directory),
+        build,
+        snapshot_dir,
+    )
+
+
+def load_competition_round_statistics(competition, metric="points",
+                                      gp_directory="data/processed/gp",
+                                      wsc_directory="data/raw/wsc/",
+                                      esc_directory="data/raw/eurosudoku",
+                                      snapshot_dir=snapshot.DEFAULT_SNAPSHOT_DIR):
+    """Return the distribution statistics of every round in one competition.
+
+    They are built from that competition's own loader rather than the merged dataset, so a page
+    about a single competition never runs the cross-competition merge. The GP statistics are
+    keyed by the GP inputs alone, and the WSC and ESC ones by `combined_fingerprint`, which
+    covers their CSVs and loaders.
+    """
+    if competition == "GP":
+        inputs = gp_fingerprint(gp_directory)
+    elif competition in ("WSC", "ESC"):
+        inputs = combined_fingerprint(gp_directory, wsc_directory, esc_directory)
+    else:
+        raise ValueError(f"Observed unexpected competition \"{competition}\"")
+
+    def build():
+        if competition == "GP":
+            results = load_gp_snapshot(gp_directory, snapshot_dir)
+        elif competition == "WSC":
+            results = wsc.load_wsc(wsc_directory)
+        else:
+            results = eurosudoku.load_eurosudoku(esc_directory)
+        return shared.data.manipulation.round_statistics(
+            results, metric=metric, competitions=(competition,))
+
+    return snapshot.load_or_build(
+        f"round_statistics_{competition}_{metric}",
+        snapshot.compute_fingerprint(
+            inputs, snapshot.fingerprint_files([shared.data.manipulation.__file__])),
+        build,
+        snapshot_dir,
+    )
@@ -5,6 +5,8 @@ import re
 
 import polars as pl
 
+from . import schemas
+
 COUNTRY_TYPO_MAP = {
     "Hungargy": "Hungary",
     "Hungaria": "Hungary",
@@ -35,10 +37,10 @@ def load_eurosudoku(csv_directory="data/raw/eurosudoku"):
 
 def _load_single_year(path, year):
     """Load a single ESC CSV and return a normalised DataFrame for that year."""
-    raw = pl.read_csv(path, infer_schema_length=200)
+    header = schemas.csv_header(path)
 
     # Determine round count from R-columns present
-    round_cols = [c for c in raw.columns if re.fullmatch(r"R\d+", c)]
+    round_cols = [c for c in header if re.fullmatch(r"R\d+", c)]
     num_rounds = len(round_cols)
 
     rename = {
@@ -49,25 +51,16 @@ def _load_single_year(path, year):
     for i, col in enumerate(round_cols, start=1):
         rename[col] = f"ESC_t{i} points"
 
-    df = raw.rename(rename)
-
-    # Rank column arrives as strings (empty = non-European entry); cast to nullable Int64
-    if df["ESC_rank"].dtype == pl.Utf8 or df["ESC_rank"].dtype == pl.String:
-        df = df.with_columns(
-            pl.col("ESC_rank").replace("", None).cast(pl.Int64)
-        )
-    else:
-        df = df.with_columns(pl.col("ESC_rank").cast(pl.Int64))
-
-    df = df.with_columns([
-        pl.col("ESC_unofficial_rank").cast(pl.Int64),
-        pl.col("ESC_total").cast(pl.Float64),
-        pl.lit(year).alias("year").cast(pl.Int64),
-    ])
-
-    for i in range(1, num_rounds + 1):
-        col = f"ESC_t{i} points"
-        df = df.with_columns(pl.col(col).cast(pl.Float64))
+    # Rank is empty for non-European entries, which the typed read turns into nulls.
+    raw = pl.read_csv(
+        path,
+        infer_schema_length=200,
+        schema_overrides=schemas.schema_overrides(schemas.ESC_SCHEMA, header, rename=rename),
+    )
+
+    df = raw.rename(rename).with_columns(
+        pl.lit(year, dtype=pl.Int64).alias("year")
+    )
 
     # Normalise country typos
     df = df.with_columns(
@@ -1,9 +1,20 @@
 """Provides a function to load GP data from CSV files."""
 
 import os
+import re
+
 import polars as pl
 
 import shared.competitions
+import shared.data.name_index
+import shared.data.registry
+
+from . import schemas, snapshot
+
+# Result pages repeat their header row inside the table. Its values are labels rather than
+# numbers, but every copy starts with the "#" column's own label, so these lines are skipped by
+# the CSV reader as comments and the columns are typed while parsing.
+GP_HEADER_ROW_PREFIX = "#,"
 
 def manual_adjustements(df):
     """Update names, nicks, and countries in GP files.
@@ -138,189 +149,222 @@ def manual_adjustements(df):
         "CJ Tan": "Philippines",
     }
 
-    expr_nick = None
-    for key, value in name_to_nick.items():
-        if expr_nick is None:
-            expr_nick = pl.when(pl.col("Name") == key).then(pl.lit(value))
-        else:
-            expr_nick = expr_nick.when(pl.col("Name") == key).then(pl.lit(value))
-    expr_nick = expr_nick.otherwise(pl.col("Nick")).alias("Nick")
-
-    expr_country = None
-    for key, value in name_to_country.items():
-        if expr_country is None:
-            expr_country = pl.when(pl.col("Name") == key).then(pl.lit(value))
-        else:
-            expr_country = expr_country.when(pl.col("Name") == key).then(pl.lit(value))
-    expr_country = expr_country.otherwise(pl.col("Country")).alias("Country")
-
     df = df.with_columns(
         pl.col("Name").replace(name_to_name).alias("Name"),
         pl.col("Nick").replace(nick_to_nick).alias("Nick")
     )
-    df = df.with_columns(expr_nick, expr_country)
+
+    # Each table is applied as a single hash lookup on the (already corrected) name, falling
+    # back to the existing value, so the cost does not grow with the number of overrides.
+    df = df.with_columns(
+        pl.col("Name")
+            .replace_strict(name_to_nick, default=pl.col("Nick"), return_dtype=pl.String)
+            .alias("Nick"),
+        pl.col("Name")
+            .replace_strict(name_to_country, default=pl.col("Country"), return_dtype=pl.String)
+            .alias("Country")
+    )
 
     return df
 
 def apply_types(gp):
-    """Change the types for many columns."""
-    column_types = {
-        # Integer columns
-        'GP_t1 position': pl.Float64,
-        'GP_t2 position': pl.Float64,
-        'GP_t3 position': pl.Float64,
-        'GP_t4 position': pl.Float64,
-        'GP_t5 position': pl.Float64,
-        'GP_t6 position': pl.Float64,
-        'GP_t7 position': pl.Float64,
-        'GP_t8 position': pl.Float64,
-        'Played GPs': pl.Int32,
-        'Total GPs': pl.Int32,
-        'Rank_before_playoffs': pl.Int32,
-        'Playoff_rank': pl.Float64,
-        'Rank': pl.Int32,
-
-        # Float columns
-        'GP_t1 points': pl.Float64,
-        'GP_t1 rank. points': pl.Float64,
-        'GP_t2 points': pl.Float64,
-        'GP_t2 rank. points': pl.Float64,
-        'GP_t3 points': pl.Float64,
-        'GP_t3 rank. points': pl.Float64,
-        'GP_t4 points': pl.Float64,
-        'GP_t4 rank. points': pl.Float64,
-        'GP_t5 points': pl.Float64,
-        'GP_t5 rank. points': pl.Float64,
-        'GP_t6 points': pl.Float64,
-        'GP_t6 rank. points': pl.Float64,
-        'GP_t7 points': pl.Float64,
-        'GP_t7 rank. points': pl.Float64,
-        'GP_t8 points': pl.Float64,
-        'GP_t8 rank. points': pl.Float64,
-        'Points': pl.Float64,
-
-        # Other types (default as-is or left unspecified)
-        '#': pl.String,  # Identifier, keep as object
-        'Name': pl.String,
-        'Country': pl.String,
-        'Nick': pl.String,
-        'year': pl.Int32,  # If `year` is numeric
-        'source_file': pl.String
-    }
-
-    for key, value in column_types.items():
-        gp = gp.with_columns(
-            pl.col(key).cast(value).alias(key)
-        )
+    """Set the types of the columns derived after reading.
 
-    return gp
+    Columns read from the CSVs are already typed by `schemas.GP_SCHEMA`.
+    """
+    return gp.with_columns(
+        pl.col("Rank_before_playoffs").cast(pl.Int32),
+        pl.col("Playoff_rank").cast(pl.Float64),
+        pl.col("Rank").cast(pl.Int32),
+    )
 
 def remove_false_headers(df):
-    """Filter out header rows, which may be interlaced throughout a file."""
-    condition = ~((df["Name"] == "Name") &
-                (df["Country"] == "Country") &
-                (df["Nick"] == "Nick"))
+    """Filter out header rows, which may be interlaced throughout a file.
+
+    Works on both DataFrames and LazyFrames.
+    """
+    condition = ~((pl.col("Name") == "Name") &
+                (pl.col("Country") == "Country") &
+                (pl.col("Nick") == "Nick"))
 
     return df.filter(condition)
 
 def merge_dfs_by_year(all_dataframes):
     """Construct an array of per-year dataframes.
 
-    Inputs may have multiple rounds per year, typically in the case of in-progress years.
+    Inputs may have multiple rounds per year, typically in the case of in-progress years. The
+    frames may be DataFrames or LazyFrames; the output matches the input.
     """
     # One dataframe per year, ordered by year.
     dataframes = []
 
-    # "year" isn't needed for joining, but it should be unique here and we need it in
-    # the resulting dataframe.
-    join_cols = ["Name", "Country", "Nick", "year"]
     for mapping in all_dataframes.values():
         if len(mapping) == 1:
             value = next(iter(mapping.values()))
             dataframes.append(value)
         else:
-            # Sort by year
+            # Sort by round
             dfs = [value for _, value in sorted(mapping.items())]
-            merged_df = dfs[0]
-            merged_df = remove_false_headers(merged_df)
-            for df in dfs[1:]:
-                df = remove_false_headers(df)
-                relevant_columns = [
-                    col for col in df.columns if col not in merged_df.columns or col in join_cols]
-                merged_df = merged_df.join(
-                    df.select(relevant_columns), on=join_cols, how="outer", join_nulls=True)
-                # The merge creates columns with the suffix "_right".
-                merged_df = merged_df.with_columns(
-                    [pl.coalesce([col, f"{col}_right"]).alias(col) for col in join_cols]
-                ).drop([f"{col}_right" for col in join_cols])
-
-            merged_df = merged_df.drop(["source_file", "round"])
-
-            # Need to calculate point totals. Here using the "rank. " columns to not overcount.
-            points_cols = [col for col in merged_df.columns if "rank. points" in col]
-
-            point_inputs = [pl.col(col).cast(pl.Float64).fill_null(0) for col in points_cols]
-            merged_df = merged_df.with_columns(
-                # Casting back to string because the single-year dataframes will have strings.
-                pl.sum_horizontal(point_inputs).cast(pl.String).alias("Points")
-            )
-
-            dataframes.append(merged_df)
+            dataframes.append(merge_rounds(dfs))
 
     return dataframes
 
-def collect_dataframes(csv_directory, verbose=False):
-    """From a directory with CSVs, gather all the input dataframes.
+def merge_rounds(dfs):
+    """Outer-join round-level frames of one year and recompute their point totals.
 
-    The directory may have single aggregate CSVs per year, but may also have disaggregated
-    round-by-round CSVs.
+    Names, nicks, and countries are adjusted in each round before joining, so that a solver
+    whose details are spelled differently in different rounds ends up with a single row. The
+    adjustments are idempotent, so frames that were already adjusted can be joined as well.
     """
-    # Dict of columns to their types
-    all_columns = {}
+    # "year" isn't needed for joining, but it should be unique here and we need it in
+    # the resulting dataframe.
+    join_cols = ["Name", "Country", "Nick", "year"]
 
-    all_dataframes = {}
+    merged_df = manual_adjustements(remove_false_headers(dfs[0]))
+    for df in dfs[1:]:
+        df = manual_adjustements(remove_false_headers(df))
+        merged_columns = merged_df.collect_schema().names()
+        relevant_columns = [
+            col for col in df.collect_schema().names()
+            if col not in merged_columns or col in join_cols]
+        merged_df = merged_df.join(
+            df.select(relevant_columns), on=join_cols, how="full", join_nulls=True)
+        # The merge creates columns with the suffix "_right".
+        merged_df = merged_df.with_columns(
+            [pl.coalesce([col, f"{col}_right"]).alias(col) for col in join_cols]
+        ).drop([f"{col}_right" for col in join_cols])
+
+    merged_df = merged_df.drop(["source_file", "round"], strict=False)
+
+    # Need to calculate point totals. Here using the "rank. " columns to not overcount.
+    points_cols = [col for col in merged_df.collect_schema().names() if "rank. points" in col]
+
+    point_inputs = [pl.col(col).fill_null(0) for col in points_cols]
+    return merged_df.with_columns(
+        pl.sum_horizontal(point_inputs).alias("Points")
+    )
+
+def gp_file_year(filename):
+    """Return the year in a GP filename such as "gp_results2026_r1.csv", or None."""
+    match = re.search(r"(\d{4})(?:_r\d+)?\.csv$", filename)
+    return int(match.group(1)) if match else None
+
+def gp_years(csv_directory="data/processed/gp"):
+    """Return the sorted years that have GP files, judging by their filenames."""
+    years = {gp_file_year(filename) for filename in os.listdir(csv_directory)
+             if filename.endswith(".csv")}
+    return sorted(year for year in years if year is not None)
+
+def _scan_gp_csvs(csv_directory, verbose=False, years=None):
+    """Plan a lazy scan for every CSV in `csv_directory`, keyed by filename.
 
-    for filename in os.listdir(csv_directory):
+    When `years` is given, files whose names carry another year are never opened. Files without
+    a year in their name are always scanned.
+    """
+    scans = {}
+    for filename in sorted(os.listdir(csv_directory)):
         if not filename.endswith(".csv"):
             continue
 
+        file_year = gp_file_year(filename)
+        if years is not None and file_year is not None and file_year not in years:
+            continue
+
         if verbose:
-            print(f"Parsing file {filename}")
-        file_path = os.path.join(csv_directory, filename)
+            print(f"Scanning file {filename}")
+        scans[filename] = _scan_gp_file(os.path.join(csv_directory, filename))
 
-        df = pl.read_csv(file_path)
-        df = df.with_columns(
-            pl.lit(filename).alias("source_file")
-        )
+    return scans
 
-        if "year" not in df.columns:
-            raise ValueError(f"We rely on a year column, which is missing in file \"{filename}\"")
+def _scan_gp_file(file_path):
+    """Plan a lazy, typed scan of a single GP CSV.
+
+    When the first column is "#", the header and its repeated copies all start with
+    `GP_HEADER_ROW_PREFIX`. They are then skipped as comments and the column names are taken
+    from `csv_header`, so no column is read as text and cast afterwards.
+    """
+    filename = os.path.basename(file_path)
+    header = schemas.csv_header(file_path)
+    options = {}
+    if header and header[0] == "#":
+        options = {"has_header": False, "new_columns": header,
+                   "comment_prefix": GP_HEADER_ROW_PREFIX}
+    scan = pl.scan_csv(
+        file_path,
+        schema_overrides=schemas.schema_overrides(schemas.GP_SCHEMA, header),
+        **options,
+    ).with_columns(
+        pl.lit(filename).alias("source_file")
+    )
 
-        unique_year = df["year"].n_unique() == 1
-        if not unique_year:
+    if "year" not in scan.collect_schema().names():
+        raise ValueError(f"We rely on a year column, which is missing in file \"{filename}\"")
+
+    return scan
+
+def _file_markers(scans):
+    """Validate the year and round of every scanned file, returning their markers.
+
+    The checks only project the `year` and `round` columns and are collected as one batch, so
+    the files are read concurrently and nothing else is materialized.
+    """
+    checks = []
+    for scan in scans.values():
+        exprs = [
+            pl.col("year").n_unique().alias("year_count"),
+            pl.col("year").first().alias("year"),
+        ]
+        if "round" in scan.collect_schema().names():
+            exprs.extend([
+                pl.col("round").n_unique().alias("round_count"),
+                pl.col("round").first().alias("round"),
+            ])
+        checks.append(scan.select(exprs))
+
+    markers = {}
+    for filename, check in zip(scans, pl.collect_all(checks)):
+        row = check.row(0, named=True)
+        if row["year_count"] != 1:
             raise ValueError(f"Each source should have a single year. \"{filename}\" did not")
 
-        year = df["year"].first()
+        file_year = gp_file_year(filename)
+        if file_year is not None and file_year != row["year"]:
+            raise ValueError(
+                f"File \"{filename}\" is named for {file_year} but contains {row['year']}")
 
-        # Inconsequential placeholder value for years that only have one file and no "round" column.
+        # Inconsequential placeholder value for years that only have one file and no "round"
+        # column.
         round_marker = "[All]"
 
-        if "round" in df.columns:
-            unique_round = df["round"].n_unique() == 1
-            if not unique_round:
+        if "round" in row:
+            if row["round_count"] != 1:
                 raise ValueError(
                     f"With `round` column present, it should be unique. \"{filename}\" fails")
-            round_marker = df["round"].first()
+            round_marker = row["round"]
+
+        markers[filename] = (row["year"], round_marker)
+
+    return markers
+
+def _group_by_year(frames, markers):
+    """Arrange frames into {year: {round: frame}} and gather the column types of all of them."""
+    # Dict of columns to their types
+    all_columns = {}
+
+    all_dataframes = {}
+
+    for filename, df in frames.items():
+        year, round_marker = markers[filename]
 
         if year not in all_dataframes:
             all_dataframes[year] = {round_marker: df}
         else:
             if round_marker in all_dataframes[year]:
-                raise ValueError(f"Found duplicate round \"{round}\" from \"{filename}\"")
+                raise ValueError(f"Found duplicate round \"{round_marker}\" from \"{filename}\"")
             all_dataframes[year][round_marker] = df
 
         # Column types will be necessary for appending these dataframes together consistently.
-        for column, data_type in df.schema.items():
+        for column, data_type in df.collect_schema().items():
             if column not in all_columns:
                 all_columns[column] = data_type
             else:
@@ -330,41 +374,60 @@ def collect_dataframes(csv_directory, verbose=False):
 
     return all_dataframes, all_columns
 
-def load_gp(csv_directory="data/processed/gp", verbose=False, output_csv=None):
-    """Import GP CSV files and return a single dataset.
-    
-    This creates a dataset covering all years with one row per solver-year combination,
-    under the assumption of one file per year. This also creates an identifier out of
-    the Name, Country, and Nick fields.
+def collect_dataframes(csv_directory, verbose=False):
+    """From a directory with CSVs, gather all the input dataframes.
+
+    The directory may have single aggregate CSVs per year, but may also have disaggregated
+    round-by-round CSVs. Files are scanned lazily, validated, and then read as a single batch
+    that polars executes in parallel.
     """
-    # Dict of columns to their types
-    all_columns = {}
+    scans = _scan_gp_csvs(csv_directory, verbose)
+    markers = _file_markers(scans)
+    frames = dict(zip(scans, pl.collect_all(list(scans.values()))))
+
+    return _group_by_year(frames, markers)
 
-    all_dataframes, all_columns = collect_dataframes(csv_directory, verbose)
+def scan_gp(csv_directory="data/processed/gp", years=None, verbose=False):
+    """Return the `load_gp` dataset as a LazyFrame.
+
+    Every step after reading is lazy, so projections are pushed down to the CSV scans. Filters on
+    `year` cannot be pushed past the per-year ranking windows, so pass `years` instead to skip the
+    files of other years altogether (by filename) and only read what a single-year view needs.
+    """
+    scans = _scan_gp_csvs(csv_directory, verbose, years)
+    if not scans:
+        raise FileNotFoundError(f"No GP files for years {years} found in {csv_directory}")
+    markers = _file_markers(scans)
+    all_dataframes, all_columns = _group_by_year(scans, markers)
+
+    # Every column in the registry is kept, so that a subset of years has the same columns as
+    # the full dataset.
+    all_columns = {**schemas.GP_SCHEMA, **all_columns}
 
     # An in-progress year may be represented by round-specific data files
     dataframes = merge_dfs_by_year(all_dataframes)
 
+    return _finalize_gp(_align_and_concat(dataframes, all_columns))
+
+def _align_and_concat(dataframes, all_columns):
+    """Add any missing columns (as typed nulls) to each frame and concatenate them."""
     aligned_dfs = []
     for df in dataframes:
-        for column, data_type in all_columns.items():
-            if column not in df.columns:
-                # Casting is necessary because concat will fail if the types differ, even
-                # for null values.
-                df = df.with_columns([pl.lit(None).cast(data_type).alias(column)])
+        present = df.collect_schema().names()
+        # Casting is necessary because concat will fail if the types differ, even
+        # for null values.
+        df = df.with_columns([pl.lit(None).cast(data_type).alias(column)
+                              for column, data_type in all_columns.items()
+                              if column not in present])
         aligned_dfs.append(df.select(sorted(all_columns)))
-    combined_df = pl.concat(aligned_dfs, how="vertical")
+    return pl.concat(aligned_dfs, how="vertical")
 
+def _finalize_gp(combined_df):
+    """Apply overrides, identifiers, and ranks to the concatenated yearly frames."""
     combined_df = manual_adjustements(combined_df)
 
-    # Save the combined DataFrame to a new CSV (optional)
-    if output_csv:
-        combined_df.to_csv(output_csv)
-
     # Filter out the extra heading rows
-    combined_df = combined_df.filter(~((combined_df["Name"] == "Name") &
-                                 (combined_df["Country"] == "Country") &
-                                 (combined_df["Nick"] == "Nick")))
+    combined_df = remove_false_headers(combined_df)
 
     # In the absence of true identifiers, using the intersection of these
     # three fields to identify users. This, unfortunately, drops five rows
@@ -379,18 +442,14 @@ def load_gp(csv_directory="data/processed/gp", verbose=False, output_csv=None):
     # historical scores for prior years do not update. For now I will use all three fields.
     combined_df = combined_df.with_columns(
         (
-            combined_df["Name"].fill_null("Nameless") +
-            " (" + 
-            combined_df["Nick"].fill_null("Nickless") +
-            ") - " + 
-            combined_df["Country"].fill_null("Nationless")
+            pl.col("Name").fill_null("Nameless") +
+            " (" +
+            pl.col("Nick").fill_null("Nickless") +
+            ") - " +
+            pl.col("Country").fill_null("Nationless")
         ).alias("user_pseudo_id")
     )
 
-    combined_df = combined_df.with_columns(
-        pl.col("Points").cast(pl.Float64).alias("Points")
-    )
-
     combined_df = combined_df.with_columns(
             pl.col("Points")
             .rank(descending=True)
@@ -398,12 +457,13 @@ def load_gp(csv_directory="data/processed/gp", verbose=False, output_csv=None):
             .alias("Rank_before_playoffs")
     )
 
-    flat_playoff_results = pl.DataFrame(
+    flat_playoff_results = pl.LazyFrame(
         [
             {"year": year, "Playoff_rank": rank, "user_pseudo_id": solver}
             for year, results in shared.competitions.GP_PLAYOFF_RESULTS.items()
             for rank, solver in results.items()
-        ]
+        ],
+        schema={"year": pl.Int32, "Playoff_rank": pl.Float64, "user_pseudo_id": pl.String}
     )
 
     with_playoff_rank = combined_df.join(
@@ -420,10 +480,135 @@ def load_gp(csv_directory="data/processed/gp", verbose=False, output_csv=None):
 
     ordered_cols = ["Name", "Country", "Nick"]
 
-    all_columns = with_playoff_rank.columns
+    all_columns = with_playoff_rank.collect_schema().names()
     for item in ordered_cols:
         all_columns.remove(item)
     ordered_cols.extend(all_columns)
-    with_playoff_rank = with_playoff_rank.select(ordered_cols)
 
-    return with_playoff_rank
+    return with_playoff_rank.select(ordered_cols)
+
+def load_gp(csv_directory="data/processed/gp", verbose=False, output_csv=None):
+    """Import GP CSV files and return a single dataset.
+    
+    This creates a dataset covering all years with one row per solver-year combination,
+    under the assumption of one file per year. This also creates an identifier out of
+    the Name, Country, and Nick fields, along with its integer `solver_id` from the registry.
+    """
+    combined_df = shared.data.registry.with_solver_ids(
+        scan_gp(csv_directory, verbose=verbose).collect())
+
+    # Save the combined DataFrame to a new CSV (optional)
+    if output_csv:
+        combined_df.write_csv(output_csv)
+
+    return combined_df
+
+def add_gp_round(combined_df, round_file):
+    """Fold a single round file into `combined_df`, the output of `load_gp`.
+
+    Only the new round's file is read. Its rows are outer-joined onto the stored rows of its
+    year, which already hold every earlier round, and the year's points and ranks are derived
+    again from those rows. Other years are passed through untouched, so the cost depends on the
+    size of one round file and one year's rows rather than on the whole history. Rounds are
+    joined after their names are adjusted, as in `load_gp`, so the result matches `load_gp` run
+    with the round file added, up to the order of tied ranks.
+    """
+    filename = os.path.basename(round_file)
+    scan = _scan_gp_file(round_file)
+    year, round_marker = _file_markers({filename: scan})[filename]
+
+    if round_marker == "[All]":
+        raise ValueError(f"File \"{filename}\" has no `round` column to add")
+
+    year_df = combined_df.filter(pl.col("year") == year)
+    round_columns = [f"GP_t{round_marker} {metric}"
+                     for metric in ("position", "points", "rank. points")]
+    present = [col for col in round_columns if col in year_df.columns]
+    if present and year_df.select(pl.any_horizontal(pl.col(present).is_not_null().any())).item():
+        raise ValueError(f"Found duplicate round \"{round_marker}\" from \"{filename}\"")
+
+    # Round columns that are null throughout only exist from aligning the years; they are dropped
+    # so the year is merged exactly as its files would be.
+    derived_columns = ["user_pseudo_id", "solver_id",
+                       "Rank_before_playoffs", "Playoff_rank", "Rank"]
+    empty_rounds = [col for col in year_df.columns
+                    if col.startswith("GP_t") and year_df[col].null_count() == len(year_df)]
+    previous = year_df.lazy().drop(derived_columns + sorted(set(present) | set(empty_rounds)),
+                                   strict=False)
+
+    all_columns = {**schemas.GP_SCHEMA,
+                   **previous.collect_schema(),
+                   **scan.collect_schema()}
+    merged = merge_rounds([previous, scan])
+    updated = _finalize_gp(_align_and_concat([merged], all_columns)).collect()
+
+    # Years are stored in descending order, so the updated year slots in between the others.
+    combined_df = combined_df.drop("solver_id", strict=False)
+    return shared.data.registry.with_solver_ids(pl.concat([
+        combined_df.filter(pl.col("year") > year),
+        updated,
+        combined_df.filter(pl.col("year") < year),
+    ], how="diagonal").select(updated.columns))
+
+def ingest_gp_round(round_file, csv_directory="data/processed/gp",
+                    snapshot_dir=snapshot.DEFAULT_SNAPSHOT_DIR, verbose=False):
+    """Update the GP snapshot for a round file newly added to `csv_directory`.
+
+    The snapshot from before the file was added is updated with `add_gp_round` and stored under
+    the new fingerprint, so the next `load_gp_snapshot` reads it directly. Without a previous
+    snapshot this falls back to the full ingest.
+    """
+    filename = os.path.basename(round_file)
+    if not os.path.exists(os.path.join(csv_directory, filename)):
+        raise FileNotFoundError(f"Round file \"{filename}\" is not in {csv_directory}")
+
+    previous = snapshot.read_snapshot(
+        "gp", gp_fingerprint(csv_directory, exclude=[filename]), snapshot_dir)
+    if previous is None:
+        if verbose:
+            print(f"No snapshot without \"{filename}\", rebuilding from all files")
+        return load_gp_snapshot(csv_directory, snapshot_dir, verbose)
+
+    updated = add_gp_round(previous, os.path.join(csv_directory, filename))
+    snapshot.write_snapshot("gp", gp_fingerprint(csv_directory), updated, snapshot_dir)
+    return updated
+
+def gp_fingerprint(csv_directory="data/processed/gp", exclude=()):
+    """Digest everything that determines the output of `load_gp`.
+
+    That is the GP CSVs, the playoff overrides in `shared.competitions`, this module itself
+    since it holds the name, nick, and country adjustments, and the column types in `schemas`.
+    Files named in `exclude` are left out.
+    """
+    return snapshot.compute_fingerprint(
+        snapshot.fingerprint_directory(csv_directory, exclude=exclude),
+        shared.competitions.GP_PLAYOFF_RESULTS,
+        snapshot.fingerprint_files([__file__, schemas.__file__]),
+    )
+
+def load_gp_snapshot(csv_directory="data/processed/gp", snapshot_dir=snapshot.DEFAULT_SNAPSHOT_DIR,
+                     verbose=False):
+    """Return the `load_gp` output, reading a Parquet snapshot when the inputs are unchanged.
+
+    The `solver_id` column is attached after reading, so it always follows the current registry.
+    """
+    return shared.data.registry.with_solver_ids(snapshot.load_or_build(
+        "gp",
+        gp_fingerprint(csv_directory),
+        lambda: load_gp(csv_directory, verbose),
+        snapshot_dir,
+    ))
+
+def load_gp_name_index(csv_directory="data/processed/gp",
+                       snapshot_dir=snapshot.DEFAULT_SNAPSHOT_DIR):
+    """Return the GP name index used to map WSC and ESC names, snapshotted per data version."""
+    return snapshot.load_or_build(
+        "gp_name_index",
+        snapshot.compute_fingerprint(
+            gp_fingerprint(csv_directory),
+            snapshot.fingerprint_files([shared.data.name_index.__file__]),
+        ),
+        lambda: shared.data.name_index.build_name_index(
+            load_gp_snapshot(csv_directory, snapshot_dir)),
+        snapshot_dir,
+    )
@@ -4,11 +4,17 @@ This module provides functions to load pre-computed rating data files
 for use in the sudokudos Streamlit app.
 
 Expected files in the ratings data directory:
-- ratings_timeseries.parquet: Rating history per solver per round
+- ratings_timeseries.parquet: Rating history per solver per round, sorted by solver and
+  round in small row groups (see `write_ratings_timeseries`)
 - leaderboard_current.parquet: Current active leaderboard
 - leaderboard_alltime.parquet: All-time peak ratings
 - records.parquet: Career records (wins, #1 counts, etc.)
+- leaderboard_history.parquet: Top solvers after every round (see `build_leaderboard_history`)
 - metadata.json: Export metadata
+
+The load and query functions attach the integer `solver_id` from `shared.data.registry` to every
+frame keyed by user_pseudo_id. The leaderboards and records also get the Name, Nick, and Country that
+user_pseudo_id is built from (see `with_name_parts`).
 """
 
 import json
@@ -17,9 +23,52 @@ from typing import Optional
 
 import polars as pl
 
+import shared.data.registry
+
 
 DEFAULT_RATINGS_DIR = "data/ratings"
 
+# The timeseries is stored sorted by these columns in small row groups, so the row group
+# statistics let a query for one solver skip nearly the whole file.
+TIMESERIES_SORT_COLUMNS = ["user_pseudo_id", "comp_idx"]
+TIMESERIES_ROW_GROUP_SIZE = 1024
+
+# Number of solvers kept in the leaderboard stored for every comp_idx.
+LEADERBOARD_HISTORY_SIZE = 100
+
+
+def _with_solver_ids(df: pl.DataFrame) -> pl.DataFrame:
+    """Attach `solver_id` when the frame is keyed by user_pseudo_id."""
+    if "user_pseudo_id" not in df.columns:
+        return df
+    return shared.data.registry.with_solver_ids(df)
+
+
+def with_name_parts(df: pl.DataFrame) -> pl.DataFrame:
+    """Add Name, Nick, and Country columns by parsing user_pseudo_id.
+
+    Identifiers look like "Name (Nick) - Country". The country follows the last " - ", and the
+    nick sits between the first "(" and the first ")". Missing parts become empty strings.
+    """
+    uid = pl.col("user_pseudo_id")
+    has_country = uid.str.contains(" - ", literal=True)
+    name_part = pl.when(has_country).then(uid.str.extract(r"^(?s)(.*) - ", 1)).otherwise(uid)
+    country = (pl.when(has_country).then(uid.str.extract(r"^(?s).* - (.*)$", 1))
+               .otherwise(pl.lit("")))
+
+    # Both parentheses must be present. The nick is empty if the first ")" precedes the "(".
+    has_nick = (name_part.str.contains("(", literal=True)
+                & name_part.str.contains(")", literal=True))
+    name = name_part.str.extract(r"^(?s)([^(]*)\(", 1)
+    nick = name_part.str.extract(r"^(?s)[^()]*\(([^)]*)\)", 1).fill_null("")
+
+    return df.with_columns(
+        pl.when(has_nick).then(name).otherwise(name_part)
+        .str.strip_chars().alias("Name"),
+        pl.when(has_nick).then(nick).otherwise(pl.lit("")).alias("Nick"),
+        country.alias("Country"),
+    )
+
 
 def load_ratings_timeseries(
     data_dir: str = DEFAULT_RATINGS_DIR,
@@ -34,12 +83,12 @@ def load_ratings_timeseries(
     Returns:
         DataFrame with columns:
         [user_pseudo_id, year, round, competition, comp_idx, rating, n_rounds,
-         rank, rank_total, raw_points, adjusted_points]
+         rank, rank_total, raw_points, adjusted_points, solver_id]
     """
     path = Path(data_dir) / "ratings_timeseries.parquet"
     if columns:
-        return pl.read_parquet(path, columns=columns)
-    return pl.read_parquet(path)
+        return _with_solver_ids(pl.read_parquet(path, columns=columns))
+    return _with_solver_ids(pl.read_parquet(path))
 
 
 def load_current_leaderboard(data_dir: str = DEFAULT_RATINGS_DIR) -> pl.DataFrame:
@@ -51,10 +100,11 @@ def load_current_leaderboard(data_dir: str = DEFAULT_RATINGS_DIR) -> pl.DataFram
     Returns:
         DataFrame with columns:
         [rank, user_pseudo_id, rating, mean_adj_points, n_rounds,
-         last_year, last_place, last_round_size]
+         last_year, last_place, last_round_size, solver_id,
+         Name, Nick, Country]
     """
     path = Path(data_dir) / "leaderboard_current.parquet"
-    return pl.read_parquet(path)
+    return with_name_parts(_with_solver_ids(pl.read_parquet(path)))
 
 
 def load_alltime_leaderboard(data_dir: str = DEFAULT_RATINGS_DIR) -> pl.DataFrame:
@@ -66,10 +116,11 @@ def load_alltime_leaderboard(data_dir: str = DEFAULT_RATINGS_DIR) -> pl.DataFram
     Returns:
         DataFrame with columns:
         [rank, user_pseudo_id, peak_rating, peak_year, peak_round,
-         peak_competition, n_rounds]
+         peak_competition, n_rounds, solver_id,
+         Name, Nick, Country]
     """
     path = Path(data_dir) / "leaderboard_alltime.parquet"
-    return pl.read_parquet(path)
+    return with_name_parts(_with_solver_ids(pl.read_parquet(path)))
 
 
 def load_records(data_dir: str = DEFAULT_RATINGS_DIR) -> pl.DataFrame:
@@ -81,10 +132,11 @@ def load_records(data_dir: str = DEFAULT_RATINGS_DIR) -> pl.DataFrame:
     Returns:
         DataFrame with columns:
         [user_pseudo_id, ones_count, best_streak, wins_count,
-         total_adj_points, total_raw_points, total_rounds]
+         total_adj_points, total_raw_points, total_rounds, solver_id,
+         Name, Nick, Country]
     """
     path = Path(data_dir) / "records.parquet"
-    return pl.read_parquet(path)
+    return with_name_parts(_with_solver_ids(pl.read_parquet(path)))
 
 
 def load_ratings_metadata(data_dir: str = DEFAULT_RATINGS_DIR) -> dict:
@@ -106,23 +158,111 @@ def load_ratings_metadata(data_dir: str = DEFAULT_RATINGS_DIR) -> dict:
         return json.load(f)
 
 
+def write_ratings_timeseries(df: pl.DataFrame, data_dir: str = DEFAULT_RATINGS_DIR) -> None:
+    """Write the ratings timeseries in the layout the query helpers rely on.
+
+    The leaderboard history derived from it is written alongside, so the two stay consistent.
+
+    Args:
+        df: Timeseries in the format returned by `load_ratings_timeseries`
+        data_dir: Directory containing ratings files
+    """
+    # Identifiers from the registry are attached on load rather than exported.
+    df = df.drop("solver_id", strict=False)
+
+    path = Path(data_dir) / "ratings_timeseries.parquet"
+    df.sort(TIMESERIES_SORT_COLUMNS).write_parquet(
+        path, row_group_size=TIMESERIES_ROW_GROUP_SIZE, statistics=True)
+
+    history_path = Path(data_dir) / "leaderboard_history.parquet"
+    build_leaderboard_history(df).write_parquet(
+        history_path, row_group_size=TIMESERIES_ROW_GROUP_SIZE, statistics=True)
+
+
+def build_leaderboard_history(
+    timeseries: pl.DataFrame,
+    top_k: int = LEADERBOARD_HISTORY_SIZE,
+) -> pl.DataFrame:
+    """Compute the leaderboard after every comp_idx in a single pass.
+
+    Each timeseries row stays a solver's latest rating until their next row, so it is joined to
+    every comp_idx in that span. The top `top_k` per comp_idx are then kept. Ties in rating are
+    broken by user_pseudo_id.
+
+    Args:
+        timeseries: Timeseries in the format returned by `load_ratings_timeseries`
+        top_k: Number of solvers to keep per comp_idx
+
+    Returns:
+        DataFrame with columns [as_of, rank, <timeseries columns>], sorted by as_of and rank
+    """
+    comp_idxs = timeseries.select(pl.col("comp_idx").unique().alias("as_of"))
+    after_last = timeseries["comp_idx"].max() + 1
+
+    spans = (
+        timeseries
+        .sort(["user_pseudo_id", "comp_idx"])
+        .with_columns(
+            pl.col("comp_idx").shift(-1).over("user_pseudo_id")
+            .fill_null(after_last)
+            .alias("_superseded_at")
+        )
+    )
+
+    return (
+        spans
+        .join_where(
+            comp_idxs,
+            pl.col("comp_idx") <= pl.col("as_of"),
+            pl.col("_superseded_at") > pl.col("as_of"),
+        )
+        .drop("_superseded_at")
+        .sort(["as_of", "rating", "user_pseudo_id"], descending=[False, True, False])
+        .with_columns(
+            pl.int_range(1, pl.len() + 1, dtype=pl.UInt32).over("as_of").alias("rank_")
+        )
+        .filter(pl.col("rank_") <= top_k)
+        .drop("rank")
+        .rename({"rank_": "rank"})
+        .select(["as_of", "rank"] + [col for col in timeseries.columns if col != "rank"])
+    )
+
+
+def scan_ratings_timeseries(data_dir: str = DEFAULT_RATINGS_DIR) -> pl.LazyFrame:
+    """Plan a read of the ratings timeseries.
+
+    Filters and column selections are pushed down to the Parquet reader, which skips the row
+    groups whose statistics rule them out.
+
+    Args:
+        data_dir: Directory containing ratings files
+
+    Returns:
+        LazyFrame with the columns of `load_ratings_timeseries`
+    """
+    return pl.scan_parquet(Path(data_dir) / "ratings_timeseries.parquet")
+
+
 def get_solver_timeseries(
     solver_id: str,
     data_dir: str = DEFAULT_RATINGS_DIR,
 ) -> pl.DataFrame:
     """Get rating history for a specific solver.
 
+    Only the row groups holding the solver are read.
+
     Args:
         solver_id: The solver's user_pseudo_id
         data_dir: Directory containing ratings files
 
     Returns:
-        DataFrame filtered to specified solver, sorted by comp_idx
+        DataFrame filtered to specified solver, sorted by comp_idx, with its `solver_id`
     """
-    df = load_ratings_timeseries(data_dir)
-    return (
-        df.filter(pl.col("user_pseudo_id") == solver_id)
+    return _with_solver_ids(
+        scan_ratings_timeseries(data_dir)
+        .filter(pl.col("user_pseudo_id") == solver_id)
         .sort("comp_idx")
+        .collect()
     )
 
 
@@ -133,28 +273,45 @@ def get_leaderboard_at_round(
 ) -> pl.DataFrame:
     """Get leaderboard at a specific point in time.
 
+    Reads the top `top_n` rows stored for `comp_idx` in the leaderboard history. When the history
+    is missing, does not cover `top_n` solvers, or has no entry for `comp_idx`, the leaderboard
+    is computed from the timeseries instead.
+
     Args:
         comp_idx: Competition index to get leaderboard after
         data_dir: Directory containing ratings files
         top_n: Number of top solvers to return
 
     Returns:
-        DataFrame with top N solvers at that point in time
+        DataFrame with top N solvers at that point in time, with their `solver_id`
     """
-    df = load_ratings_timeseries(data_dir)
+    history_path = Path(data_dir) / "leaderboard_history.parquet"
+    if top_n <= LEADERBOARD_HISTORY_SIZE and history_path.exists():
+        stored = (
+            pl.scan_parquet(history_path)
+            .filter((pl.col("as_of") == comp_idx) & (pl.col("rank") <= top_n))
+            .drop("as_of")
+            .collect()
+        )
+        if not stored.is_empty():
+            return _with_solver_ids(stored)
 
     # Get latest record per solver up to comp_idx
     latest = (
-        df.filter(pl.col("comp_idx") <= comp_idx)
+        scan_ratings_timeseries(data_dir)
+        .filter(pl.col("comp_idx") <= comp_idx)
         .sort(["user_pseudo_id", "comp_idx"], descending=[False, True])
         .group_by("user_pseudo_id")
         .first()
     )
 
-    # Sort by rating and return top N
-    return (
+    # Sort by rating and return top N. The per-round placement in "rank" is replaced by the
+    # leaderboard position.
+    return _with_solver_ids(
         latest
-        .sort("rating", descending=True)
+        .sort(["rating", "user_pseudo_id"], descending=[True, False])
         .head(top_n)
-        .with_row_count("rank", offset=1)
+        .drop("rank")
+        .with_row_index("rank", offset=1)
+        .collect()
     )
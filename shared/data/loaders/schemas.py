@@ -0,0 +1,69 @@
+"""Column types for each competition, applied when the source CSVs are parsed.
+
+Each registry is keyed by the normalized column names that the loaders produce. The loaders
+translate them back to the raw CSV headers and pass them as `schema_overrides`, so frames come
+out of the reader with their final types instead of being cast column by column afterwards.
+"""
+
+import polars as pl
+
+import shared.competitions
+
+_ROUNDS = range(1, shared.competitions.MAXIMUM_ROUND + 1)
+
+# The GP has had eight rounds per season since 2015.
+_GP_ROUNDS = range(1, 9)
+
+GP_SCHEMA = {
+    "#": pl.String,
+    "Name": pl.String,
+    "Country": pl.String,
+    "Nick": pl.String,
+    "Points": pl.Float64,
+    "Played GPs": pl.Int32,
+    "Total GPs": pl.Int32,
+    "year": pl.Int32,
+    "round": pl.Int64,
+    **{f"GP_t{n} {metric}": pl.Float64
+       for n in _GP_ROUNDS for metric in ("position", "points", "rank. points")},
+}
+
+WSC_SCHEMA = {
+    "WSC_total": pl.Float64,
+    **{f"WSC_t{n} points": pl.Float64 for n in _ROUNDS},
+}
+
+ESC_SCHEMA = {
+    "ESC_rank": pl.Int64,
+    "ESC_unofficial_rank": pl.Int64,
+    "ESC_total": pl.Float64,
+    **{f"ESC_t{n} points": pl.Float64 for n in _ROUNDS},
+}
+
+
+def schema_overrides(schema, raw_columns, rename=None, exclude=()):
+    """Return `schema_overrides` for a CSV whose headers are `raw_columns`.
+
+    Args:
+        schema: Registry keyed by normalized column names
+        raw_columns: Column headers as they appear in the CSV
+        rename: Optional mapping from raw header to normalized name
+        exclude: Raw headers to leave to type inference (e.g. values needing cleanup)
+
+    Returns:
+        Dict from raw header to type, for the columns the registry covers
+    """
+    rename = rename or {}
+    overrides = {}
+    for raw in raw_columns:
+        if raw in exclude:
+            continue
+        normalized = rename.get(raw, raw)
+        if normalized in schema:
+            overrides[raw] = schema[normalized]
+    return overrides
+
+
+def csv_header(path):
+    """Read only the header of a CSV file."""
+    return pl.read_csv(path, n_rows=0).columns
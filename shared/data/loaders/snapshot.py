@@ -0,0 +1,144 @@
+"""Persist compiled loader outputs as Parquet snapshots keyed by their inputs.
+
+Loaders that parse and reconcile many source files can be slow on a cold start. A snapshot
+stores the final frame under a fingerprint of everything that went into it: the source files
+(name, size, modification time, and content hash) plus any in-code tables that alter the
+output. When the fingerprint matches, the frame is read back from Parquet; otherwise it is
+rebuilt and the stale snapshot is replaced.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import polars as pl
+
+
+DEFAULT_SNAPSHOT_DIR = "data/snapshots"
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_files(paths: Iterable[str]) -> list[tuple[str, int, int, str]]:
+    """Describe each file by name, size, modification time, and content hash.
+
+    Args:
+        paths: Files to describe
+
+    Returns:
+        List of (name, size, mtime_ns, sha256) tuples, sorted by name
+    """
+    entries = []
+    for path in sorted(Path(p) for p in paths):
+        stat = path.stat()
+        entries.append((path.name, stat.st_size, stat.st_mtime_ns, _file_digest(path)))
+    return entries
+
+
+def fingerprint_directory(
+    directory: str,
+    suffix: str = ".csv",
+    exclude: Iterable[str] = (),
+) -> list[tuple[str, int, int, str]]:
+    """Describe every file in `directory` ending with `suffix` (see `fingerprint_files`).
+
+    Files named in `exclude` are left out, e.g. to recover the fingerprint from before a file
+    was added.
+    """
+    exclude = set(exclude)
+    paths = [os.path.join(directory, name) for name in os.listdir(directory)
+             if name.endswith(suffix) and name not in exclude]
+    return fingerprint_files(paths)
+
+
+def compute_fingerprint(*parts) -> str:
+    """Combine JSON-serializable parts into a single hex digest.
+
+    Dictionaries are serialized with sorted keys and non-string keys are stringified, so
+    override tables can be passed directly.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def snapshot_path(name: str, fingerprint: str, snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> Path:
+    """Return where the snapshot for `name` with `fingerprint` is stored."""
+    return Path(snapshot_dir) / f"{name}-{fingerprint[:16]}.parquet"
+
+
+def read_snapshot(
+    name: str,
+    fingerprint: str,
+    snapshot_dir: str = DEFAULT_SNAPSHOT_DIR,
+) -> Optional[pl.DataFrame]:
+    """Return the snapshot for `name` with `fingerprint`, or None if there is no usable one."""
+    path = snapshot_path(name, fingerprint, snapshot_dir)
+    if not path.exists():
+        return None
+    try:
+        return pl.read_parquet(path)
+    except (OSError, pl.exceptions.ComputeError):
+        # A truncated or unreadable snapshot is treated as missing.
+        return None
+
+
+def write_snapshot(
+    name: str,
+    fingerprint: str,
+    df: pl.DataFrame,
+    snapshot_dir: str = DEFAULT_SNAPSHOT_DIR,
+) -> None:
+    """Store `df` as the snapshot for `name` with `fingerprint`, replacing stale snapshots.
+
+    Write failures are ignored: snapshots are an optimization, and a read-only filesystem should
+    not break loading.
+    """
+    path = snapshot_path(name, fingerprint, snapshot_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename, so concurrent readers never see partial output.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        df.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        for stale in path.parent.glob(f"{name}-*.parquet"):
+            if stale != path and stale.stem.rsplit("-", 1)[0] == name:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def load_or_build(
+    name: str,
+    fingerprint: str,
+    builder: Callable[[], pl.DataFrame],
+    snapshot_dir: Optional[str] = DEFAULT_SNAPSHOT_DIR,
+) -> pl.DataFrame:
+    """Return the snapshot for `name` if it matches `fingerprint`, otherwise build and store it.
+
+    Args:
+        name: Snapshot name, used as the file prefix
+        fingerprint: Digest of all inputs (see `compute_fingerprint`)
+        builder: Zero-argument function producing the frame when no snapshot matches
+        snapshot_dir: Directory holding snapshots; None disables snapshotting
+
+    Returns:
+        The snapshotted or freshly built DataFrame
+    """
+    if snapshot_dir is None:
+        return builder()
+
+    df = read_snapshot(name, fingerprint, snapshot_dir)
+    if df is None:
+        df = builder()
+        write_snapshot(name, fingerprint, df, snapshot_dir)
+
+    return df
@@ -0,0 +1,171 @@
+"""Partitioned Parquet store holding the normalized results of every competition.
+
+Each loader's output is written once, split by competition and year:
+
+    {store_dir}/competition={name}/year={year}/results.parquet
+
+Readers then scan only the partitions and columns a view needs, rather than loading every
+competition and every year. The store is built with `build_store` (run from `heroku_setup.sh`).
+Each competition directory also holds the fingerprint of the inputs it was built from (see
+`shared.data.loaders.snapshot`), and `ensure_current` rebuilds a competition whose inputs have
+changed since.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import polars as pl
+
+import shared.data.registry
+
+from .combined import combined_fingerprint
+from .eurosudoku import load_eurosudoku
+from .gp import gp_fingerprint, load_gp_snapshot
+from .wsc import load_wsc
+
+
+DEFAULT_STORE_DIR = "data/store"
+
+COMPETITION_LOADERS: dict[str, Callable[[], pl.DataFrame]] = {
+    "GP": load_gp_snapshot,
+    "WSC": load_wsc,
+    "ESC": load_eurosudoku,
+}
+
+# The WSC and ESC results are stored before their names are mapped to GP identifiers, but the
+# combined fingerprint covers their CSVs, loaders, and schemas, so it is reused for them.
+COMPETITION_FINGERPRINTS: dict[str, Callable[[], str]] = {
+    "GP": gp_fingerprint,
+    "WSC": combined_fingerprint,
+    "ESC": combined_fingerprint,
+}
+
+FINGERPRINT_FILE = "fingerprint.txt"
+
+
+def _competition_dir(competition: str, store_dir: str) -> Path:
+    """Return the partition directory of `competition`, validating its name."""
+    if competition not in COMPETITION_LOADERS:
+        raise ValueError(f"Observed unexpected competition \"{competition}\"")
+    return Path(store_dir) / f"competition={competition}"
+
+
+def write_competition(competition: str, df: pl.DataFrame,
+                      store_dir: str = DEFAULT_STORE_DIR,
+                      fingerprint: Optional[str] = None) -> None:
+    """Replace the partitions of `competition` with the rows of `df`, split by year.
+
+    The partitions are written to a temporary directory that then takes the place of the old
+    one, so years that no longer exist do not linger. Rows keep their order within each year.
+    `fingerprint` is stored alongside them, so the swap replaces both at once.
+    """
+    target = _competition_dir(competition, store_dir)
+    staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+
+    for (year,), year_df in df.partition_by("year", as_dict=True, maintain_order=True).items():
+        partition = staging / f"year={year}"
+        partition.mkdir(parents=True)
+        year_df.write_parquet(partition / "results.parquet")
+
+    if fingerprint is not None:
+        staging.mkdir(parents=True, exist_ok=True)
+        (staging / FINGERPRINT_FILE).write_text(fingerprint)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(staging, target)
+
+
+def build_store(store_dir: str = DEFAULT_STORE_DIR,
+                competitions: Optional[Iterable[str]] = None) -> None:
+    """Run the loaders and write their output into the store.
+
+    Args:
+        store_dir: Root directory of the store
+        competitions: Competitions to (re)build; defaults to all of them
+    """
+    for competition in competitions or COMPETITION_LOADERS:
+        _competition_dir(competition, store_dir)
+        fingerprint = COMPETITION_FINGERPRINTS[competition]()
+        write_competition(competition, COMPETITION_LOADERS[competition](), store_dir, fingerprint)
+
+
+def stored_fingerprint(competition: str, store_dir: str = DEFAULT_STORE_DIR) -> Optional[str]:
+    """Return the fingerprint `competition` was stored with, or None if there is none."""
+    try:
+        return (_competition_dir(competition, store_dir) / FINGERPRINT_FILE).read_text()
+    except OSError:
+        return None
+
+
+def ensure_current(competition: str, store_dir: str = DEFAULT_STORE_DIR) -> None:
+    """Build the partitions of `competition` if they are missing or their inputs have changed."""
+    if stored_fingerprint(competition, store_dir) != COMPETITION_FINGERPRINTS[competition]():
+        build_store(store_dir, competitions=[competition])
+
+
+def store_years(competition: str, store_dir: str = DEFAULT_STORE_DIR) -> list[int]:
+    """Return the sorted years stored for `competition`, without reading any results."""
+    directory = _competition_dir(competition, store_dir)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"No stored results for {competition} in {store_dir}")
+    return sorted(int(path.name.split("=", 1)[1]) for path in directory.glob("year=*"))
+
+
+def scan_results(
+    competition: str,
+    years: Optional[Iterable[int]] = None,
+    columns: Optional[Iterable[str]] = None,
+    store_dir: str = DEFAULT_STORE_DIR,
+) -> pl.LazyFrame:
+    """Plan a read of one competition's results from the store.
+
+    Only the partitions of the requested years are opened, and only the requested columns are
+    read from them. The `year` column is always included.
+
+    Args:
+        competition: Competition name, e.g. "GP", "WSC", or "ESC"
+        years: Years to read; defaults to all stored years
+        columns: Columns to read; defaults to all columns
+        store_dir: Root directory of the store
+
+    Returns:
+        LazyFrame with the selected rows and columns, ordered by year and then as loaded
+    """
+    directory = _competition_dir(competition, store_dir)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"No stored results for {competition} in {store_dir}")
+
+    # Partitions are pruned by the `year` directory names. The year is also stored in the files,
+    # which keeps its original type, and the competition (fixed here) is dropped.
+    lf = pl.scan_parquet(directory / "**" / "*.parquet", hive_partitioning=True)
+    lf = lf.drop("competition")
+
+    if years is not None:
+        lf = lf.filter(pl.col("year").is_in(list(years)))
+
+    if columns is not None:
+        columns = list(columns)
+        if "year" not in columns:
+            columns.append("year")
+        lf = lf.select(columns)
+
+    return lf
+
+
+def read_results(
+    competition: str,
+    years: Optional[Iterable[int]] = None,
+    columns: Optional[Iterable[str]] = None,
+    store_dir: str = DEFAULT_STORE_DIR,
+) -> pl.DataFrame:
+    """Read one competition's results from the store (see `scan_results`).
+
+    A stored `solver_id` column is replaced by the identifiers of the current registry.
+    """
+    df = scan_results(competition, years, columns, store_dir).collect()
+    if "solver_id" in df.columns:
+        df = shared.data.registry.with_solver_ids(df).select(df.columns)
+    return df
@@ -1,12 +1,17 @@
 """Provides a function to load WSC data from CSV files."""
 
+import concurrent.futures
+
 import polars as pl
 
 import shared.competitions
 
-def process_wsc_2025(_df):
-    """Process a CSV in the format used for the 2025 WSC."""
-    df = _df.rename({
+from . import schemas
+
+# Raw CSV headers and the normalized names they are renamed to, by year. Together with
+# `schemas.WSC_SCHEMA` these determine the types the CSVs are parsed with.
+WSC_RENAMES = {
+    2025: {
         "Official Rank": "Official_rank",
         "Rank": "Unofficial_rank",
         "Total": "WSC_total",
@@ -20,17 +25,8 @@ def process_wsc_2025(_df):
         "R10": "WSC_t10 points", # I don't know why they did this. To distinguish playoff rounds?
         "R11": "WSC_t11 points",
         "R12": "WSC_t12 points",
-    })
-
-    df = df.with_columns(
-        pl.col("Official_rank").is_not_null().alias("Official")
-    )
-
-    return df
-
-def process_wsc_2024(_df):
-    """Process a CSV in the format used for the 2024 WSC."""
-    df = _df.rename({
+    },
+    2024: {
         "Official Rank": "Official_rank",
         "All": "Unofficial_rank",
         "Total": "WSC_total",
@@ -43,17 +39,8 @@ def process_wsc_2024(_df):
         "R7": "WSC_t7 points",
         "R10": "WSC_t10 points", # I don't know why they did this. To distinguish playoff rounds?
         "R11": "WSC_t11 points",
-    })
-
-    df = df.with_columns(
-        (pl.col("Official") == "Y").alias("Official"),
-    )
-
-    return df
-
-def process_wsc_2023(_df):
-    """Process a CSV in the format used for the 2023 WSC."""
-    df = _df.rename({
+    },
+    2023: {
         "Official Rank   (w/o ties)": "Official_rank",
         "Total Score": "WSC_total",
         "Individual (before and after playoffs)": "Name",
@@ -67,7 +54,179 @@ def process_wsc_2023(_df):
         "Rd. 8": "WSC_t8 points",
         "Rd. 9": "WSC_t9 points",
         "Rd. 10": "WSC_t10 points",
-    })
+    },
+    2022: {
+        "Points": "WSC_total",
+        "Rank": "Unofficial_rank",
+        "Round 1": "WSC_t1 points",
+        "Round 2": "WSC_t2 points",
+        "Round 3": "WSC_t3 points",
+        "Round 4": "WSC_t4 points",
+        "Round 5": "WSC_t5 points",
+        "Round 6": "WSC_t6 points",
+        "Round 7": "WSC_t7 points",
+        "Round 10": "WSC_t10 points",
+        "Round 11": "WSC_t11 points",
+        "Round 12": "WSC_t12 points",
+    },
+    2019: {
+        "Official": "Official_rank",
+        "Pos": "Unofficial_rank",
+        "Total": "WSC_total",
+        "R 1": "WSC_t1 points",
+        "R 2": "WSC_t2 points",
+        "R 3": "WSC_t3 points",
+        "R 4": "WSC_t4 points",
+        "R 5": "WSC_t5 points",
+        "R 6": "WSC_t6 points",
+        "R 7": "WSC_t7 points",
+        "R 11": "WSC_t11 points", # I don't know why they did this. To distinguish playoff rounds?
+        "R 12": "WSC_t12 points",
+        "R 13": "WSC_t13 points",
+    },
+    2018: {
+        "oﬃcial": "Official_rank",
+        "index": "Unofficial_rank",
+        "total": "WSC_total",
+        "name": "Name",
+        "round1": "WSC_t1 points",
+        "round2": "WSC_t2 points",
+        "round3": "WSC_t3 points",
+        "round4": "WSC_t4 points",
+        "round5": "WSC_t5 points",
+        "round6": "WSC_t6 points",
+        "round7": "WSC_t7 points",
+        "round8": "WSC_t8 points",
+        "round9": "WSC_t9 points",
+        "round10": "WSC_t10 points",
+    },
+    2017: {
+        "Official Rank": "Official_rank",
+        "Overall Rank": "Unofficial_rank",
+        "TOTAL": "WSC_total",
+        "R01": "WSC_t1 points",
+        "R02": "WSC_t2 points",
+        "R03": "WSC_t3 points",
+        "R04": "WSC_t4 points",
+        "R05": "WSC_t5 points",
+        "R06": "WSC_t6 points",
+        "R07": "WSC_t7 points",
+        "R11": "WSC_t11 points",
+        "R12": "WSC_t12 points",
+        "R13": "WSC_t13 points",
+        "R14": "WSC_t14 points",
+        "R15": "WSC_t15 points",
+        "R16": "WSC_t16 points",
+    },
+    2016: {
+        "All": "Unofficial_rank",
+        "Total": "WSC_total",
+        "R1": "WSC_t1 points",
+        "R2": "WSC_t2 points",
+        "R3": "WSC_t3 points",
+        "R4": "WSC_t4 points",
+        "R5": "WSC_t5 points",
+        "R6": "WSC_t6 points",
+        "R7": "WSC_t7 points",
+        "R10": "WSC_t10 points",
+        "R11": "WSC_t11 points",
+        "R12": "WSC_t12 points",
+    },
+    2015: {
+        "Total": "WSC_total",
+        "Rank": "Unofficial_rank",
+        "Round 1": "WSC_t1 points",
+        "Round 2": "WSC_t2 points",
+        "Round 3": "WSC_t3 points",
+        "Round 4": "WSC_t4 points",
+        "Round 5": "WSC_t5 points",
+        "Round 6": "WSC_t6 points",
+        "Round 8": "WSC_t8 points",
+        "Round 9": "WSC_t9 points",
+    },
+    2014: {
+        "Total": "WSC_total",
+        "Unofficial": "Unofficial_rank",
+        "R1": "WSC_t1 points",
+        "R2": "WSC_t2 points",
+        "R3": "WSC_t3 points",
+        "R4": "WSC_t4 points",
+        "R5": "WSC_t5 points",
+        "R6": "WSC_t6 points",
+        "R9": "WSC_t9 points",
+        "R10": "WSC_t10 points",
+    },
+    2012: {
+        "Total": "WSC_total",
+        "All": "Unofficial_rank",
+        "Competitor": "Name",
+        "Part 1": "WSC_t1 points",
+        "Part 2": "WSC_t2 points",
+        "Part 3": "WSC_t3 points",
+        "Part 4": "WSC_t4 points",
+        "Part 5": "WSC_t5 points",
+        "Part 6": "WSC_t6 points",
+        "Part 7": "WSC_t7 points",
+    },
+    2011: {
+        "Result": "WSC_total",
+        "Nonoff": "Unofficial_rank",
+        "Part 1": "WSC_t1 points",
+        "Part 2": "WSC_t2 points",
+        "Part 3": "WSC_t3 points",
+        "Part 4": "WSC_t4 points",
+        "Part 5": "WSC_t5 points",
+        "Part 6": "WSC_t6 points",
+        "Part 7": "WSC_t7 points",
+        "Part 8": "WSC_t8 points",
+        "Part 9": "WSC_t9 points",
+        "Part 10": "WSC_t10 points",
+    },
+    2010: {
+        "Score": "WSC_total",
+        "Ranking": "Official_rank",
+        "100m": "WSC_t1 points",
+        "Long Jump": "WSC_t2 points",
+        "Shot Put": "WSC_t3 points",
+        "High Jump": "WSC_t4 points",
+        "400m": "WSC_t5 points",
+        "110m Hurdles": "WSC_t6 points",
+        "Discus": "WSC_t7 points",
+        "Pole Vault": "WSC_t8 points",
+        "Javelin": "WSC_t9 points",
+        "1500m": "WSC_t10 points",
+    },
+}
+
+# Raw columns whose values need cleanup before they are numeric, so they are left to type
+# inference and converted by the year's processing function.
+WSC_UNTYPED_COLUMNS = {
+    2016: ("Total", "R11"), # Thousands separators
+}
+
+def process_wsc_2025(_df):
+    """Process a CSV in the format used for the 2025 WSC."""
+    df = _df.rename(WSC_RENAMES[2025])
+
+    df = df.with_columns(
+        pl.col("Official_rank").is_not_null().alias("Official")
+    )
+
+    return df
+
+def process_wsc_2024(_df):
+    """Process a CSV in the format used for the 2024 WSC."""
+    df = _df.rename(WSC_RENAMES[2024])
+
+    df = df.with_columns(
+        (pl.col("Official") == "Y").alias("Official"),
+    )
+
+    return df
+
+def process_wsc_2023(_df):
+    """Process a CSV in the format used for the 2023 WSC."""
+    df = _df.rename(WSC_RENAMES[2023])
 
     # Ultimately we want the name as a single string, first name followed by a space followed
     # by the last name.
@@ -97,20 +256,7 @@ def process_wsc_2023(_df):
 
 def process_wsc_2022(_df):
     """Process a CSV in the format used for the 2022 WSC."""
-    df = _df.rename({
-        "Points": "WSC_total",
-        "Rank": "Unofficial_rank",
-        "Round 1": "WSC_t1 points",
-        "Round 2": "WSC_t2 points",
-        "Round 3": "WSC_t3 points",
-        "Round 4": "WSC_t4 points",
-        "Round 5": "WSC_t5 points",
-        "Round 6": "WSC_t6 points",
-        "Round 7": "WSC_t7 points",
-        "Round 10": "WSC_t10 points",
-        "Round 11": "WSC_t11 points",
-        "Round 12": "WSC_t12 points",
-    })
+    df = _df.rename(WSC_RENAMES[2022])
 
     df = df.with_columns(
         (pl.col("First Name") + pl.lit(" ") + pl.col("Last Name")).alias("Name"),
@@ -137,21 +283,7 @@ def process_wsc_2022(_df):
 
 def process_wsc_2019(_df):
     """Process a CSV in the format used for the 2019 WSC."""
-    df = _df.rename({
-        "Official": "Official_rank",
-        "Pos": "Unofficial_rank",
-        "Total": "WSC_total",
-        "R 1": "WSC_t1 points",
-        "R 2": "WSC_t2 points",
-        "R 3": "WSC_t3 points",
-        "R 4": "WSC_t4 points",
-        "R 5": "WSC_t5 points",
-        "R 6": "WSC_t6 points",
-        "R 7": "WSC_t7 points",
-        "R 11": "WSC_t11 points", # I don't know why they did this. To distinguish playoff rounds?
-        "R 12": "WSC_t12 points",
-        "R 13": "WSC_t13 points",
-    })
+    df = _df.rename(WSC_RENAMES[2019])
 
     df = df.with_columns(
         pl.col("Official_rank").is_not_null().alias("Official")
@@ -168,22 +300,7 @@ def process_wsc_2018(_df):
     Source: http://wscwpc2018.cz/wp-content/uploads/2018/11/WSC_offic_loga.pdf
     Wikipedia: https://en.wikipedia.org/wiki/World_Sudoku_Championship
     """
-    df = _df.rename({
-        "oﬃcial": "Official_rank",
-        "index": "Unofficial_rank",
-        "total": "WSC_total",
-        "name": "Name",
-        "round1": "WSC_t1 points",
-        "round2": "WSC_t2 points",
-        "round3": "WSC_t3 points",
-        "round4": "WSC_t4 points",
-        "round5": "WSC_t5 points",
-        "round6": "WSC_t6 points",
-        "round7": "WSC_t7 points",
-        "round8": "WSC_t8 points",
-        "round9": "WSC_t9 points",
-        "round10": "WSC_t10 points",
-    })
+    df = _df.rename(WSC_RENAMES[2018])
 
     df = df.with_columns(
         pl.col("Name")
@@ -208,24 +325,7 @@ def process_wsc_2018(_df):
 
 def process_wsc_2017(_df):
     """Process a CSV in the format used for the 2017 WSC."""
-    df = _df.rename({
-        "Official Rank": "Official_rank",
-        "Overall Rank": "Unofficial_rank",
-        "TOTAL": "WSC_total",
-        "R01": "WSC_t1 points",
-        "R02": "WSC_t2 points",
-        "R03": "WSC_t3 points",
-        "R04": "WSC_t4 points",
-        "R05": "WSC_t5 points",
-        "R06": "WSC_t6 points",
-        "R07": "WSC_t7 points",
-        "R11": "WSC_t11 points",
-        "R12": "WSC_t12 points",
-        "R13": "WSC_t13 points",
-        "R14": "WSC_t14 points",
-        "R15": "WSC_t15 points",
-        "R16": "WSC_t16 points",
-    })
+    df = _df.rename(WSC_RENAMES[2017])
 
     df = df.with_columns(
         pl.col("Official_rank").is_not_null().alias("Official")
@@ -235,27 +335,13 @@ def process_wsc_2017(_df):
 
 def process_wsc_2016(_df):
     """Process a CSV in the format used for the 2016 WSC."""
-    df = _df.rename({
-        "All": "Unofficial_rank",
-        "Total": "WSC_total",
-        "R1": "WSC_t1 points",
-        "R2": "WSC_t2 points",
-        "R3": "WSC_t3 points",
-        "R4": "WSC_t4 points",
-        "R5": "WSC_t5 points",
-        "R6": "WSC_t6 points",
-        "R7": "WSC_t7 points",
-        "R10": "WSC_t10 points",
-        "R11": "WSC_t11 points",
-        "R12": "WSC_t12 points",
-    })
+    df = _df.rename(WSC_RENAMES[2016])
 
     df = df.with_columns(
         (pl.col("First name") + pl.lit(" ") + pl.col("Last name")).alias("Name"),
         pl.col("Fin.").fill_null(pl.col("Off.")).alias("Official_rank"),
-        pl.col("WSC_total").str.replace(",", "").alias("WSC_total"),
-        pl.col("WSC_t11 points").str.replace(",", "").alias("WSC_t11 points"),
-        pl.col("WSC_t12 points").alias("WSC_t12 points")
+        pl.col("WSC_total").str.replace(",", "").cast(pl.Float64).alias("WSC_total"),
+        pl.col("WSC_t11 points").str.replace(",", "").cast(pl.Float64).alias("WSC_t11 points")
     )
 
     df = df.with_columns(
@@ -266,18 +352,7 @@ def process_wsc_2016(_df):
 
 def process_wsc_2015(_df):
     """Process a CSV in the format used for the 2015 WSC."""
-    df = _df.rename({
-        "Total": "WSC_total",
-        "Rank": "Unofficial_rank",
-        "Round 1": "WSC_t1 points",
-        "Round 2": "WSC_t2 points",
-        "Round 3": "WSC_t3 points",
-        "Round 4": "WSC_t4 points",
-        "Round 5": "WSC_t5 points",
-        "Round 6": "WSC_t6 points",
-        "Round 8": "WSC_t8 points",
-        "Round 9": "WSC_t9 points",
-    })
+    df = _df.rename(WSC_RENAMES[2015])
 
     df = df.with_columns(
         pl.col("Play-off")
@@ -292,18 +367,7 @@ def process_wsc_2015(_df):
 
 def process_wsc_2014(_df):
     """Process a CSV in the format used for the 2014 WSC."""
-    df = _df.rename({
-        "Total": "WSC_total",
-        "Unofficial": "Unofficial_rank",
-        "R1": "WSC_t1 points",
-        "R2": "WSC_t2 points",
-        "R3": "WSC_t3 points",
-        "R4": "WSC_t4 points",
-        "R5": "WSC_t5 points",
-        "R6": "WSC_t6 points",
-        "R9": "WSC_t9 points",
-        "R10": "WSC_t10 points",
-    })
+    df = _df.rename(WSC_RENAMES[2014])
 
     df = df.with_columns(
         pl.col("Official").is_not_null().alias("Official"),
@@ -327,18 +391,7 @@ def process_wsc_2014(_df):
 
 def process_wsc_2012(_df):
     """Process a CSV in the format used for the 2012 WSC."""
-    df = _df.rename({
-        "Total": "WSC_total",
-        "All": "Unofficial_rank",
-        "Competitor": "Name",
-        "Part 1": "WSC_t1 points",
-        "Part 2": "WSC_t2 points",
-        "Part 3": "WSC_t3 points",
-        "Part 4": "WSC_t4 points",
-        "Part 5": "WSC_t5 points",
-        "Part 6": "WSC_t6 points",
-        "Part 7": "WSC_t7 points",
-    })
+    df = _df.rename(WSC_RENAMES[2012])
 
     df = df.with_columns(
         pl.col("Off.").cast(pl.Int64).alias("Official_rank"),
@@ -357,20 +410,7 @@ def process_wsc_2012(_df):
 
 def process_wsc_2011(_df):
     """Process a CSV in the format used for the 2011 WSC."""
-    df = _df.rename({
-        "Result": "WSC_total",
-        "Nonoff": "Unofficial_rank",
-        "Part 1": "WSC_t1 points",
-        "Part 2": "WSC_t2 points",
-        "Part 3": "WSC_t3 points",
-        "Part 4": "WSC_t4 points",
-        "Part 5": "WSC_t5 points",
-        "Part 6": "WSC_t6 points",
-        "Part 7": "WSC_t7 points",
-        "Part 8": "WSC_t8 points",
-        "Part 9": "WSC_t9 points",
-        "Part 10": "WSC_t10 points",
-    })
+    df = _df.rename(WSC_RENAMES[2011])
 
     df = df.with_columns(
         (pl.col("Name 1") + pl.lit(" ") + pl.col("Name 2")).alias("Name"),
@@ -390,20 +430,7 @@ def process_wsc_2011(_df):
 
 def process_wsc_2010(_df):
     """Process a CSV in the format used for the 2010 WSC."""
-    df = _df.rename({
-        "Score": "WSC_total",
-        "Ranking": "Official_rank",
-        "100m": "WSC_t1 points",
-        "Long Jump": "WSC_t2 points",
-        "Shot Put": "WSC_t3 points",
-        "High Jump": "WSC_t4 points",
-        "400m": "WSC_t5 points",
-        "110m Hurdles": "WSC_t6 points",
-        "Discus": "WSC_t7 points",
-        "Pole Vault": "WSC_t8 points",
-        "Javelin": "WSC_t9 points",
-        "1500m": "WSC_t10 points",
-    })
+    df = _df.rename(WSC_RENAMES[2010])
 
     df = df.with_columns(
         pl.col("Name").str.replace_all("[\n]+$", "").alias("Name"),
@@ -427,41 +454,6 @@ def filter_wsc_fields(df):
 
     return df.select(kept_columns)
 
-def numberize_round_columns(df):
-    """Convert every column to numeric, including stripping commas if necessary."""
-    for wsc_round in range(1, shared.competitions.MAXIMUM_ROUND + 1):
-        round_name = f"WSC_t{wsc_round} points"
-        # Change string values (particularly with comma separators) to float (see: 2016)
-        if round_name in df.columns:
-            if df.get_column(round_name).dtype == 'object':
-                df = df.with_columns(
-                    pl.col(round_name).str.replace(',', '').cast(pl.Float64).alias(round_name)
-                )
-            else:
-                df = df.with_columns(pl.col(round_name).cast(pl.Float64).alias(round_name))
-
-    df = df.with_columns(pl.col("WSC_total").cast(pl.Float64).alias("WSC_total"))
-
-    return df
-
-def append_new_dataframe(base, addition):
-    """Align columns and vertically append `addition` to `base`"""
-    if base is None:
-        base = addition
-    else:
-        base_schema = base.schema
-        addition_schema = addition.schema
-        for col in base.columns:
-            if col not in addition.columns:
-                addition = addition.with_columns(pl.lit(None).cast(base_schema[col]).alias(col))
-        for col in addition.columns:
-            if col not in base.columns:
-                base = base.with_columns(pl.lit(None).cast(addition_schema[col]).alias(col))
-        addition = addition.select(base.columns)
-        base = pl.concat([base, addition], how="vertical")
-
-    return base
-
 def manual_adjustements(df):
     """Update names in WSC files."""
 
@@ -478,6 +470,22 @@ def manual_adjustements(df):
 
     return df
 
+def _load_wsc_year(csv_directory, year, process):
+    """Read and normalize a single year's CSV with its `process_wsc_YYYY` function."""
+    path = f"{csv_directory}/wsc_{year}.csv"
+    overrides = schemas.schema_overrides(
+        schemas.WSC_SCHEMA,
+        schemas.csv_header(path),
+        rename=WSC_RENAMES[year],
+        exclude=WSC_UNTYPED_COLUMNS.get(year, ()))
+    data = pl.read_csv(path, schema_overrides=overrides)
+    processed = process(data)
+    processed = processed.with_columns(
+        pl.lit(year).alias("year"),
+        pl.lit(True).alias("WSC_entry")
+    )
+    return filter_wsc_fields(processed)
+
 def load_wsc(csv_directory="data/raw/wsc/"):
     """Load all WSC CSV files"""
     year_to_function = {
@@ -503,19 +511,16 @@ def load_wsc(csv_directory="data/raw/wsc/"):
         2025: process_wsc_2025
     }
 
-    multiyear = None
-    for year in reversed(sorted(year_to_function)):
-        data = pl.read_csv(f"{csv_directory}/wsc_{year}.csv")
-        processed = year_to_function[year](data)
-        processed = processed.with_columns(
-            pl.lit(year).alias("year"),
-            pl.lit(True).alias("WSC_entry"),
-            pl.col("WSC_total").cast(pl.Float64).alias("WSC_total")
-        )
-        processed = filter_wsc_fields(processed)
-        processed = numberize_round_columns(processed)
+    # Each year is parsed and normalized independently, so they are processed concurrently (polars
+    # releases the GIL while it works) and combined with a single concatenation. The diagonal
+    # concat fills columns missing from some years with nulls, keeping the order in which columns
+    # first appear, most recent year first.
+    years = sorted(year_to_function, reverse=True)
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        processed = list(executor.map(
+            lambda year: _load_wsc_year(csv_directory, year, year_to_function[year]), years))
 
-        multiyear = append_new_dataframe(multiyear, processed)
+    multiyear = pl.concat(processed, how="diagonal")
 
     # Ensure a consistent ordering of the round columns
     round_columns = []
@@ -3,9 +3,14 @@
 import re
 
 import polars as pl
+import polars.selectors as cs
 
 import shared.competitions
 
+from . import registry
+from .fuzzy_match import overrides_from_candidates
+from .name_index import build_name_index, resolve_names
+
 def create_flat_dataset(full_df, metric="points", competition="GP"):
     """Flatten a solver-year dataframe to a solver dataframe.
     
@@ -26,86 +31,171 @@ def create_flat_dataset(full_df, metric="points", competition="GP"):
     else:
         raise ValueError(f"Observed unexpected competition \"{competition}\"")
 
-    max_round_plus_one = shared.competitions.MAXIMUM_ROUND + 1
+    key = registry.solver_key(full_df)
+    if key == "solver_id":
+        kept_columns.insert(1, "solver_id")
+
+    identity_columns = [column for column in kept_columns if column not in columns_to_drop]
 
-    for competition_round in range(1, max_round_plus_one):
+    # Round columns exist for every possible round, as all years share one large table.
+    round_numbers = {}
+    for competition_round in range(1, shared.competitions.MAXIMUM_ROUND + 1):
         colname = f"{competition}_t{competition_round} {metric}"
         if colname in full_df.columns:
-            kept_columns.append(colname)
-
-    subset = full_df.select(kept_columns)
-
-    flattened = None
-
-    years = full_df.filter(pl.col("year").is_not_null()).get_column("year").unique()
+            round_numbers[colname] = str(competition_round)
+
+    # Years that don't exist shouldn't be included for anyone
+    years = [year for year in full_df.get_column("year").drop_nulls().unique().sort()
+             if shared.competitions.get_max_round(year, competition) is not None]
+
+    subset = (full_df
+              .select(kept_columns + list(round_numbers))
+              .filter(pl.col("year").is_in(years))
+              .sort("year", maintain_order=True))
+
+    # Every solver seen in any year gets a row. Identity columns take the first value recorded,
+    # starting from the earliest year.
+    identities = subset.group_by(key, maintain_order=True).agg(
+        [pl.col(column).drop_nulls().first() for column in identity_columns if column != key]
+    ).select(identity_columns)
+
+    if not round_numbers:
+        return identities
+
+    # Results go long and then wide again with one column per year and round. Rounds that were not
+    # held in a year have no results, so they get no column.
+    results = (
+        subset
+        .unpivot(index=[key, "year"], on=list(round_numbers), variable_name="round",
+                 value_name="result")
+        .drop_nulls("result")
+        .with_columns(pl.col("round").replace_strict(round_numbers, return_dtype=pl.String))
+        .with_columns(pl.concat_str([pl.col("year"), pl.col("round")], separator="_")
+                      .alias("year_round"))
+    )
 
-    for year in years:
-        single_year = subset.filter(pl.col("year") == year)
-        max_round_in_year = shared.competitions.get_max_round(year, competition)
+    year_rounds = (results.select("year", pl.col("round").cast(pl.Int32), "year_round")
+                   .unique()
+                   .sort(["year", "round"])
+                   .get_column("year_round")
+                   .to_list())
+
+    flattened = results.pivot(on="year_round", index=key, values="result",
+                              aggregate_function="first")
+
+    return (identities
+            .join(flattened, on=key, how="left")
+            .select(identity_columns + year_rounds))
+
+# Quantiles kept for every round in `round_statistics`, as (column, quantile).
+ROUND_QUANTILES = (("q10", 0.1), ("q25", 0.25), ("q75", 0.75), ("q90", 0.9))
+
+ROUND_STATISTICS_SCHEMA = {
+    "competition": pl.String,
+    "year": pl.Int64,
+    "round": pl.Int32,
+    "count": pl.UInt32,
+    "max": pl.Float64,
+    "mean": pl.Float64,
+    "median": pl.Float64,
+    **{column: pl.Float64 for column, _ in ROUND_QUANTILES},
+    "scores": pl.List(pl.Float64),
+}
+
+def round_statistics(full_df, metric="points", competitions=("GP", "WSC", "ESC")):
+    """Summarize the distribution of results in every round held, across all solvers.
+
+    The rounds are those that get a column in `create_flat_dataset`, whichever solvers are
+    flattened. Results are taken at Float32 precision, the precision at which the charts compare
+    them, so `max` is exactly what `convert_columns_to_max_pct` would divide a column by.
+
+    Args:
+        full_df: Solver-year DataFrame with `{competition}_t{n} {metric}` columns
+        metric: Round metric, as in `create_flat_dataset`
+        competitions: Competitions to summarize
+
+    Returns:
+        DataFrame with the columns of `ROUND_STATISTICS_SCHEMA`, ordered by competition, year,
+        and round. `scores` holds the round's results, sorted ascending.
+    """
+    statistics = []
+    for competition in competitions:
+        round_numbers = {}
+        for competition_round in range(1, shared.competitions.MAXIMUM_ROUND + 1):
+            colname = f"{competition}_t{competition_round} {metric}"
+            if colname in full_df.columns:
+                round_numbers[colname] = competition_round
+        if not round_numbers:
+            continue
 
-        rename = {}
+        years = [year for year in full_df.get_column("year").drop_nulls().unique()
+                 if shared.competitions.get_max_round(year, competition) is not None]
+
+        score = pl.col("score")
+        statistics.append(
+            full_df
+            .filter(pl.col("year").is_in(years))
+            .select("year", *[pl.col(column).cast(pl.Float32).cast(pl.Float64)
+                              for column in round_numbers])
+            .unpivot(index="year", variable_name="round", value_name="score")
+            .drop_nulls("score")
+            .with_columns(
+                pl.lit(competition).alias("competition"),
+                pl.col("round").replace_strict(round_numbers, return_dtype=pl.Int32))
+            .group_by(["competition", "year", "round"])
+            .agg(
+                pl.len().alias("count"),
+                score.max().alias("max"),
+                score.mean().alias("mean"),
+                score.median().alias("median"),
+                *[score.quantile(quantile, interpolation="linear").alias(column)
+                  for column, quantile in ROUND_QUANTILES],
+                score.sort().alias("scores"),
+            )
+            .select(list(ROUND_STATISTICS_SCHEMA))
+            .cast(ROUND_STATISTICS_SCHEMA)
+        )
 
-        # Years that don't exist shouldn't be included for anyone
-        if max_round_in_year is None:
-            continue
+    if not statistics:
+        return pl.DataFrame(schema=ROUND_STATISTICS_SCHEMA)
+    return pl.concat(statistics).sort(["competition", "year", "round"])
 
-        # Need to do this for the largest rounds available, because the columns
-        # will exist for each and otherwise we'll have column name problems in
-        # the join
-        for competition_round in range(1, max_round_plus_one):
-            colname = f"{competition}_t{competition_round} {metric}"
-            if colname in single_year:
-                # Some rounds don't exist in all years, but they still have columns because
-                # all years are represented in one large table that contains a column for
-                # every possible round.
-                if sum(single_year.get_column(colname).is_null()) == len(single_year):
-                    single_year = single_year.drop(colname)
-                else:
-                    rename[colname] = f"{year}_{competition_round}"
-
-        single_year = single_year.rename(rename)
-
-        if flattened is None:
-            flattened = single_year
-        else:
-            single_year = single_year.drop(columns_to_drop)
-            flattened = flattened.join(single_year, on="user_pseudo_id",
-                                how="outer", suffix="_right")
-
-            for column in ("Name", "Nick", "Country", "Official", "Official_rank",
-                           "Unofficial_rank", "WSC_total", "ESC_rank",
-                           "ESC_unofficial_rank", "ESC_total", "user_pseudo_id"):
-                right_col = f"{column}_right"
-                if right_col in flattened.columns:
-                    flattened = flattened.with_columns(
-                        pl.col(column).fill_null(pl.col(right_col)).alias(column)
-                    ).drop(right_col)
+def with_round_positions(df, round_columns):
+    """Add a position column for every round points column, ranked within each year.
 
-    flattened = flattened.drop(columns_to_drop)
+    All rounds are ranked in one batch of expressions. The points columns are cast to Float64,
+    and `{round} points` gets its position in `{round} position`, with ties sharing the best
+    position.
 
-    return flattened
+    Args:
+        df: Solver-year DataFrame with a `year` column
+        round_columns: Selector for the points columns, e.g. `cs.matches(r"^WSC_t\\d+ points$")`
+    """
+    points = round_columns.cast(pl.Float64)
+    return df.with_columns(
+        points,
+        points.rank(descending=True, method="min").over("year")
+        .name.map(lambda name: name.replace(" points", " position")),
+    )
 
 def merge_unflat_datasets(gp_dataset, wsc_dataset, extra_datasets=None):
     """Combine solver-year level datasets from the GP and WSC."""
     kept_columns = ["WSC_entry", "year", "Official", "Official_rank",
                     "Unofficial_rank", "WSC_total", "Name", "user_pseudo_id"]
-    for competition_round in range(1, shared.competitions.MAXIMUM_ROUND + 1):
-        round_name = f"WSC_t{competition_round} points"
-        if round_name in wsc_dataset.columns:
-            # Also calculate the round position at this time
-            position_name = f"WSC_t{competition_round} position"
-            wsc_dataset = wsc_dataset.with_columns(
-                pl.col(round_name).cast(pl.Float64).alias(round_name)
-            )
-            wsc_dataset = wsc_dataset.with_columns(
-                pl.col(round_name)
-                .rank(descending=True, method="min")
-                .over("year")
-                .alias(position_name)
-            )
 
-            kept_columns.append(round_name)
-            kept_columns.append(position_name)
+    # Also calculate the round positions at this time
+    wsc_dataset = with_round_positions(wsc_dataset, cs.matches(r"^WSC_t\d+ points$"))
+    wsc_rounds = sorted(
+        (int(match.group(1)), match.group(0)) for match in
+        (re.fullmatch(r"WSC_t(\d+) points", column) for column in wsc_dataset.columns) if match)
+    for _, round_name in wsc_rounds:
+        kept_columns.append(round_name)
+        kept_columns.append(round_name.replace(" points", " position"))
+
+    # Join on the integer solver identifiers when both sides carry them.
+    key = registry.solver_key(gp_dataset, wsc_dataset)
+    if "solver_id" in wsc_dataset.columns:
+        kept_columns.append("solver_id")
 
     minimal = wsc_dataset.select(kept_columns)
 
@@ -113,39 +203,31 @@ def merge_unflat_datasets(gp_dataset, wsc_dataset, extra_datasets=None):
     # Preferring GP, because it is naturally more consistent (except when
     # people change it) and we have overrides to make it consistent in such
     # cases anyways.
-    merged = gp_dataset.join(minimal, how="full", on=["user_pseudo_id", "year"])
+    merged = gp_dataset.join(minimal, how="full", on=[key, "year"])
 
-    merged = merged.with_columns(
-        pl.coalesce([pl.col("Name"), pl.col("Name_right")]).alias("Name"),
-        pl.coalesce([pl.col("user_pseudo_id"), pl.col("user_pseudo_id_right")])
-            .alias("user_pseudo_id"),
-        pl.coalesce([pl.col("year"), pl.col("year_right")]).alias("year")
-    )
-
-    merged = merged.drop(["Name_right", "user_pseudo_id_right", "year_right"])
+    for col in ("Name", "user_pseudo_id", "solver_id", "year"):
+        right_col = f"{col}_right"
+        if right_col in merged.columns:
+            merged = merged.with_columns(
+                pl.coalesce([pl.col(col), pl.col(right_col)]).alias(col)
+            ).drop(right_col)
 
     if extra_datasets:
         for extra in extra_datasets:
-            extra = extra.clone()
             # Compute per-round positions for any round point columns present
-            for col in extra.columns:
-                if col.endswith(" points"):
-                    pos_col = col.replace(" points", " position")
-                    extra = extra.with_columns(
-                        pl.col(col).cast(pl.Float64).alias(col)
-                    )
-                    extra = extra.with_columns(
-                        pl.col(col).rank(descending=True, method="min").over("year").alias(pos_col)
-                    )
-
-            extra_cols = [c for c in extra.columns if c not in ("Name", "year", "user_pseudo_id")]
-            extra_minimal = extra.select(["Name", "user_pseudo_id", "year"] + extra_cols)
+            extra = with_round_positions(extra, cs.ends_with(" points"))
+
+            id_cols = ["Name", "user_pseudo_id", "year"]
+            if "solver_id" in extra.columns:
+                id_cols.append("solver_id")
+            extra_cols = [c for c in extra.columns if c not in id_cols]
+            extra_minimal = extra.select(id_cols + extra_cols)
 
             # Full join so solvers with only extra-competition data (no GP/WSC that year)
             # still appear in the combined dataset.
-            merged = merged.join(extra_minimal, on=["user_pseudo_id", "year"], how="full",
-                                 suffix="_extra")
-            for col in ("Name", "user_pseudo_id", "year"):
+            merged = merged.join(extra_minimal, on=[registry.solver_key(merged, extra), "year"],
+                                 how="full", suffix="_extra")
+            for col in ("Name", "user_pseudo_id", "solver_id", "year"):
                 right_col = f"{col}_extra"
                 if right_col in merged.columns:
                     merged = merged.with_columns(
@@ -170,8 +252,8 @@ def merge_flat_datasets(datasets, suffixes=("_gp", "_wsc")):
 
     merged = datasets[0]
     for additional in datasets[1:]:
-        merged = merged.join(additional, on="user_pseudo_id", how="full")
-        for col in ("Name", "user_pseudo_id"):
+        merged = merged.join(additional, on=registry.solver_key(merged, additional), how="full")
+        for col in ("Name", "user_pseudo_id", "solver_id"):
             right_col = f"{col}_right"
             if right_col in merged.columns:
                 merged = merged.with_columns(
@@ -180,78 +262,54 @@ def merge_flat_datasets(datasets, suffixes=("_gp", "_wsc")):
 
     return merged
 
-def attempted_mapping(wsc_df, gp_df, manual_override=None):
-    """Update a WSC dataset with identifiers from a GP dataset."""
-    # Deduplicate by Name, preferring entries that have a nick over nickless ones.
-    # Multiple rows with the same Name can otherwise fan out join results.
-    gp_index = (gp_df.select(["Name", "Country", "Nick", "user_pseudo_id"])
-                .unique()
-                .sort("Nick", nulls_last=True)
-                .unique(subset=["Name"], keep="first"))
-    gp_index = gp_index.with_columns(pl.col("Name").str.to_lowercase().alias("name_lc"))
-
-    wsc_mapped = wsc_df.with_columns(
-        pl.col("Name").str.to_titlecase().str.replace(",", "").alias("Name"),
-        pl.col("Name").str.to_lowercase().str.replace(",", "").alias("name_lc")
-    )
+def attempted_mapping(wsc_df, gp_df, manual_override=None, name_index=None):
+    """Update a WSC dataset with identifiers from a GP dataset.
 
-    wsc_mapped = wsc_mapped.with_columns(
-        pl.col("Name")
-        .str.replace_all(",", "")
-        .str.split(" ")
-        .list.reverse()
-        .list.join(" ")
-        .alias("flipped_name")
-    )
+    Names are resolved through an index of GP names (see `shared.data.name_index`). Pass a
+    prebuilt `name_index` to skip building it from `gp_df`.
 
-    # Drop Country_right and Nick_right from the first join immediately — they are
-    # unused and would conflict when the second join also produces them.
-    _first_join = wsc_mapped.join(gp_index, on="Name", how="left")
-    _drop = ["name_lc_right"] + [c for c in ["Country_right", "Nick_right"] if c in _first_join.columns]
-    joined = _first_join.drop(_drop)
-
-    joined_flipped = (
-        joined
-            .join(gp_index, left_on="flipped_name", right_on="Name", how="left")
-            .drop(["Country_right", "Nick_right"])
-            .rename({"user_pseudo_id_right": "user_pseudo_id_flipped_name"})
-    )
+    `manual_override` maps names to GP identifiers ahead of the automatic match. It is either a
+    dictionary or a reviewed candidate table from `shared.data.fuzzy_match.propose_matches`, of
+    which the accepted rows are used.
+    """
+    if name_index is None:
+        name_index = build_name_index(gp_df)
 
-    wsc_and_gp = (
-        joined_flipped
-            .join(gp_index, on="name_lc", how="left")
-            .rename(({"user_pseudo_id_right": "user_pseudo_id_name_lc"}))
-    )
+    resolved = resolve_names(wsc_df.get_column("Name"), name_index)
 
-    # Use our attempted identifiers in a hierarchy by name, then flipped name, then lowercase name
-    wsc_and_gp = wsc_and_gp.with_columns(
-        pl.col("user_pseudo_id")
-        .fill_null(pl.col("user_pseudo_id_flipped_name"))
-        .fill_null(pl.col("user_pseudo_id_name_lc"))
-        .alias("matched_id")
+    # Country and Nick of exact matches fill in for results that do not record them.
+    added_columns = [col for col in ("Country", "Nick") if col not in wsc_df.columns]
+    wsc_and_gp = (
+        wsc_df.drop(["user_pseudo_id", "solver_id"], strict=False)
+        .join(resolved.select(["Name", "normalized_name", "flipped_name", "user_pseudo_id"]
+                              + added_columns),
+              on="Name", how="left")
+        .with_columns(pl.col("normalized_name").alias("Name"))
+        .rename({"user_pseudo_id": "matched_id"})
     )
 
     if manual_override is None:
         manual_override = shared.competitions.WSC_NAME_TO_GP_ID_OVERRIDE
-    manual_map = manual_override
-
-    expr = None
-    for key, value in manual_map.items():
-        if expr is None:
-            expr = pl.when(pl.col("Name") == key).then(pl.lit(value))
-        else:
-            expr = expr.when(pl.col("Name") == key).then(pl.lit(value))
-        expr = expr.when(pl.col("flipped_name") == key).then(pl.lit(value))
-
-    if expr is not None:
-        expr = expr.otherwise(pl.col("matched_id")).alias("matched_id")
+    if isinstance(manual_override, pl.DataFrame):
+        manual_map = overrides_from_candidates(manual_override)
+    else:
+        manual_map = manual_override
+
+    # One hash lookup per name variant. An override on the name as written wins over one on the
+    # flipped name, and either wins over the automatic match.
+    if manual_map:
+        expr = pl.coalesce([
+            pl.col("Name").replace_strict(manual_map, default=None, return_dtype=pl.String),
+            pl.col("flipped_name").replace_strict(manual_map, default=None, return_dtype=pl.String),
+            pl.col("matched_id"),
+        ]).alias("matched_id")
     else:
         expr = pl.col("matched_id")
 
     wsc_and_gp = (
         wsc_and_gp
             .with_columns(expr)
-            .drop("user_pseudo_id")
+            .drop(["normalized_name", "flipped_name"])
             .rename({"matched_id": "user_pseudo_id"})
     )
 
@@ -260,7 +318,7 @@ def attempted_mapping(wsc_df, gp_df, manual_override=None):
         pl.col("user_pseudo_id").fill_null(pl.col("Name"))
     )
 
-    return wsc_and_gp
+    return registry.with_solver_ids(wsc_and_gp)
 
 def ids_by_total_points(combined):
     """Return identifiers ordered by total points across all competitions."""
@@ -0,0 +1,173 @@
+"""Index of GP solver names for resolving WSC and ESC names to GP identifiers.
+
+WSC and ESC results only carry names, written in varying order, case, accents, and punctuation.
+The index holds every GP name under several normalized keys. A name is resolved by deriving the
+same keys for it and taking the highest-priority key that matches, in a single join.
+
+The index only depends on the GP dataset, so it can be built once per data version and cached.
+"""
+
+import unicodedata
+
+import polars as pl
+
+# Key variants in order of priority: a match on an earlier variant wins over a later one.
+#   exact:          the name as written (titlecased, first comma removed)
+#   flipped:        the name with its words reversed, as in "Surname Given"
+#   lowercase:      the name ignoring case
+#   accent_folded:  the name ignoring case and accents
+#   comma_stripped: the name ignoring case, accents, and punctuation
+KEY_VARIANTS = ("exact", "flipped", "lowercase", "accent_folded", "comma_stripped")
+
+_PRIORITY = {variant: priority for priority, variant in enumerate(KEY_VARIANTS)}
+
+# Letters that do not decompose into a base letter and an accent.
+_UNDECOMPOSABLE = str.maketrans({"ł": "l", "ø": "o", "đ": "d", "ß": "ss", "æ": "ae",
+                                 "œ": "oe", "ı": "i"})
+
+INDEX_SCHEMA = {
+    "variant": pl.String,
+    "key": pl.String,
+    "priority": pl.UInt8,
+    "user_pseudo_id": pl.String,
+    "Country": pl.String,
+    "Nick": pl.String,
+}
+
+
+def _fold(name):
+    """Lowercase `name` and strip its accents."""
+    decomposed = unicodedata.normalize("NFKD", name.lower().translate(_UNDECOMPOSABLE))
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _folded(expr):
+    """Apply `_fold` to a string expression, once per distinct value."""
+    return expr.map_batches(
+        lambda names: names.replace_strict(
+            {name: _fold(name) for name in names.unique().drop_nulls()},
+            default=None, return_dtype=pl.String),
+        return_dtype=pl.String)
+
+
+def _without_punctuation(expr):
+    """Remove punctuation and collapse whitespace in a string expression.
+
+    Hyphens separate words, as in "Jean-Luc", while other marks are dropped, as in "O'Neil".
+    """
+    return (expr.str.replace_all(r"-", " ")
+            .str.replace_all(r"[^\w\s]", "")
+            .str.replace_all(r"\s+", " ")
+            .str.strip_chars())
+
+
+def normalized_name(expr):
+    """Normalize a WSC or ESC name the way results are stored: titlecased, first comma removed."""
+    return expr.str.to_titlecase().str.replace(",", "")
+
+
+def comparable_name(expr):
+    """Reduce a name to lowercase words without accents or punctuation."""
+    return _without_punctuation(_folded(expr))
+
+
+def _gp_keys():
+    """Expressions deriving each key variant from a GP name."""
+    name = pl.col("Name")
+    return {
+        "exact": name,
+        # Flipping is applied to the names being resolved, not to the GP names.
+        "flipped": name,
+        "lowercase": name.str.to_lowercase(),
+        "accent_folded": _folded(name),
+        "comma_stripped": comparable_name(name),
+    }
+
+
+def _query_keys():
+    """Expressions deriving each key variant from a WSC or ESC name."""
+    name = pl.col("Name")
+    return {
+        "exact": normalized_name(name),
+        "flipped": (name.str.to_titlecase()
+                    .str.replace_all(",", "")
+                    .str.split(" ")
+                    .list.reverse()
+                    .list.join(" ")),
+        "lowercase": name.str.to_lowercase().str.replace(",", ""),
+        "accent_folded": _folded(name.str.replace_all(",", "")),
+        "comma_stripped": comparable_name(name),
+    }
+
+
+def build_name_index(gp_df):
+    """Build the name index from a GP dataset.
+
+    Each GP name appears once per key variant. Where several GP entries share a key, entries with
+    a nick are preferred, so that one key never resolves to more than one solver.
+
+    Args:
+        gp_df: DataFrame with Name, Country, Nick, and user_pseudo_id columns
+
+    Returns:
+        DataFrame with the columns of `INDEX_SCHEMA`, unique on (variant, key)
+    """
+    solvers = (gp_df.select(["Name", "Country", "Nick", "user_pseudo_id"])
+               .unique()
+               .sort(["Nick", "user_pseudo_id"], nulls_last=True))
+
+    variants = [
+        solvers.select(
+            pl.lit(variant).alias("variant"),
+            key.alias("key"),
+            pl.lit(_PRIORITY[variant], dtype=pl.UInt8).alias("priority"),
+            "user_pseudo_id",
+            "Country",
+            "Nick",
+        )
+        for variant, key in _gp_keys().items()
+    ]
+
+    return (pl.concat(variants)
+            .filter(pl.col("key").is_not_null())
+            .unique(subset=["variant", "key"], keep="first", maintain_order=True)
+            .cast(INDEX_SCHEMA))
+
+
+def resolve_names(names, name_index):
+    """Resolve names to GP identifiers with a single join against `name_index`.
+
+    Args:
+        names: Series of names as written in the WSC or ESC results
+        name_index: Output of `build_name_index`
+
+    Returns:
+        DataFrame with one row per distinct name: Name (as written), the normalized name
+        (`exact` key), `flipped_name`, and the matched user_pseudo_id (null if none). Country and
+        Nick of the GP entry are included for matches on the exact name.
+    """
+    queries = pl.DataFrame({"Name": names}).unique().filter(pl.col("Name").is_not_null())
+    keyed = queries.with_columns(
+        [key.alias(variant) for variant, key in _query_keys().items()]
+    )
+
+    candidates = keyed.unpivot(
+        index="Name", on=list(KEY_VARIANTS), variable_name="variant", value_name="key")
+
+    best = (
+        candidates
+        .join(name_index, on=["variant", "key"], how="inner")
+        .sort("priority")
+        .unique(subset=["Name"], keep="first")
+        .select(
+            "Name",
+            "user_pseudo_id",
+            pl.when(pl.col("variant") == "exact").then(pl.col("Country")).alias("Country"),
+            pl.when(pl.col("variant") == "exact").then(pl.col("Nick")).alias("Nick"),
+        )
+    )
+
+    return (keyed
+            .select("Name", pl.col("exact").alias("normalized_name"),
+                    pl.col("flipped").alias("flipped_name"))
+            .join(best, on="Name", how="left"))
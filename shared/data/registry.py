@@ -0,0 +1,175 @@
+"""Registry assigning every solver a compact integer identifier.
+
+Solvers are identified by `user_pseudo_id`, a long string built from name, nick, and country.
+The registry dictionary-encodes it: each distinct `user_pseudo_id` gets a `solver_id` (UInt32),
+which the loaders attach so that joins and filters can work on integers instead of strings.
+
+The registry is append-only and persisted to Parquet. Solvers keep their `solver_id` as new data
+arrives, so identifiers from the loaders and processes sharing a registry file agree. Additions
+are made under a lock, so concurrent loaders never hand out the same identifier twice.
+
+Identifiers follow the order in which solvers were first registered, so registries built on
+different machines, or from loaders run in a different order, can number solvers differently.
+They are only meaningful alongside their registry: snapshots and exports do not rely on them,
+and `solver_id` is attached again whenever a frame is read back.
+"""
+
+import contextlib
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+import polars as pl
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows, where only threads are serialized.
+    fcntl = None
+
+
+REGISTRY_PATH = "data/solver_registry.parquet"
+
+SOLVER_ID_DTYPE = pl.UInt32
+
+_SCHEMA = {"solver_id": SOLVER_ID_DTYPE, "user_pseudo_id": pl.String}
+
+# Registries already read in this process, by path, with the modification time they were read at.
+_loaded: dict[str, tuple[int, pl.DataFrame]] = {}
+
+# Serializes additions between threads; `_locked` adds a file lock between processes.
+_lock = threading.Lock()
+
+
+def _resolve(path: Optional[str]) -> Path:
+    # Resolved at call time, so that tests can point REGISTRY_PATH elsewhere.
+    return Path(path or REGISTRY_PATH)
+
+
+@contextlib.contextmanager
+def _locked(path: Path):
+    """Hold the lock on the registry at `path`, across threads and processes."""
+    with _lock:
+        lock_file = None
+        if fcntl is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                lock_file = open(path.with_suffix(".lock"), "a", encoding="utf-8")
+            except OSError:
+                # Without a writable directory the registry is not persisted either.
+                lock_file = None
+
+        if lock_file is None:
+            yield
+            return
+
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_registry(path: Optional[str] = None) -> pl.DataFrame:
+    """Return the registry as a DataFrame of [solver_id, user_pseudo_id].
+
+    Args:
+        path: Registry file; defaults to `REGISTRY_PATH`
+
+    Returns:
+        DataFrame ordered by solver_id, empty if the registry does not exist yet
+    """
+    path = _resolve(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return _loaded.get(str(path), (None, pl.DataFrame(schema=_SCHEMA)))[1]
+
+    cached = _loaded.get(str(path))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    registry = pl.read_parquet(path).cast(_SCHEMA)
+    _loaded[str(path)] = (mtime, registry)
+    return registry
+
+
+def register_solvers(solver_names: Iterable[str], path: Optional[str] = None) -> pl.DataFrame:
+    """Assign identifiers to any solvers not yet in the registry and persist it.
+
+    New solvers are numbered after the existing ones, in sorted order. The registry is read
+    again and extended under a lock, so solvers registered concurrently by other threads or
+    processes keep their identifiers.
+
+    Args:
+        solver_names: `user_pseudo_id` values; nulls and known solvers are ignored
+        path: Registry file; defaults to `REGISTRY_PATH`
+
+    Returns:
+        The updated registry
+    """
+    path = _resolve(path)
+    names = (
+        pl.Series("user_pseudo_id", list(solver_names), dtype=pl.String)
+        .drop_nulls()
+        .unique()
+        .sort()
+    )
+    registry = load_registry(path)
+    if names.is_in(registry["user_pseudo_id"]).all():
+        return registry
+
+    with _locked(path):
+        registry = load_registry(path)
+        unseen = names.filter(~names.is_in(registry["user_pseudo_id"]))
+        if unseen.is_empty():
+            return registry
+
+        additions = pl.DataFrame({
+            "solver_id": pl.int_range(len(registry), len(registry) + len(unseen),
+                                      dtype=SOLVER_ID_DTYPE, eager=True),
+            "user_pseudo_id": unseen,
+        })
+        registry = pl.concat([registry, additions])
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename, so concurrent readers never see partial
+            # output.
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            registry.write_parquet(tmp_path)
+            os.replace(tmp_path, path)
+            _loaded[str(path)] = (path.stat().st_mtime_ns, registry)
+        except OSError:
+            # Without a writable registry the identifiers are still consistent within this
+            # process.
+            _loaded[str(path)] = (None, registry)
+
+    return registry
+
+
+def with_solver_ids(df: pl.DataFrame, path: Optional[str] = None) -> pl.DataFrame:
+    """Attach the `solver_id` of each row's `user_pseudo_id`, registering new solvers.
+
+    An existing `solver_id` column is replaced, so frames read back from disk always carry the
+    identifiers of the current registry.
+
+    Args:
+        df: DataFrame with a `user_pseudo_id` column
+        path: Registry file; defaults to `REGISTRY_PATH`
+
+    Returns:
+        `df` with a `solver_id` column (null where `user_pseudo_id` is null)
+    """
+    registry = register_solvers(df["user_pseudo_id"].unique(), path)
+    # A left join keeps the row order of `df`.
+    return (df.drop("solver_id", strict=False)
+            .join(registry, on="user_pseudo_id", how="left"))
+
+
+def solver_key(*dfs: pl.DataFrame) -> str:
+    """Return the column to join `dfs` on: `solver_id` if all of them have it."""
+    if all("solver_id" in df.columns for df in dfs):
+        return "solver_id"
+    return "user_pseudo_id"
@@ -0,0 +1,182 @@
+"""Long-format table of round results: one row per solver, competition, year, and round.
+
+The loaders produce wide solver-year frames with a column per round and metric, such as
+`GP_t3 points` or `WSC_t12 position`, for every round that any year has had. The round results
+table holds the same results in long format, which makes per-round and per-solver questions
+single expressions instead of loops over round numbers. The wide columns can be derived back
+from it with `wide_round_columns`.
+
+The table is sorted by solver, competition, year, and round, so one solver's results are a
+contiguous slice (see `solver_rounds`).
+"""
+
+import re
+
+import polars as pl
+
+from . import registry
+
+COMPETITIONS = ("GP", "WSC", "ESC")
+
+ROUND_RESULTS_SCHEMA = {
+    "solver_id": registry.SOLVER_ID_DTYPE,
+    "competition": pl.Enum(COMPETITIONS),
+    "year": pl.Int16,
+    "round": pl.UInt8,
+    # Points are kept at full precision, since many scores are not exact in Float32.
+    "points": pl.Float64,
+    "position": pl.UInt16,
+    "ranking_points": pl.Float64,
+}
+
+SORT_COLUMNS = ["solver_id", "competition", "year", "round"]
+
+# Wide column metric for each long column.
+_METRICS = {"points": "points", "position": "position", "ranking_points": "rank. points"}
+
+_ROUND_COLUMN = re.compile(r"^(GP|WSC|ESC)_t(\d+) (points|position|rank\. points)$")
+
+
+def _round_columns(df, competition):
+    """Map each wide round column of `competition` in `df` to its (round, long column)."""
+    long_names = {wide: long for long, wide in _METRICS.items()}
+    columns = {}
+    for column in df.columns:
+        match = _ROUND_COLUMN.match(column)
+        if match and match.group(1) == competition:
+            columns[column] = (int(match.group(2)), long_names[match.group(3)])
+    return columns
+
+
+def round_results(df, competition):
+    """Convert the wide round columns of one competition to the long format.
+
+    Rows without points or position are dropped, so only rounds a solver played remain. Where
+    `df` has no position columns (as for the WSC and ESC loaders), positions are ranked from the
+    points within each year and round, ties sharing the best position.
+
+    Args:
+        df: Solver-year frame with `solver_id`, `year`, and `{competition}_t{n} ...` columns
+        competition: One of `COMPETITIONS`
+
+    Returns:
+        DataFrame with the columns of `ROUND_RESULTS_SCHEMA`, in no particular order
+    """
+    if competition not in COMPETITIONS:
+        raise ValueError(f"Observed unexpected competition \"{competition}\"")
+
+    columns = _round_columns(df, competition)
+    if not columns:
+        return pl.DataFrame(schema=ROUND_RESULTS_SCHEMA)
+
+    long = (
+        df.select(["solver_id", "year", *columns])
+        .filter(pl.col("year").is_not_null())
+        .unpivot(index=["solver_id", "year"], on=list(columns), variable_name="column")
+        .drop_nulls("value")
+        .with_columns(
+            pl.col("column").replace_strict({c: r for c, (r, _) in columns.items()},
+                                            return_dtype=pl.UInt8).alias("round"),
+            pl.col("column").replace_strict({c: m for c, (_, m) in columns.items()},
+                                            return_dtype=pl.String).alias("metric"),
+        )
+        .pivot(on="metric", index=["solver_id", "year", "round"], values="value",
+               aggregate_function="first")
+    )
+
+    for column in _METRICS:
+        if column not in long.columns:
+            long = long.with_columns(pl.lit(None, dtype=pl.Float64).alias(column))
+
+    if not any(metric == "position" for _, metric in columns.values()):
+        long = long.with_columns(
+            pl.col("points").rank(descending=True, method="min").over(["year", "round"])
+            .alias("position"))
+
+    return (long
+            .filter(pl.col("points").is_not_null() | pl.col("position").is_not_null())
+            .with_columns(pl.lit(competition).alias("competition"))
+            .select(list(ROUND_RESULTS_SCHEMA))
+            .cast(ROUND_RESULTS_SCHEMA))
+
+
+def build_round_results(datasets):
+    """Build the round results table from wide solver-year frames.
+
+    Args:
+        datasets: Mapping from competition to its solver-year frame, e.g. {"GP": gp, ...}
+
+    Returns:
+        DataFrame with the columns of `ROUND_RESULTS_SCHEMA`, sorted by `SORT_COLUMNS`
+    """
+    return (pl.concat([round_results(df, competition) for competition, df in datasets.items()])
+            .sort(SORT_COLUMNS)
+            .with_columns(pl.col("solver_id").set_sorted()))
+
+
+def solver_rounds(round_table, solver_ids):
+    """Return the rows of the given solvers, by slicing the sorted table.
+
+    Args:
+        round_table: Output of `build_round_results`
+        solver_ids: `solver_id` values
+
+    Returns:
+        The solvers' rows, in the order of `solver_ids` and then of the table
+    """
+    ids = round_table.get_column("solver_id")
+    slices = []
+    for solver_id in solver_ids:
+        start = ids.search_sorted(solver_id, side="left")
+        end = ids.search_sorted(solver_id, side="right")
+        slices.append(round_table.slice(start, end - start))
+    if not slices:
+        return round_table.clear()
+    return pl.concat(slices)
+
+
+def rounds_held(round_table, competition, year):
+    """Return the sorted round numbers with results in one competition and year."""
+    return (round_table
+            .filter((pl.col("competition") == competition) & (pl.col("year") == year))
+            .get_column("round")
+            .unique()
+            .sort()
+            .to_list())
+
+
+def wide_round_columns(round_table, competition, metrics=("points", "position")):
+    """Derive the wide solver-year round columns of one competition from the long table.
+
+    Args:
+        round_table: Output of `build_round_results`
+        competition: One of `COMPETITIONS`
+        metrics: Long columns to spread out, named as in the loaders (`_METRICS`)
+
+    Returns:
+        DataFrame keyed by (solver_id, year) with a `{competition}_t{n} {metric}` column for
+        every round the competition has held, ordered by round and then metric
+    """
+    rounds = round_table.filter(pl.col("competition") == competition)
+    round_numbers = rounds.get_column("round").unique().sort().to_list()
+
+    wide_columns = [f"{competition}_t{n} {_METRICS[metric]}"
+                    for n in round_numbers for metric in metrics]
+
+    wide = (
+        rounds
+        .select("solver_id", "year", "round", *metrics)
+        .unpivot(index=["solver_id", "year", "round"], on=list(metrics), variable_name="metric")
+        .with_columns(
+            pl.format("{}_t{} {}", pl.lit(competition), pl.col("round"),
+                      pl.col("metric").replace_strict(_METRICS, return_dtype=pl.String))
+            .alias("column"))
+        .pivot(on="column", index=["solver_id", "year"], values="value",
+               aggregate_function="first")
+    )
+
+    for column in wide_columns:
+        if column not in wide.columns:
+            wide = wide.with_columns(pl.lit(None, dtype=pl.Float64).alias(column))
+
+    return wide.select("solver_id", "year", *wide_columns)
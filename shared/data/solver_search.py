@@ -0,0 +1,97 @@
+"""Search over solvers by name, nick, and country, for bounded selection widgets.
+
+Solver identifiers ("Name (Nick) - Country") are split into words that ignore case, accents, and
+punctuation, and the words are kept sorted. A search term then matches a contiguous range of
+words that start with it, found by binary search, so a search costs the same whatever the
+number of solvers. Pages offer the top matches as widget options instead of every solver.
+"""
+
+import polars as pl
+
+from .name_index import comparable_name
+
+# Number of solvers a search returns by default.
+SEARCH_RESULTS_LIMIT = 50
+
+# Sorts after any word, so that [term, term + _WORD_END) spans every word starting with term.
+_WORD_END = "\U0010ffff"
+
+
+def build_search_index(solver_ids):
+    """Build a search index over solver identifiers.
+
+    Args:
+        solver_ids: Identifiers in the order matches should be listed, e.g. by total points
+
+    Returns:
+        DataFrame of (word, order, user_pseudo_id), sorted by word and then order, where `order`
+        is the position of the solver in `solver_ids`
+    """
+    solvers = (pl.DataFrame({"user_pseudo_id": solver_ids}, schema={"user_pseudo_id": pl.String})
+               .with_row_index("order"))
+    return (
+        solvers
+        .with_columns(comparable_name(pl.col("user_pseudo_id")).str.split(" ").alias("word"))
+        .explode("word")
+        .filter(pl.col("word").str.len_chars() > 0)
+        .unique(subset=["word", "order"])
+        .select("word", "order", "user_pseudo_id")
+        .sort(["word", "order"])
+    )
+
+
+def search_solvers(search_index, query, limit=SEARCH_RESULTS_LIMIT):
+    """Return the solvers matching every word of `query`, best matches first.
+
+    A solver matches a query word if one of its words starts with it. Solvers matching more query
+    words in full come first, and ties keep the order of the index. An empty query returns the
+    first solvers of the index.
+
+    Args:
+        search_index: Output of `build_search_index`
+        query: Text typed by the user
+        limit: Maximum number of solvers returned
+
+    Returns:
+        List of up to `limit` solver identifiers
+    """
+    terms = (pl.DataFrame({"query": [query or ""]})
+             .select(comparable_name(pl.col("query")).str.split(" "))
+             .get_column("query")
+             .explode()
+             .drop_nulls()
+             .unique(maintain_order=True)
+             .to_list())
+    terms = [term for term in terms if term]
+
+    if not terms:
+        return (search_index.select("order", "user_pseudo_id")
+                .unique(subset="order")
+                .sort("order")
+                .head(limit)
+                .get_column("user_pseudo_id")
+                .to_list())
+
+    words = search_index.get_column("word")
+    matches = None
+    for term in terms:
+        start = words.search_sorted(term, side="left")
+        end = words.search_sorted(term + _WORD_END, side="left")
+        term_matches = (
+            search_index.slice(start, end - start)
+            .group_by("order")
+            .agg(pl.col("user_pseudo_id").first(),
+                 (pl.col("word") == term).any().cast(pl.UInt32).alias("full_words"))
+        )
+        if matches is None:
+            matches = term_matches
+        else:
+            matches = (matches.join(term_matches.select("order", "full_words"), on="order")
+                       .with_columns(pl.col("full_words") + pl.col("full_words_right"))
+                       .drop("full_words_right"))
+
+    return (matches
+            .sort(["full_words", "order"], descending=[True, False])
+            .head(limit)
+            .get_column("user_pseudo_id")
+            .to_list())
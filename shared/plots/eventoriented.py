@@ -202,24 +202,35 @@ def create_esc_leaderboard_chart(full_df, year=2026, top_n=10,
 
 def create_violin_chart(full_df, selected_solvers, year_subset=(2024,),
                         competition="GP",
-                        colors=[matplotlib.cm.Set2(i) for i in range(8)]):
-    """This shows point distributions and select solver positions by round."""
+                        colors=[matplotlib.cm.Set2(i) for i in range(8)],
+                        statistics=None):
+    """This shows point distributions and select solver positions by round.
+
+    The distributions are the sorted scores of `statistics` (see `round_statistics`), which is
+    computed from `full_df` when not given. Only the selected solvers are flattened.
+    """
+    if statistics is None:
+        statistics = shared.data.round_statistics(full_df, competitions=(competition,))
+
     flattened = shared.data.create_flat_dataset(
-        full_df, metric="points", competition=competition)
+        full_df.filter(pl.col("user_pseudo_id").is_in(selected_solvers)),
+        metric="points", competition=competition)
 
     names = shared.utils.ids_to_names(flattened, selected_solvers)
 
-    rounds = []
-    year_starts = []
+    competition_statistics = statistics.filter(pl.col("competition") == competition)
+
+    distributions = {}
     for year in year_subset:
-        year_starts.append(f"{year}_1")
-        num_rounds = shared.competitions.get_max_round(year, competition=competition)
-        if num_rounds is None:
+        if shared.competitions.get_max_round(year, competition=competition) is None:
             raise ValueError(f"Year \"{year}\" not found: update `get_max_round`")
-        for competition_round in range(1, num_rounds + 1):
-            column = f"{year}_{competition_round}"
-            if column in flattened:
-                rounds.append(column)
+        year_statistics = (competition_statistics
+                           .filter(pl.col("year") == year)
+                           .sort("round")
+                           .select("round", "scores"))
+        for competition_round, scores in year_statistics.iter_rows():
+            distributions[f"{year}_{competition_round}"] = np.array(scores)
+    rounds = list(distributions)
 
     fig, ax = plt.subplots(nrows=1, ncols=len(rounds), sharey=True)
 
@@ -229,12 +240,7 @@ def create_violin_chart(full_df, selected_solvers, year_subset=(2024,),
         ax = [ax]
 
     for idx, column in enumerate(rounds):
-        data = flattened.select(pl.col(column).cast(pl.Float32).drop_nulls())
-
-        if len(data) == 0:
-            continue
-
-        ax[idx].violinplot(data, showmeans=True, showmedians=True)
+        ax[idx].violinplot(distributions[column], showmeans=True, showmedians=True)
         ax[idx].spines['top'].set_visible(False)
         ax[idx].spines['right'].set_visible(False)
         if idx != 0:
@@ -248,7 +254,11 @@ def create_violin_chart(full_df, selected_solvers, year_subset=(2024,),
             if solver_row.height < 1:
                 raise ValueError(
                     f"Expected 1 row for solver \"{solver}\", found {solver_row.height}")
-            score = solver_row.get_column(column).cast(pl.Float64).fill_null(0).item()
+            if column in solver_row.columns:
+                score = solver_row.get_column(column).cast(pl.Float64).fill_null(0).item()
+            else:
+                # None of the selected solvers played this round
+                score = 0
             if idx == 0:
                 label = names[solver]
             else:
@@ -281,28 +291,19 @@ def create_point_trend_chart(full_df, selected_solvers, year=2024, competition="
     wsc_rounds = shared.competitions.wsc_rounds_by_year()
 
     labels = subset.get_column("Name")
-    cumulative = [[] for _ in labels]
     round_columns = []
     round_labels = []
 
-    counter = 0
     for competition_round in range(1, num_rounds + 1):
         # WSC skips over some rounds in their numbering
         if competition == "WSC" and competition_round not in wsc_rounds[year]:
             continue
-        # Maintaining a round counter instead of relying on the round number,
-        # because of non-existent round numbers in many WSC years.
-        counter += 1
         round_labels.append(f"{year}_{competition_round}")
         round_columns.append(f"{competition}_t{competition_round} points")
-        if competition == "GP":
-            round_limit = 6
-        else:
-            round_limit = counter
-        top_k_sums = shared.utils.sum_top_k_of_n_rounds(
-            subset, counter, round_limit, round_columns, competition)
-        for index, row in enumerate(top_k_sums.iter_rows()):
-            cumulative[index].append(row[0])
+
+    round_limit = 6 if competition == "GP" else None
+    cumulative = shared.utils.cumulative_top_k_sums(
+        subset, round_columns, round_limit).rows()
 
     fig, ax = plt.subplots()
     for index, items in enumerate(labels):
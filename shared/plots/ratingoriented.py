@@ -7,19 +7,12 @@ import matplotlib.ticker
 import polars as pl
 import streamlit as st
 
+import shared.solvers
+
 
 def _build_solver_series(timeseries_df, selected_solvers):
     """Return per-solver DataFrames filtered and sorted by comp_idx, keyed by solver id."""
-    result = {}
-    for solver in selected_solvers:
-        df = (
-            timeseries_df
-            .filter(pl.col("user_pseudo_id") == solver)
-            .sort("comp_idx")
-        )
-        if not df.is_empty():
-            result[solver] = df
-    return result
+    return shared.solvers.solver_rating_series(timeseries_df, selected_solvers)
 
 
 def _extend_series_to_latest(xs, ys, max_comp_idx):
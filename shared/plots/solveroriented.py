@@ -16,18 +16,28 @@ import shared.utils
 
 def create_trend_chart(full_df, selected_solvers, metric="points", window_size=8,
                        as_percent_of_max=False, included_events=("gp", "wsc"),
-                       colors=[matplotlib.cm.Set2(i) for i in range(8)]):
+                       colors=[matplotlib.cm.Set2(i) for i in range(8)], statistics=None,
+                       chart_data=None):
     """This shows performance across all competitions and rounds.
     
     Each dot is a round.
     Lines are averages over `window_size` rounds.
+    `statistics` is the output of `round_statistics` for `metric`, computed from `full_df` when
+    not given.
+    `chart_data` is the output of `trend_chart_data` for the same arguments, including
+    `window_size` among its window sizes. When given, the chart only draws it.
     """
     shared.utils.validate_competitions(included_events)
     if len(included_events) == 0:
         return None
 
-    data, rolling, year_starts, years_with_data = shared.solvers.create_data_for_trend_chart(
-        full_df, metric, as_percent_of_max, selected_solvers, included_events, window_size)
+    if chart_data is None:
+        data, rolling, year_starts, years_with_data = shared.solvers.create_data_for_trend_chart(
+            full_df, metric, as_percent_of_max, selected_solvers, included_events, window_size,
+            statistics=statistics)
+    else:
+        data, rolling_by_window, year_starts, years_with_data = chart_data
+        rolling = rolling_by_window[window_size]
 
     xticks = year_starts
     xlabels = years_with_data
@@ -111,46 +121,37 @@ def create_rank_chart(
         solver,
         included_events=("GP", "WSC"),
         use_gp_playoffs=True,
-        colors=[matplotlib.cm.Set2(i) for i in range(8)]):
+        colors=[matplotlib.cm.Set2(i) for i in range(8)],
+        performance_table=None):
     """This shows a solver's rank for each competition.
 
     This shows the years they participated in, and every year in between.
     This adds stars for top-3 performance.
         - Position for the WSC includes playoff results
         - Position for the GP does not include playoffs, which I could not find
+
+    The ranks are looked up in `performance_table` (see `build_performance_table`), which is
+    built from `full_df` with `use_gp_playoffs` when not given.
     """
     shared.utils.validate_competitions(included_events)
     if len(included_events) == 0:
         return None
 
-    years = shared.utils.applicable_years(full_df, [solver])
-
-    df = full_df.with_columns(pl.col("Points").cast(pl.Float32).alias("Points"))
-
-    wsc_years = (sorted(full_df.filter((pl.col("WSC_entry") == 1) & pl.col("year").is_not_null())
-                        .get_column("year").unique().to_list()))
-    esc_years = []
-    if "ESC_total" in full_df.columns:
-        esc_years = sorted(full_df.filter(
-            pl.col("ESC_total").is_not_null() & pl.col("year").is_not_null())
-            .get_column("year").unique().to_list())
-    performances = shared.solvers.PerformanceCollector(solver, included_events, wsc_years,
-                                                       esc_years=esc_years)
-
-    for year in years:
-        subset = df.filter(pl.col("year") == year)
+    profiles = shared.solvers.SolverProfiles(full_df, [solver])
+    years = profiles.years()[solver]
 
-        performances.gp_performance_by_solver_year(subset, year, use_playoffs=use_gp_playoffs)
-        performances.wsc_performance_by_solver_year(subset, year)
-        performances.esc_performance_by_solver_year(subset, year)
+    if performance_table is None:
+        performance_table = shared.solvers.build_performance_table(
+            full_df, use_gp_playoffs=use_gp_playoffs)
+    solver_results = profiles.rank_outcomes(performance_table, included_events)[solver]
 
-    competition_labels = performances.solver_results.all_competition_names()
-    competition_results = performances.solver_results.all_competition_results()
-    outcome_labels = performances.solver_results.all_competition_outcome_descriptions()
+    competition_labels = solver_results.all_competition_names()
+    competition_results = solver_results.all_competition_results()
+    outcome_labels = solver_results.all_competition_outcome_descriptions()
 
     fig = rank_chart_figure(
         competition_labels, competition_results, outcome_labels, years, colors,
-        shared.utils.ids_to_names(full_df, [solver])[solver])
+        profiles.names()[solver])
 
     return fig
 
@@ -7,6 +7,8 @@ import streamlit as st
 import streamlit.components.v1 as components
 import streamlit_theme
 
+import shared.data.solver_search
+
 GA_MEASUREMENT_ID = "G-QQC8GHVLBD"
 
 def inject_analytics():
@@ -95,3 +97,16 @@ def global_setup_and_display(page_name: Optional[str] = None):
     inject_css()
     configure_matplotlib()
     global_header()
+
+
+def solver_search_options(search_index, key, always_include=(),
+                          limit=shared.data.solver_search.SEARCH_RESULTS_LIMIT):
+    """Show a solver search box and return the options for the solver widget beneath it.
+
+    Only the best `limit` matches are offered, so the widget stays small however many solvers
+    there are. Solvers in `always_include` (the current selection) are listed first so that a new
+    search never drops them.
+    """
+    query = st.text_input("Search solvers", key=key, placeholder="Name, nick, or country")
+    matches = shared.data.solver_search.search_solvers(search_index, query, limit)
+    return list(dict.fromkeys([*always_include, *matches]))
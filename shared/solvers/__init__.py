@@ -1,4 +1,6 @@
 """This contains code oriented on solvers."""
 
-from .performancecollector import PerformanceCollector
-from .utils import (create_data_for_trend_chart, dataframe_by_solvers)
+from .performancecollector import PerformanceCollector, build_performance_table, competition_years
+from .profiles import SolverProfiles, solver_rating_series
+from .utils import (create_data_for_trend_chart, dataframe_by_solvers, rolling_means,
+                    trend_chart_data, SMOOTHING_WINDOWS)
@@ -6,150 +6,216 @@ import polars as pl
 
 from .. import competitions, utils
 
-class PerformanceCollector():
-    """
-    A class to calculate a solver's relative performance in different competitions.
+# The first GP year with results, after which every year counts as a GP year for a solver.
+FIRST_GP_YEAR = 2014
+
+PERFORMANCE_SCHEMA = {
+    "user_pseudo_id": pl.String,
+    "competition": pl.String,
+    "year": pl.Int64,
+    "percentile": pl.Float64,
+    "rank": pl.Float64,
+    "total": pl.UInt32,
+    "official": pl.Boolean,
+}
+
+def _gp_performances(df, use_playoffs):
+    """Rank every GP participant within their year."""
+    if use_playoffs:
+        percentile = pl.col("Rank").rank(descending=True) / pl.col("Rank").is_not_null().sum()
+        rank = pl.col("Rank").rank()
+    else:
+        points = pl.col("Points").cast(pl.Float32)
+        percentile = points.rank() / pl.len()
+        rank = points.rank(descending=True)
+
+    return (
+        df.filter(pl.col("year") >= FIRST_GP_YEAR)
+        .with_columns(
+            percentile.over("year").alias("percentile"),
+            rank.over("year").alias("rank"),
+            pl.col("Total GPs").is_not_null().sum().over("year").alias("total"),
+            pl.lit(True).alias("official"),
+        )
+        .filter(pl.col("Total GPs").is_not_null())
+    )
+
+def _wsc_performances(df):
+    """Rank every WSC participant within their year.
+
+    Official participants are ranked among official participants only, and unofficial ones among
+    all participants. The total is of all participants either way.
     """
-    LABEL_NO_RECORD = "    N/A (No record found)"
+    official = pl.col("Official") == 1
+    entry = pl.col("WSC_entry") == 1
+
+    official_percentile = (
+        pl.when(official).then(pl.col("Official_rank")).rank(descending=True) / official.sum())
+    unofficial_percentile = (
+        pl.when(entry).then(pl.col("Unofficial_rank")).rank(descending=True) / entry.sum())
+
+    return (
+        df.with_columns(
+            pl.col("Official").fill_null(False).alias("official"),
+            official_percentile.over("year").alias("official_percentile"),
+            unofficial_percentile.over("year").alias("unofficial_percentile"),
+            pl.col("WSC_entry").is_not_null().sum().over("year").alias("total"),
+        )
+        .filter(pl.col("WSC_entry").fill_null(False))
+        .with_columns(
+            pl.when(pl.col("official"))
+            .then(pl.col("official_percentile"))
+            .otherwise(pl.col("unofficial_percentile"))
+            .alias("percentile"),
+            pl.when(pl.col("official"))
+            .then(pl.col("Official_rank"))
+            .otherwise(pl.col("Unofficial_rank"))
+            .alias("rank"),
+        )
+    )
 
-    def __init__(self, solver, included_competitions, wsc_years, esc_years=None):
-        """Initiative the object and its internal results list."""
-        self.solver = solver
-        self.included_competitions = included_competitions
-        self.wsc_years = wsc_years
-        self.esc_years = esc_years or []
-        self._solver_results = competitions.CompetitionResultsCollector()
+def _esc_performances(df):
+    """Rank every ESC participant within their year.
 
-    def gp_performance_by_solver_year(self, subset, year, use_playoffs=True):
-        """Calculate the outcomes in the GP for the solver in `year`."""
-        if "gp" in self.included_competitions and year >= 2014:
-            if use_playoffs:
-                subset = subset.with_columns(
-                    (pl.col("Rank")
-                     .rank(descending=True) / pl.col("Rank").is_not_null().sum())
-                     .alias("percentile")
-                )
-                subset = subset.with_columns(pl.col("Rank").rank().alias("rank"))
-            else:
-                subset = subset.with_columns(
-                    (pl.col("Points").rank() / pl.count()).alias("percentile")
-                )
-                subset = subset.with_columns(pl.col("Points").rank(ascending=False).alias("rank"))
-            total = sum(subset.get_column("Total GPs").is_not_null())
-
-            solver_rows = subset.filter(pl.col("user_pseudo_id") == self.solver)
-
-            played_gp = solver_rows.get_column("Total GPs").is_null().sum() == 0
-
-            if len(solver_rows) < 1 or not played_gp:
-                pctile = 0
-                outcome_label = self.LABEL_NO_RECORD
-            else:
-                pctile = solver_rows.get_column("percentile").first()
-                rank = int(solver_rows.get_column("rank").first())
-                ordinal_pctile = utils.ordinal_suffix(math.floor(pctile * 100))
-                ordinal_rank = utils.ordinal_suffix(rank)
-                label_prefix = "\U00002606" if rank <= 3 else "   "
-                outcome_label = (f"{label_prefix} {ordinal_pctile} "
-                                 f"pctile ({ordinal_rank} of {total})")
-
-            self.solver_results.add_competition(f"{year} GP", pctile, outcome_label)
+    Ranked entries are ranked among ranked entries, and the others by their unofficial rank among
+    all entries that have one.
+    """
+    def field(rank_column):
+        rank = pl.col(rank_column)
+        return (rank.rank(descending=True) / rank.is_not_null().sum()).over("year")
+
+    ranked = pl.col("ESC_rank").is_not_null()
+    return (
+        df.with_columns(
+            ranked.alias("official"),
+            pl.when(ranked)
+            .then(field("ESC_rank"))
+            .otherwise(field("ESC_unofficial_rank"))
+            .alias("percentile"),
+            pl.when(ranked)
+            .then(pl.col("ESC_rank"))
+            .otherwise(pl.col("ESC_unofficial_rank"))
+            .alias("rank"),
+            pl.when(ranked)
+            .then(pl.col("ESC_rank").is_not_null().sum().over("year"))
+            .otherwise(pl.col("ESC_unofficial_rank").is_not_null().sum().over("year"))
+            .alias("total"),
+        )
+        .filter(pl.col("ESC_total").is_not_null())
+    )
 
-        return self.solver_results
+def build_performance_table(full_df, use_gp_playoffs=True):
+    """Calculate the percentile and rank of every solver in every competition and year.
 
-    def wsc_performance_by_solver_year(self, subset, year):
-        """Calculate the outcomes in the WSC for the solver in `year`."""
-        if year not in self.wsc_years or "wsc" not in self.included_competitions:
-            return None
+    This holds a row for each year a solver took part in a competition, so that a solver's rank
+    chart only needs lookups. A null percentile means the solver has no rank in their field.
 
-        solver_record = subset.filter(pl.col("user_pseudo_id") == self.solver)
+    Args:
+        full_df: Solver-year DataFrame merged across competitions (see `merge_unflat_datasets`)
+        use_gp_playoffs: Rank the GP by final rank including playoffs, instead of by points
 
-        # The row won't exist if they didn't do any competition. But if they did any
-        # competition, the row would exist even if the solver did not participate in
-        # the WSC.
-        wsc_entry = solver_record.get_column("WSC_entry").first()
-        participated = len(solver_record) > 0 and wsc_entry is True
+    Returns:
+        DataFrame with the columns of `PERFORMANCE_SCHEMA`, sorted by solver
+    """
+    df = full_df.filter(pl.col("year").is_not_null())
+
+    tables = [(_gp_performances(df, use_gp_playoffs), "GP")]
+    if "WSC_entry" in df.columns:
+        tables.append((_wsc_performances(df), "WSC"))
+    if "ESC_total" in df.columns:
+        tables.append((_esc_performances(df), "ESC"))
+
+    return (
+        pl.concat([
+            table.with_columns(pl.lit(competition).alias("competition"))
+            .select(list(PERFORMANCE_SCHEMA))
+            .cast(PERFORMANCE_SCHEMA)
+            for table, competition in tables
+        ])
+        .sort(["user_pseudo_id", "competition", "year"])
+        .with_columns(pl.col("user_pseudo_id").set_sorted())
+    )
+
+def competition_years(performance_table):
+    """Return the years each competition was held, as {competition: set of years}."""
+    held = performance_table.select("competition", "year").unique()
+    return {competition: set(group.get_column("year"))
+            for (competition,), group in held.group_by("competition")}
 
-        if len(solver_record) > 0:
-            is_official = solver_record.get_column("Official").first() is True
-        else:
-            is_official = True
+class PerformanceCollector():
+    """
+    A class to calculate a solver's relative performance in different competitions.
 
-        if is_official is True:
-            rank_column = "Official_rank"
-            applicable_subset = subset.filter(pl.col('Official') == 1)
-        else:
-            rank_column = "Unofficial_rank"
-            applicable_subset = subset.filter(pl.col("WSC_entry") == 1)
+    Outcomes are looked up in a table built by `build_performance_table`.
+    """
+    LABEL_NO_RECORD = "    N/A (No record found)"
 
-        applicable_subset = applicable_subset.with_columns(
-            (pl.col(rank_column).rank(descending=True) / pl.count()).alias("percentile")
-        )
+    def __init__(self, solver, included_competitions, performance_table, held_years=None):
+        """Initiative the object and its internal results list.
 
-        total = len(applicable_subset)
+        `held_years` is the output of `competition_years`, which is derived from
+        `performance_table` when not given. It must be given when the table only holds some
+        solvers.
+        """
+        self.solver = solver
+        self.included_competitions = included_competitions
+        self._solver_results = competitions.CompetitionResultsCollector()
 
-        if not participated or (len(applicable_subset) == 0 and len(subset) == 0):
+        if held_years is None:
+            held_years = competition_years(performance_table)
+        self.wsc_years = held_years.get("WSC", set())
+        self.esc_years = held_years.get("ESC", set())
+
+        # The table is sorted by solver, so the solver's rows are found by binary search.
+        ids = performance_table.get_column("user_pseudo_id")
+        start = ids.search_sorted(solver, side="left")
+        end = ids.search_sorted(solver, side="right")
+        self._outcomes = {
+            (row["competition"], row["year"]): row
+            for row in performance_table.slice(start, end - start).iter_rows(named=True)
+        }
+
+    def _add_outcome(self, competition, year):
+        """Add the solver's outcome in `competition` and `year` to the results."""
+        outcome = self._outcomes.get((competition, year))
+
+        if outcome is None or outcome["percentile"] is None:
             pctile = 0
             outcome_label = self.LABEL_NO_RECORD
         else:
-            row_in_applicable_subset = applicable_subset.filter(
-                pl.col("user_pseudo_id") == self.solver)
-            total = subset.get_column("WSC_entry").is_not_null().sum()
-            pctile = row_in_applicable_subset.get_column("percentile").first()
-            rank = row_in_applicable_subset.get_column(rank_column).first()
+            pctile = outcome["percentile"]
+            rank = int(outcome["rank"])
             ordinal_pctile = utils.ordinal_suffix(math.floor(pctile * 100))
-            ordinal_rank = utils.ordinal_suffix(int(rank))
+            ordinal_rank = utils.ordinal_suffix(rank)
             label_prefix = "\U00002606" if rank <= 3 else "   "
             outcome_label = (f"{label_prefix} {ordinal_pctile} "
-                             f"pctile ({ordinal_rank} of {total})")
-            if not is_official:
+                             f"pctile ({ordinal_rank} of {outcome['total']})")
+            if not outcome["official"]:
                 outcome_label += "*"
 
-        self.solver_results.add_competition(f"{year} WSC", pctile, outcome_label)
+        self.solver_results.add_competition(f"{year} {competition}", pctile, outcome_label)
+
+    def gp_performance_by_solver_year(self, year):
+        """Add the outcome in the GP for the solver in `year`."""
+        if "gp" in self.included_competitions and year >= FIRST_GP_YEAR:
+            self._add_outcome("GP", year)
 
         return self.solver_results
 
-    def esc_performance_by_solver_year(self, subset, year):
-        """Calculate the outcomes in the ESC for the solver in `year`."""
-        if year not in self.esc_years or "esc" not in self.included_competitions:
+    def wsc_performance_by_solver_year(self, year):
+        """Add the outcome in the WSC for the solver in `year`."""
+        if year not in self.wsc_years or "wsc" not in self.included_competitions:
             return None
 
-        solver_record = subset.filter(pl.col("user_pseudo_id") == self.solver)
-        participated = (len(solver_record) > 0 and
-                        not solver_record.get_column("ESC_total").is_null().all())
-
-        if participated and solver_record.get_column("ESC_rank").first() is not None:
-            rank_column = "ESC_rank"
-            applicable_subset = subset.filter(pl.col("ESC_rank").is_not_null())
-        else:
-            rank_column = "ESC_unofficial_rank"
-            applicable_subset = subset.filter(pl.col("ESC_unofficial_rank").is_not_null())
-
-        applicable_subset = applicable_subset.with_columns(
-            (pl.col(rank_column).rank(descending=True) / pl.len()).alias("percentile")
-        )
+        self._add_outcome("WSC", year)
+        return self.solver_results
 
-        total = len(applicable_subset)
+    def esc_performance_by_solver_year(self, year):
+        """Add the outcome in the ESC for the solver in `year`."""
+        if year not in self.esc_years or "esc" not in self.included_competitions:
+            return None
 
-        if not participated or total == 0:
-            pctile = 0
-            outcome_label = self.LABEL_NO_RECORD
-        else:
-            row = applicable_subset.filter(pl.col("user_pseudo_id") == self.solver)
-            if len(row) == 0:
-                pctile = 0
-                outcome_label = self.LABEL_NO_RECORD
-            else:
-                pctile = row.get_column("percentile").first()
-                rank = row.get_column(rank_column).first()
-                ordinal_pctile = utils.ordinal_suffix(math.floor(pctile * 100))
-                ordinal_rank = utils.ordinal_suffix(int(rank))
-                label_prefix = "\U00002606" if rank <= 3 else "   "
-                suffix = "" if rank_column == "ESC_rank" else "*"
-                outcome_label = (f"{label_prefix} {ordinal_pctile} "
-                                 f"pctile ({ordinal_rank} of {total}){suffix}")
-
-        self.solver_results.add_competition(f"{year} ESC", pctile, outcome_label)
+        self._add_outcome("ESC", year)
         return self.solver_results
 
     @property
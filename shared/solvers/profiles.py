@@ -0,0 +1,96 @@
+"""Gather what the solver page shows about several solvers at once."""
+
+import polars as pl
+
+from .. import utils
+from .performancecollector import PerformanceCollector, competition_years
+from .utils import create_data_for_trend_chart
+
+def solver_rating_series(timeseries_df, solver_ids):
+    """Return each solver's rating timeseries, sorted by comp_idx and keyed by solver id.
+
+    Solvers without any rating are left out. The solvers are selected with a single filter, and
+    the result follows the order of `solver_ids`.
+    """
+    by_solver = (
+        timeseries_df
+        .filter(pl.col("user_pseudo_id").is_in(solver_ids))
+        .sort("comp_idx", maintain_order=True)
+        .partition_by("user_pseudo_id", as_dict=True)
+    )
+    return {solver: by_solver[(solver,)] for solver in solver_ids if (solver,) in by_solver}
+
+class SolverProfiles():
+    """
+    A class to compute the statistics of several solvers together.
+
+    The rows of all solvers are selected from each source with one filter, and each statistic is
+    computed for all of them in one pass, so comparing ten solvers costs about as much as showing
+    one.
+    """
+    def __init__(self, full_df, solver_ids):
+        """Select the solvers' rows from the solver-year DataFrame merged across competitions."""
+        self.full_df = full_df
+        self.solver_ids = list(dict.fromkeys(solver_ids))
+        self.rows = full_df.filter(pl.col("user_pseudo_id").is_in(self.solver_ids))
+
+    def names(self):
+        """Return the name of each solver, from their first row."""
+        return utils.ids_to_names(self.rows, self.solver_ids)
+
+    def years(self):
+        """Return the years from each solver's first to last year, keyed by solver id.
+
+        As in `applicable_years`, this includes the years in between that the solver skipped.
+        """
+        all_years = [year for year in utils.all_available_years(self.full_df) if year is not None]
+        spans = dict(
+            (solver, (first, last)) for solver, first, last in
+            self.rows.filter(pl.col("year").is_not_null())
+            .group_by("user_pseudo_id")
+            .agg(pl.col("year").min().alias("first"), pl.col("year").max().alias("last"))
+            .iter_rows())
+        years = {}
+        for solver in self.solver_ids:
+            if solver not in spans:
+                years[solver] = []
+                continue
+            first, last = spans[solver]
+            years[solver] = [year for year in all_years if first <= year <= last]
+        return years
+
+    def rank_outcomes(self, performance_table, included_competitions):
+        """Return each solver's competition outcomes, keyed by solver id.
+
+        Args:
+            performance_table: Output of `build_performance_table`
+            included_competitions: Competitions to include, in lowercase
+
+        Returns:
+            Dictionary of solver id to a `CompetitionResultsCollector`, with the solver's outcome
+            in each included competition for every year of `years`
+        """
+        held_years = competition_years(performance_table)
+        table = performance_table.filter(pl.col("user_pseudo_id").is_in(self.solver_ids))
+
+        outcomes = {}
+        for solver, years in self.years().items():
+            performances = PerformanceCollector(solver, included_competitions, table,
+                                                held_years=held_years)
+            for year in years:
+                performances.gp_performance_by_solver_year(year)
+                performances.wsc_performance_by_solver_year(year)
+                performances.esc_performance_by_solver_year(year)
+            outcomes[solver] = performances.solver_results
+        return outcomes
+
+    def trend_points(self, metric, as_percent_of_max, included_events, window_size,
+                     statistics=None):
+        """Return the per-round points of all solvers (see `create_data_for_trend_chart`)."""
+        return create_data_for_trend_chart(
+            self.full_df, metric, as_percent_of_max, self.solver_ids, included_events,
+            window_size, statistics=statistics)
+
+    def rating_series(self, timeseries_df):
+        """Return each solver's rating timeseries (see `solver_rating_series`)."""
+        return solver_rating_series(timeseries_df, self.solver_ids)
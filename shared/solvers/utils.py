@@ -1,26 +1,86 @@
 """Utility functions for solvers."""
 
+import numpy as np
 import polars as pl
 
 from .. import data as shared_data, competitions, utils
 
+# Window sizes offered for smoothing the trend chart.
+SMOOTHING_WINDOWS = tuple(range(1, 21))
+
+def rolling_means(outcomes, window_sizes=SMOOTHING_WINDOWS):
+    """Calculate the moving averages of a round series for several window sizes at once.
+
+    Each matches `pl.Series(outcomes).rolling_mean(window_size, min_periods=1)`: the mean of the
+    rounds played among the last `window_size`, or null if none were. All window sizes are read
+    off the same cumulative sums.
+
+    Returns:
+        Dictionary of window size to a Float64 Series as long as `outcomes`
+    """
+    values = pl.Series(outcomes, dtype=pl.Float64).to_numpy()
+    played = ~np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(played, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(played)))
+
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - np.array(window_sizes)[:, np.newaxis], 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = (sums[ends] - sums[starts]) / (counts[ends] - counts[starts])
+
+    return {window_size: pl.Series(means[index], nan_to_null=True)
+            for index, window_size in enumerate(window_sizes)}
+
 def create_data_for_trend_chart(
-    full_df, metric, as_percent_of_max, selected_solvers, included_events, window_size):
+    full_df, metric, as_percent_of_max, selected_solvers, included_events, window_size,
+    statistics=None):
     """Claculate the data needed for the solver trend chart."""
-    flattened_gp = shared_data.create_flat_dataset(full_df, metric=metric)
-    flattened_wsc = shared_data.create_flat_dataset(full_df, metric=metric, competition="WSC")
+    data, rolling, year_starts, years_with_data = trend_chart_data(
+        full_df, metric, as_percent_of_max, selected_solvers, included_events,
+        window_sizes=(window_size,), statistics=statistics)
+    return data, rolling[window_size], year_starts, years_with_data
+
+def trend_chart_data(
+    full_df, metric, as_percent_of_max, selected_solvers, included_events,
+    window_sizes=SMOOTHING_WINDOWS, statistics=None):
+    """Calculate the trend chart data with its moving averages for several window sizes.
+
+    Only the selected solvers' rows are flattened. The rounds on the axis, and the best results
+    that points are a percentage of, come from `statistics` (see `round_statistics`), which is
+    computed from `full_df` when not given.
+
+    Returns:
+        As `create_data_for_trend_chart`, except that the moving averages are keyed by window size
+        and then by name
+    """
+    if statistics is None:
+        statistics = shared_data.round_statistics(full_df, metric=metric)
+
+    solver_rows = dataframe_by_solvers(full_df, selected_solvers)
+    flattened_gp = shared_data.create_flat_dataset(solver_rows, metric=metric)
+    flattened_wsc = shared_data.create_flat_dataset(solver_rows, metric=metric, competition="WSC")
     datasets = [flattened_gp, flattened_wsc]
     suffixes = ["_gp", "_wsc"]
     if any(c.startswith("ESC_t") for c in full_df.columns):
-        flattened_esc = shared_data.create_flat_dataset(full_df, metric=metric, competition="ESC")
+        flattened_esc = shared_data.create_flat_dataset(
+            solver_rows, metric=metric, competition="ESC")
         datasets.append(flattened_esc)
         suffixes.append("_esc")
-    together = shared_data.merge_flat_datasets(datasets, tuple(suffixes))
+    subset = shared_data.merge_flat_datasets(datasets, tuple(suffixes))
 
-    if as_percent_of_max:
-        together = utils.convert_columns_to_max_pct(together)
+    # Rounds that none of the selected solvers played still take their place on the axis.
+    round_maxima = {
+        f"{year}_{competition_round}_{competition.lower()}": best
+        for competition, year, competition_round, best in
+        statistics.select("competition", "year", "round", "max").iter_rows()
+        if f"_{competition.lower()}" in suffixes
+    }
+    subset = subset.with_columns([pl.lit(None, dtype=pl.Float32).alias(column)
+                                  for column in round_maxima if column not in subset.columns])
 
-    subset = dataframe_by_solvers(together, selected_solvers)
+    if as_percent_of_max:
+        subset = subset.with_columns([subset.get_column(column).cast(pl.Float32) / best
+                                      for column, best in round_maxima.items()])
 
     year_subset = utils.applicable_years(full_df, selected_solvers)
     years_with_data = []
@@ -47,7 +107,7 @@ def create_data_for_trend_chart(
                         subset = subset.with_columns(pl.col(column).cast(pl.Float32).alias(column))
 
     data = { "Round": rounds }
-    rolling = {}
+    rolling = {window_size: {} for window_size in window_sizes}
 
     for solver in selected_solvers:
         solver_row = subset.filter(pl.col("user_pseudo_id") == solver)
@@ -57,7 +117,8 @@ def create_data_for_trend_chart(
         outcomes = record.select(rounds).row(0)
         name = record.get_column("Name").first()
         data[name] = outcomes
-        rolling[name] = pl.Series(outcomes).rolling_mean(window_size, min_periods=1)
+        for window_size, means in rolling_means(outcomes, window_sizes).items():
+            rolling[window_size][name] = means
 
     return data, rolling, year_starts, years_with_data
 
@@ -1,6 +1,7 @@
 """Contains general utility functions."""
 
 import re
+import numpy as np
 import polars as pl
 
 import shared.competitions
@@ -39,40 +40,71 @@ def applicable_years(full_df, selected_solvers):
 
 def ids_to_names(df_with_names, selected_solvers, name_column="Name"):
     """Return the name for an identifier, using the first matched row."""
+    first_rows = (df_with_names
+                  .filter(pl.col("user_pseudo_id").is_in(selected_solvers))
+                  .unique(subset="user_pseudo_id", keep="first", maintain_order=True))
+    found = dict(zip(first_rows.get_column("user_pseudo_id"), first_rows.get_column(name_column)))
+
     names = {}
     for solver_id in selected_solvers:
-        matching_rows = (
-            df_with_names.filter(pl.col("user_pseudo_id") == solver_id).get_column(name_column))
-        if len(matching_rows) == 0:
+        if solver_id not in found:
             raise ValueError(f"Found 0 matching rows for id {solver_id}")
-        names[solver_id] = matching_rows.first()
+        names[solver_id] = found[solver_id]
 
     return names
 
-def sum_top_k_of_n_rounds(full_df, n, k, round_columns, competition="GP"):
-    """Calculate the sum of the best `k` of `n` rounds."""
-    round_point_columns = []
-    found_rounds = 0
-    for competition_round in range(1, shared.competitions.MAXIMUM_ROUND + 1):
-        col_name = f"{competition}_t{competition_round} points"
-        if col_name not in full_df or col_name not in round_columns:
-            continue
-        found_rounds += 1
-        round_point_columns.append(col_name)
-        if found_rounds == n:
-            break
+def cumulative_top_k_sums(full_df, round_columns, k=None):
+    """Calculate the sum of the best `k` rounds among the first n, for every n at once.
 
-    applicable_point_df = full_df.select(round_point_columns)
+    The points of every solver are laid out as one array of (solver, n, round), where rounds
+    after the n-th are masked out. A single sort along the rounds then gives every prefix's
+    best rounds, instead of one pass per round. Unplayed rounds, including columns absent from
+    `full_df`, add nothing.
 
-    transposed_df = applicable_point_df.transpose()
+    Args:
+        full_df: DataFrame with a row per solver
+        round_columns: Round points columns, in the order the rounds were held
+        k: Number of rounds that count, or None to count every round
+
+    Returns:
+        DataFrame with a Float64 column per entry of `round_columns`, holding the best `k` of
+        the rounds up to and including it, in the row order of `full_df`. The last column is
+        the standing after all rounds, e.g. the GP's best 6 of 8. Without any `round_columns`,
+        the DataFrame is empty.
+    """
+    if not round_columns:
+        return pl.DataFrame()
 
-    row_top_k_sum = transposed_df.select([
-        pl.col(c).top_k(k).sum().alias(c) for c in transposed_df.columns
-    ])
+    points = full_df.select([
+        (pl.col(column) if column in full_df.columns else pl.lit(None)).cast(pl.Float64)
+        .alias(column) for column in round_columns
+    ]).to_numpy()
 
-    row_top_k_sum_transposed = row_top_k_sum.transpose()
+    num_rounds = len(round_columns)
+    in_prefix = np.tri(num_rounds, dtype=bool)
+    prefixes = np.where(in_prefix, points[:, np.newaxis, :], np.nan)
 
-    return row_top_k_sum_transposed
+    # Sorting the negated points puts the best rounds first and the masked ones (NaN) last
+    best_first = -np.sort(-prefixes, axis=-1)
+    sums = np.nansum(best_first[..., :k], axis=-1)
+
+    return pl.DataFrame(sums, schema={column: pl.Float64 for column in round_columns},
+                        orient="row")
+
+def sum_top_k_of_n_rounds(full_df, n, k, round_columns, competition="GP"):
+    """Calculate the sum of the best `k` of `n` rounds."""
+    round_point_columns = []
+    for competition_round in range(1, shared.competitions.MAXIMUM_ROUND + 1):
+        col_name = f"{competition}_t{competition_round} points"
+        if col_name in full_df and col_name in round_columns:
+            round_point_columns.append(col_name)
+    round_point_columns = round_point_columns[:n]
+
+    cumulative = cumulative_top_k_sums(full_df, round_point_columns, k)
+    # Before any round is held, every solver stands at 0 points
+    standing = (cumulative.to_series(-1) if cumulative.width
+                else pl.repeat(0.0, full_df.height, dtype=pl.Float64, eager=True))
+    return standing.alias("column_0").to_frame()
 
 def ordinal_suffix(n):
     """Format numbers as 1st, 2nd, etcetera.
@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+import shared.data.registry
+
+
+@pytest.fixture(autouse=True)
+def solver_registry(tmp_path, monkeypatch):
+    """Point the solver registry at a temporary file, so tests never touch the real one."""
+    path = tmp_path / "solver_registry.parquet"
+    monkeypatch.setattr(shared.data.registry, "REGISTRY_PATH", str(path))
+    return path
@@ -0,0 +1,46 @@
+"""Tests for the snapshotted cross-competition dataset."""
+
+import polars as pl
+import pytest
+
+import shared.data.loaders.combined as combined_loader
+import shared.data.manipulation
+
+
+@pytest.fixture(scope="module")
+def snapshot_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("snapshots"))
+
+
+class TestLoadCombined:
+    def test_matches_direct_merge(self, snapshot_dir):
+        combined, available = combined_loader.load_combined(snapshot_dir=snapshot_dir)
+        expected = shared.data.manipulation.merge_unflat_datasets(
+            combined_loader.load_gp_snapshot(snapshot_dir=snapshot_dir),
+            combined_loader.load_mapped_wsc(),
+            extra_datasets=[combined_loader.load_mapped_esc()],
+        )
+        assert combined.columns == expected.columns
+        assert combined.sort(pl.all(), nulls_last=True).equals(
+            expected.sort(pl.all(), nulls_last=True))
+        assert set(available) == set(
+            combined.get_column("user_pseudo_id").drop_nulls().unique())
+
+    def test_snapshot_reused(self, snapshot_dir, monkeypatch):
+        first, _ = combined_loader.load_combined(snapshot_dir=snapshot_dir)
+        monkeypatch.setattr(shared.data.manipulation, "merge_unflat_datasets",
+                            lambda *args, **kwargs: pytest.fail("rebuilt"))
+        second, _ = combined_loader.load_combined(snapshot_dir=snapshot_dir)
+        assert second.equals(first)
+
+
+class TestCompetitionRoundStatistics:
+    @pytest.mark.parametrize("competition", ["GP", "WSC", "ESC"])
+    def test_matches_combined_statistics(self, snapshot_dir, competition, monkeypatch, tmp_path):
+        expected = combined_loader.load_round_statistics(snapshot_dir=snapshot_dir).filter(
+            pl.col("competition") == competition)
+        monkeypatch.setattr(shared.data.manipulation, "merge_unflat_datasets",
+                            lambda *args, **kwargs: pytest.fail("merged"))
+        statistics = combined_loader.load_competition_round_statistics(
+            competition, snapshot_dir=str(tmp_path))
+        assert statistics.equals(expected)
@@ -1,6 +1,7 @@
 """Tests for data manipulation functions — generalized for GP, WSC, and ESC."""
 
 import polars as pl
+import polars.selectors as cs
 import pytest
 
 from shared.data.manipulation import (
@@ -8,6 +9,8 @@ from shared.data.manipulation import (
     merge_flat_datasets,
     merge_unflat_datasets,
     ids_by_total_points,
+    round_statistics,
+    with_round_positions,
 )
 
 
@@ -84,6 +87,76 @@ class TestCreateFlatDataset:
         with pytest.raises(ValueError, match="unexpected competition"):
             create_flat_dataset(df, competition="UNKNOWN")
 
+    def test_one_row_per_solver_across_years(self):
+        df = _df([
+            _gp_row("id1", "Alice", 2023, 150, r1=90.0, r2=None),
+            _gp_row("id1", "Alice", 2024, 150, r1=80.0, r2=70.0),
+            _gp_row("id2", "Bob", 2024, 100, r1=60.0, r2=50.0),
+        ])
+        flat = create_flat_dataset(df, metric="points", competition="GP").sort("user_pseudo_id")
+        assert flat.columns == ["user_pseudo_id", "Name", "Country", "Nick",
+                                "2023_1", "2024_1", "2024_2"]
+        assert flat.rows() == [
+            ("id1", "Alice", "XX", "nick", 90.0, 80.0, 70.0),
+            ("id2", "Bob", "XX", "nick", None, 60.0, 50.0),
+        ]
+
+    def test_identity_taken_from_earliest_year(self):
+        df = _df([
+            _wsc_row("id1", None, 2023, 100),
+            _wsc_row("id1", "Alice", 2024, 200),
+            _wsc_row("id1", "Alicia", 2025, 300),
+        ])
+        flat = create_flat_dataset(df, metric="points", competition="WSC")
+        assert flat.get_column("Name").to_list() == ["Alice"]
+        assert flat.get_column("WSC_total").to_list() == [100.0]
+
+
+# ── round_statistics ──────────────────────────────────────────────────────────
+
+class TestRoundStatistics:
+    def _df(self):
+        return _df([
+            _gp_row("id1", "Alice", 2024, 150, r1=100.0, r2=None),
+            _gp_row("id2", "Bob", 2024, 100, r1=60.0, r2=70.0),
+            _gp_row("id3", "Carol", 2024, 100, r1=80.0, r2=None),
+            _gp_row("id1", "Alice", 2023, 150, r1=90.0, r2=None),
+        ])
+
+    def test_one_row_per_round_held(self):
+        statistics = round_statistics(self._df(), metric="points")
+        assert statistics.select("competition", "year", "round", "count", "max").rows() == [
+            ("GP", 2023, 1, 1, 90.0), ("GP", 2024, 1, 3, 100.0), ("GP", 2024, 2, 1, 70.0)]
+
+    def test_distribution_of_a_round(self):
+        statistics = round_statistics(self._df(), metric="points")
+        row = statistics.filter(pl.col("year") == 2024, pl.col("round") == 1).row(0, named=True)
+        assert row["scores"] == [60.0, 80.0, 100.0]
+        assert (row["mean"], row["median"], row["q25"], row["q75"]) == (80.0, 80.0, 70.0, 90.0)
+
+    def test_no_round_columns(self):
+        df = pl.DataFrame({"user_pseudo_id": ["id1"], "year": [2024]})
+        assert round_statistics(df).is_empty()
+
+
+# ── with_round_positions ──────────────────────────────────────────────────────
+
+class TestWithRoundPositions:
+    def test_positions_ranked_within_year_ties_share_best(self):
+        df = pl.DataFrame({
+            "year": [2024, 2024, 2024, 2025],
+            "X_t1 points": [10, 30, 30, 5],
+            "X_t2 points": [None, 20.0, 40.0, 1.0],
+        })
+        ranked = with_round_positions(df, cs.ends_with(" points"))
+        assert ranked["X_t1 position"].to_list() == [3, 1, 1, 1]
+        assert ranked["X_t2 position"].to_list() == [None, 2, 1, 1]
+
+    def test_points_cast_to_float(self):
+        df = pl.DataFrame({"year": [2024], "X_t1 points": [10]})
+        ranked = with_round_positions(df, cs.ends_with(" points"))
+        assert ranked.schema["X_t1 points"] == pl.Float64
+
 
 # ── merge_unflat_datasets ─────────────────────────────────────────────────────
 
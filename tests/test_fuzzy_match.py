@@ -0,0 +1,81 @@
+"""Tests for the blocked fuzzy name matcher."""
+
+import polars as pl
+import pytest
+
+from shared.data.fuzzy_match import CANDIDATE_SCHEMA, overrides_from_candidates, propose_matches
+from shared.data.manipulation import attempted_mapping
+
+
+def _make_gp(rows):
+    """Build a minimal GP DataFrame of (Name, user_pseudo_id) rows."""
+    return pl.DataFrame({
+        "Name": [r[0] for r in rows],
+        "Country": ["Unknown"] * len(rows),
+        "Nick": [None] * len(rows),
+        "user_pseudo_id": [r[1] for r in rows],
+        "year": [2024] * len(rows),
+    }, schema_overrides={"Nick": pl.String})
+
+
+@pytest.fixture
+def gp():
+    return _make_gp([
+        ("Jan Zverina", "Jan Zverina (Nickless) - Czech Rep."),
+        ("Neil Zussman", "Neil Zussman (Nilz) - UK"),
+        ("Alice Smith", "Alice Smith (alice) - USA"),
+        ("Alicia Smithson", "Alicia Smithson (ali) - USA"),
+    ])
+
+
+class TestProposeMatches:
+    def test_reordered_accented_name_scores_full(self, gp):
+        candidates = propose_matches(pl.Series(["Zvěřina Jan"]), gp)
+        best = candidates.row(0, named=True)
+        assert best["user_pseudo_id"] == "Jan Zverina (Nickless) - Czech Rep."
+        assert best["score"] == pytest.approx(1.0)
+        assert best["accepted"]
+
+    def test_extra_middle_name_is_proposed(self, gp):
+        candidates = propose_matches(pl.Series(["Neil Gary Zussman"]), gp)
+        assert candidates.get_column("user_pseudo_id").to_list() == ["Neil Zussman (Nilz) - UK"]
+
+    def test_unrelated_names_are_not_compared(self, gp):
+        candidates = propose_matches(pl.Series(["Bob Jones"]), gp)
+        assert candidates.is_empty()
+        assert candidates.schema == pl.Schema(CANDIDATE_SCHEMA)
+
+    def test_candidates_ranked_and_limited(self, gp):
+        candidates = propose_matches(pl.Series(["Alice Smith"]), gp, top_n=1, min_score=0.0)
+        assert candidates.get_column("rank").to_list() == [1]
+        assert candidates.get_column("user_pseudo_id").to_list() == ["Alice Smith (alice) - USA"]
+
+    def test_tied_candidates_are_not_accepted(self):
+        gp = _make_gp([
+            ("Alice Smith", "Alice Smith (alice1) - USA"),
+            ("Alice Smith", "Alice Smith (alice2) - USA"),
+        ])
+        candidates = propose_matches(pl.Series(["Smith Alice"]), gp)
+        assert len(candidates) == 2
+        assert not candidates.get_column("accepted").any()
+
+
+class TestOverridesFromCandidates:
+    def test_accepted_rows_become_overrides(self, gp):
+        candidates = propose_matches(pl.Series(["zvěřina, jan", "Bob Jones"]), gp)
+        assert overrides_from_candidates(candidates) == {
+            "Zvěřina Jan": "Jan Zverina (Nickless) - Czech Rep.",
+        }
+
+    def test_conflicting_acceptances_raise(self, gp):
+        candidates = propose_matches(pl.Series(["Alice Smith"]), gp, min_score=0.0)
+        candidates = candidates.with_columns(pl.lit(True).alias("accepted"))
+        with pytest.raises(ValueError, match="Alice Smith"):
+            overrides_from_candidates(candidates)
+
+    def test_candidate_table_as_manual_override(self, gp):
+        other = pl.DataFrame({"Name": ["Zvěřina Jan"], "Country": ["CZE"], "year": [2024]})
+        candidates = propose_matches(other.get_column("Name"), gp)
+        mapped = attempted_mapping(other, gp, manual_override=candidates)
+        assert mapped.get_column("user_pseudo_id").to_list() == [
+            "Jan Zverina (Nickless) - Czech Rep."]
@@ -0,0 +1,200 @@
+"""Tests for the GP data loader."""
+
+import os
+import tempfile
+
+import polars as pl
+import pytest
+
+from shared.data.loaders import combined, schemas
+from shared.data.loaders.gp import (
+    add_gp_round, gp_fingerprint, gp_years, ingest_gp_round, load_gp, scan_gp)
+from shared.data.loaders import snapshot
+
+
+def _write_csv(directory, filename, content):
+    path = os.path.join(directory, filename)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+ANNUAL_HEADER = (
+    "#,Name,Country,Nick,"
+    + ",".join(f"GP_t{n} position,GP_t{n} points,GP_t{n} rank. points" for n in range(1, 9))
+    + ",Points,Played GPs,Total GPs,year"
+)
+
+
+def _annual_row(rank, name, country, nick, points, year):
+    rounds = ",".join(f"{rank}.,{points},{points}" for _ in range(1, 9))
+    return f"{rank}.,{name},{country},{nick},{rounds},{points * 6},8,8,{year}"
+
+
+# A repeated header row, as found throughout the scraped result pages.
+ANNUAL_CSV = "\n".join([
+    ANNUAL_HEADER,
+    _annual_row(1, "Alice Smith", "USA", "alice", 100.0, 2024),
+    ANNUAL_HEADER.replace(",year", ",2024"),
+    _annual_row(2, "Bob Jones", "UK", "", 90.0, 2024),
+]) + "\n"
+
+ROUND_1_CSV = """\
+#,Name,Country,Nick,Points,GP_t1 points,GP_t1 rank. points,GP_t1 position,year,round
+1.,Alice Smith,USA,alice,80.5,80.5,80.5,1.,2026,1
+#,Name,Country,Nick,Points,Points,Points,#,2026,1
+2.,Bob Jones,UK,,70,70,70,2.,2026,1
+"""
+
+ROUND_2_CSV = """\
+#,Name,Country,Nick,Points,GP_t2 points,GP_t2 rank. points,GP_t2 position,year,round
+1.,Bob Jones,UK,,60,60,60,1.,2026,2
+2.,Carol White,DE,carol,50,50,50,2.,2026,2
+"""
+
+
+@pytest.fixture
+def gp_directory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_csv(tmpdir, "gp_results2024.csv", ANNUAL_CSV)
+        _write_csv(tmpdir, "gp_results2026_r1.csv", ROUND_1_CSV)
+        _write_csv(tmpdir, "gp_results2026_r2.csv", ROUND_2_CSV)
+        yield tmpdir
+
+
+class TestTypes:
+    def test_numeric_columns_typed(self, gp_directory):
+        gp = load_gp(gp_directory)
+        assert gp["Points"].dtype == pl.Float64
+        assert gp["GP_t1 position"].dtype == pl.Float64
+        assert gp["Played GPs"].dtype == pl.Int32
+        assert gp["year"].dtype == pl.Int32
+        assert gp["Rank"].dtype == pl.Int32
+
+    def test_repeated_headers_dropped(self, gp_directory):
+        gp = load_gp(gp_directory)
+        assert "Name" not in gp["Name"].to_list()
+        assert len(gp.filter(pl.col("year") == 2024)) == 2
+
+    def test_nick_matching_a_header_label_kept(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_csv(tmpdir, "gp_results2024.csv", "\n".join([
+                ANNUAL_HEADER,
+                _annual_row(1, "Alice Smith", "USA", "Points", 100.0, 2024),
+                ANNUAL_HEADER.replace(",year", ",2024"),
+            ]) + "\n")
+            gp = load_gp(tmpdir)
+        assert gp["Nick"].to_list() == ["Points"]
+        assert gp["Points"].to_list() == [600.0]
+
+
+class TestRoundFiles:
+    def test_rounds_merged_into_year(self, gp_directory):
+        year = load_gp(gp_directory).filter(pl.col("year") == 2026)
+        assert sorted(year["Name"].to_list()) == ["Alice Smith", "Bob Jones", "Carol White"]
+
+    def test_points_summed_across_rounds(self, gp_directory):
+        year = load_gp(gp_directory).filter(pl.col("year") == 2026)
+        bob = year.filter(pl.col("Name") == "Bob Jones")
+        assert bob["Points"].item() == pytest.approx(130.0)
+
+    def test_rank_by_points(self, gp_directory):
+        year = load_gp(gp_directory).filter(pl.col("year") == 2026).sort("Rank")
+        assert year["Name"].to_list() == ["Bob Jones", "Alice Smith", "Carol White"]
+
+
+class TestScanGp:
+    def test_years_from_filenames(self, gp_directory):
+        assert gp_years(gp_directory) == [2024, 2026]
+
+    def test_single_year_matches_full_load(self, gp_directory):
+        full = load_gp(gp_directory).filter(pl.col("year") == 2024).drop("solver_id")
+        single = scan_gp(gp_directory, years=[2024]).collect()
+        assert single.columns == full.columns
+        assert single.drop("Rank").equals(full.drop("Rank"))
+
+    def test_single_year_keeps_all_round_columns(self, gp_directory):
+        single = scan_gp(gp_directory, years=[2026]).collect()
+        assert "GP_t8 points" in single.columns
+        assert single["year"].unique().to_list() == [2026]
+
+    def test_missing_directory_contents(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                scan_gp(tmpdir)
+
+
+@pytest.fixture
+def first_round_directory():
+    """The `gp_directory` fixture before round 2 was published."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_csv(tmpdir, "gp_results2024.csv", ANNUAL_CSV)
+        _write_csv(tmpdir, "gp_results2026_r1.csv", ROUND_1_CSV)
+        yield tmpdir
+
+
+class TestAddRound:
+    def test_matches_full_load(self, first_round_directory, gp_directory):
+        combined = load_gp(first_round_directory)
+        updated = add_gp_round(combined, os.path.join(gp_directory, "gp_results2026_r2.csv"))
+        full = load_gp(gp_directory)
+        assert updated.columns == full.columns
+        assert updated.sort("year", "Name").equals(full.sort("year", "Name"))
+
+    def test_other_years_untouched(self, first_round_directory, gp_directory):
+        combined = load_gp(first_round_directory)
+        updated = add_gp_round(combined, os.path.join(gp_directory, "gp_results2026_r2.csv"))
+        assert (updated.filter(pl.col("year") == 2024)
+                .equals(combined.filter(pl.col("year") == 2024)))
+
+    def test_matches_full_load_with_overridden_names(self, first_round_directory):
+        # Both spellings are adjusted to "Tantan Dai" before the rounds are joined, so her two
+        # rounds end up in a single row.
+        _write_csv(first_round_directory, "gp_results2026_r1.csv",
+                   ROUND_1_CSV + "3.,TanTan Dai,CHN,,40,40,40,3.,2026,1\n")
+        combined = load_gp(first_round_directory)
+        path = _write_csv(first_round_directory, "gp_results2026_r2.csv",
+                          ROUND_2_CSV + "3.,Dai Tantan,CHN,,30,30,30,3.,2026,2\n")
+
+        updated = add_gp_round(combined, path)
+        full = load_gp(first_round_directory)
+        assert updated.columns == full.columns
+        assert updated.drop("Rank").sort("year", "Name").equals(
+            full.drop("Rank").sort("year", "Name"))
+        tantan = full.filter(pl.col("Name") == "Tantan Dai")
+        assert tantan["Points"].to_list() == [70.0]
+
+    def test_duplicate_round_rejected(self, gp_directory):
+        combined = load_gp(gp_directory)
+        with pytest.raises(ValueError, match="duplicate round"):
+            add_gp_round(combined, os.path.join(gp_directory, "gp_results2026_r2.csv"))
+
+    def test_ingest_updates_snapshot(self, first_round_directory):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            snapshot.write_snapshot("gp", gp_fingerprint(first_round_directory),
+                                    load_gp(first_round_directory), snapshot_dir)
+            path = _write_csv(first_round_directory, "gp_results2026_r2.csv", ROUND_2_CSV)
+
+            updated = ingest_gp_round(path, first_round_directory, snapshot_dir)
+
+            stored = snapshot.read_snapshot(
+                "gp", gp_fingerprint(first_round_directory), snapshot_dir)
+            assert stored is not None
+            assert stored.equals(updated)
+            assert len(updated.filter(pl.col("year") == 2026)) == 3
+
+
+class TestFingerprint:
+    def test_schema_change_changes_fingerprints(self, gp_directory, monkeypatch):
+        gp_before = gp_fingerprint(gp_directory)
+        combined_before = combined.combined_fingerprint(gp_directory)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(schemas.__file__) as f:
+                source = f.read()
+            path = _write_csv(tmpdir, "schemas.py",
+                              source.replace('"Points": pl.Float64', '"Points": pl.Float32'))
+            monkeypatch.setattr(schemas, "__file__", path)
+
+            assert gp_fingerprint(gp_directory) != gp_before
+            assert combined.combined_fingerprint(gp_directory) != combined_before
@@ -4,6 +4,7 @@ import polars as pl
 import pytest
 
 from shared.data.manipulation import attempted_mapping
+from shared.data.name_index import build_name_index
 
 
 def _make_gp(rows):
@@ -90,6 +91,13 @@ class TestManualOverride:
         mapped = attempted_mapping(other, gp, manual_override=override)
         assert _get_ids(mapped) == ["OVERRIDE_VIA_FLIP"]
 
+    def test_override_on_name_beats_flipped_name(self):
+        gp = _make_gp([("Unrelated Person", "DE", "up", "Unrelated Person (up) - DE")])
+        other = _make_other(["Alice Smith"])
+        override = {"Smith Alice": "VIA_FLIP", "Alice Smith": "VIA_NAME"}
+        mapped = attempted_mapping(other, gp, manual_override=override)
+        assert _get_ids(mapped) == ["VIA_NAME"]
+
     def test_default_override_is_wsc_map(self):
         """When no override is passed, WSC_NAME_TO_GP_ID_OVERRIDE is applied."""
         from shared.competitions import WSC_NAME_TO_GP_ID_OVERRIDE
@@ -128,3 +136,60 @@ class TestFallback:
         other = _make_other(["Alice Smith"])
         mapped = attempted_mapping(other, gp)
         assert len(mapped) == 1
+
+
+class TestFoldedNameMatch:
+    def test_accents_ignored(self):
+        gp = _make_gp([("Przemysław Dębiak", "POL", "Psyho", "Przemysław Dębiak (Psyho) - POL")])
+        other = _make_other(["Przemyslaw Debiak"])
+        mapped = attempted_mapping(other, gp)
+        assert _get_ids(mapped) == ["Przemysław Dębiak (Psyho) - POL"]
+
+    def test_punctuation_ignored(self):
+        gp = _make_gp([("Jean-Luc Picard", "FRA", "jl", "Jean-Luc Picard (jl) - FRA")])
+        other = _make_other(["Jean Luc Picard"])
+        mapped = attempted_mapping(other, gp)
+        assert _get_ids(mapped) == ["Jean-Luc Picard (jl) - FRA"]
+
+    def test_exact_match_preferred_over_folded(self):
+        gp = _make_gp([
+            ("Rene Dupont", "FRA", "rene", "Rene Dupont (rene) - FRA"),
+            ("René Dupont", "BEL", "rené", "René Dupont (rené) - BEL"),
+        ])
+        other = _make_other(["René Dupont"])
+        mapped = attempted_mapping(other, gp)
+        assert _get_ids(mapped) == ["René Dupont (rené) - BEL"]
+
+
+class TestNameIndex:
+    def test_prebuilt_index_matches_inline(self):
+        gp = _make_gp([
+            ("Alice Smith", "USA", "alice", "Alice Smith (alice) - USA"),
+            ("Bob Jones", "UK", "bob", "Bob Jones (bob) - UK"),
+        ])
+        other = _make_other(["alice smith", "Jones, Bob", "Carol"])
+        expected = attempted_mapping(other, gp)
+        mapped = attempted_mapping(other, gp, name_index=build_name_index(gp))
+        assert mapped.equals(expected)
+
+    def test_index_is_unique_per_key(self):
+        gp = _make_gp([
+            ("Alice Smith", "USA", None, "Alice Smith - USA"),
+            ("Alice Smith", "USA", "alice", "Alice Smith (alice) - USA"),
+        ])
+        index = build_name_index(gp)
+        assert index.select("variant", "key").is_duplicated().sum() == 0
+        exact = index.filter(pl.col("variant") == "exact")
+        assert exact.get_column("user_pseudo_id").to_list() == ["Alice Smith (alice) - USA"]
+
+    def test_index_snapshot_reused(self, tmp_path, monkeypatch):
+        import shared.data.loaders.gp as gp_loader
+
+        gp = _make_gp([("Alice Smith", "USA", "alice", "Alice Smith (alice) - USA")])
+        monkeypatch.setattr(gp_loader, "gp_fingerprint", lambda csv_directory: "v1")
+        monkeypatch.setattr(gp_loader, "load_gp_snapshot", lambda *args: gp)
+
+        first = gp_loader.load_gp_name_index("unused", str(tmp_path))
+        monkeypatch.setattr(gp_loader, "load_gp_snapshot", lambda *args: pytest.fail("rebuilt"))
+        second = gp_loader.load_gp_name_index("unused", str(tmp_path))
+        assert second.equals(first)
@@ -0,0 +1,93 @@
+"""Tests for the precomputed performance table and the lookups of PerformanceCollector."""
+
+import polars as pl
+
+from shared.solvers import PerformanceCollector, build_performance_table
+
+
+def _row(user_id, year, rank=None, total_gps=None, official=None, wsc_entry=None,
+         official_rank=None, unofficial_rank=None, esc_rank=None, esc_unofficial_rank=None,
+         esc_total=None):
+    return {
+        "user_pseudo_id": user_id, "year": year, "Rank": rank, "Total GPs": total_gps,
+        "Points": None if rank is None else 100.0 - rank,
+        "Official": official, "WSC_entry": wsc_entry,
+        "Official_rank": official_rank, "Unofficial_rank": unofficial_rank,
+        "ESC_rank": esc_rank, "ESC_unofficial_rank": esc_unofficial_rank, "ESC_total": esc_total,
+    }
+
+
+def _full_df():
+    return pl.DataFrame([
+        _row("a", 2024, rank=1, total_gps=8, official=True, wsc_entry=True,
+             official_rank=1, unofficial_rank=1, esc_total=10.0, esc_unofficial_rank=1),
+        _row("b", 2024, rank=2, total_gps=8, official=False, wsc_entry=True,
+             unofficial_rank=2),
+        _row("c", 2024, rank=3, total_gps=8, official=True, wsc_entry=True,
+             official_rank=2, unofficial_rank=3, esc_total=20.0, esc_rank=1,
+             esc_unofficial_rank=2),
+        _row("d", 2024, rank=4, total_gps=8),
+        _row("a", 2025, rank=2, total_gps=8),
+        _row("e", 2025, rank=1, total_gps=8),
+    ])
+
+
+def _outcome(table, solver, competition, year):
+    return table.filter((pl.col("user_pseudo_id") == solver)
+                        & (pl.col("competition") == competition)
+                        & (pl.col("year") == year)).row(0, named=True)
+
+
+class TestBuildPerformanceTable:
+    def test_gp_ranked_within_year(self):
+        table = build_performance_table(_full_df())
+        assert _outcome(table, "a", "GP", 2024)["percentile"] == 1.0
+        assert _outcome(table, "d", "GP", 2024)["percentile"] == 0.25
+        assert _outcome(table, "a", "GP", 2025)["rank"] == 2.0
+        assert _outcome(table, "a", "GP", 2025)["total"] == 2
+
+    def test_wsc_official_and_unofficial_fields(self):
+        table = build_performance_table(_full_df())
+        # Officials are ranked among the two officials, unofficials among all three entries
+        assert _outcome(table, "c", "WSC", 2024)["percentile"] == 0.5
+        unofficial = _outcome(table, "b", "WSC", 2024)
+        assert unofficial["percentile"] == 2 / 3
+        assert not unofficial["official"]
+        assert _outcome(table, "c", "WSC", 2024)["total"] == 3
+        assert table.filter(pl.col("user_pseudo_id") == "d",
+                            pl.col("competition") == "WSC").is_empty()
+
+    def test_esc_ranked_and_unranked_entries(self):
+        table = build_performance_table(_full_df())
+        ranked = _outcome(table, "c", "ESC", 2024)
+        assert (ranked["percentile"], ranked["rank"], ranked["total"]) == (1.0, 1.0, 1)
+        unranked = _outcome(table, "a", "ESC", 2024)
+        assert (unranked["percentile"], unranked["rank"], unranked["total"]) == (1.0, 1.0, 2)
+        assert not unranked["official"]
+
+    def test_sorted_by_solver(self):
+        table = build_performance_table(_full_df())
+        assert table.get_column("user_pseudo_id").is_sorted()
+
+
+class TestPerformanceCollector:
+    def test_labels_from_lookups(self):
+        table = build_performance_table(_full_df())
+        collector = PerformanceCollector("b", ("gp", "wsc", "esc"), table)
+        for year in (2024, 2025):
+            collector.gp_performance_by_solver_year(year)
+            collector.wsc_performance_by_solver_year(year)
+            collector.esc_performance_by_solver_year(year)
+
+        results = collector.solver_results
+        assert results.all_competition_names() == ["2024 GP", "2024 WSC", "2024 ESC", "2025 GP"]
+        labels = results.all_competition_outcome_descriptions()
+        assert labels[0] == "☆ 75th pctile (2nd of 4)"
+        assert labels[1] == "☆ 66th pctile (2nd of 3)*"
+        assert labels[2] == PerformanceCollector.LABEL_NO_RECORD
+        assert labels[3] == PerformanceCollector.LABEL_NO_RECORD
+
+    def test_excluded_competition_not_added(self):
+        collector = PerformanceCollector("a", ("gp",), build_performance_table(_full_df()))
+        assert collector.wsc_performance_by_solver_year(2024) is None
+        assert collector.solver_results.all_competition_names() == []
@@ -0,0 +1,113 @@
+"""Tests for the batch solver profiles."""
+
+import polars as pl
+import pytest
+
+from shared.data import round_statistics
+from shared.solvers import (
+    PerformanceCollector, SolverProfiles, build_performance_table, rolling_means,
+    solver_rating_series, trend_chart_data)
+
+
+def _full_df():
+    return pl.DataFrame({
+        "user_pseudo_id": ["a", "b", "a", "c", "b"],
+        "Name": ["Alice", "Bob", "Alicia", "Carol", "Bobby"],
+        "year": [2020, 2021, 2023, 2022, 2022],
+        "Rank": [1, 1, 2, 1, 2],
+        "Total GPs": [8, 8, 8, 8, 8],
+        "Points": [100.0, 90.0, 80.0, 70.0, 60.0],
+    })
+
+
+def _trend_df():
+    return pl.DataFrame({
+        "user_pseudo_id": ["a", "b", "c"], "#": [1, 2, 3], "Name": ["Alice", "Bob", "Carol"],
+        "Country": ["XX"] * 3, "Nick": ["x"] * 3, "year": [2024] * 3,
+        "GP_t1 points": [50.0, 100.0, None], "GP_t2 points": [None, 80.0, 40.0],
+        "Official": [None] * 3, "Official_rank": [None] * 3, "Unofficial_rank": [None] * 3,
+        "WSC_total": [None] * 3,
+    })
+
+
+class TestSolverProfiles:
+    def test_names_from_first_row(self):
+        profiles = SolverProfiles(_full_df(), ["b", "a"])
+        assert profiles.names() == {"b": "Bob", "a": "Alice"}
+
+    def test_unknown_solver_name_raises(self):
+        with pytest.raises(ValueError, match="0 matching rows"):
+            SolverProfiles(_full_df(), ["a", "z"]).names()
+
+    def test_years_span_each_solver(self):
+        years = SolverProfiles(_full_df(), ["a", "b", "z"]).years()
+        assert years == {"a": [2020, 2021, 2022, 2023], "b": [2021, 2022], "z": []}
+
+    def test_rank_outcomes_match_single_collectors(self):
+        full_df = _full_df()
+        table = build_performance_table(full_df)
+        outcomes = SolverProfiles(full_df, ["a", "b"]).rank_outcomes(table, ("gp",))
+
+        single = PerformanceCollector("b", ("gp",), table)
+        for year in (2021, 2022):
+            single.gp_performance_by_solver_year(year)
+
+        assert list(outcomes) == ["a", "b"]
+        assert (outcomes["b"].all_competition_outcome_descriptions()
+                == single.solver_results.all_competition_outcome_descriptions())
+        assert outcomes["a"].all_competition_names() == ["2020 GP", "2021 GP", "2022 GP", "2023 GP"]
+
+
+class TestTrendPoints:
+    def test_only_selected_solvers_against_all_round_statistics(self):
+        data, _, year_starts, years = SolverProfiles(_trend_df(), ["a"]).trend_points(
+            "points", True, ("gp",), window_size=2)
+        # Round 2 stays on the axis even though Alice did not play it
+        assert data["Round"] == ["2024_1_gp", "2024_2_gp"]
+        assert data["Alice"] == (0.5, None)
+        assert (year_starts, years) == (["2024_1_gp"], [2024])
+
+    def test_precomputed_statistics_used(self):
+        full_df = _trend_df()
+        statistics = round_statistics(full_df).with_columns(pl.lit(200.0).alias("max"))
+        data, _, _, _ = SolverProfiles(full_df, ["b"]).trend_points(
+            "points", True, ("gp",), window_size=2, statistics=statistics)
+        assert data["Bob"] == pytest.approx((0.5, 0.4))
+
+
+class TestRollingMeans:
+    def test_matches_polars_rolling_mean_for_every_window(self):
+        outcomes = (0.5, None, 0.9, 0.1, None, None, 0.7)
+        means = rolling_means(outcomes)
+        assert list(means) == list(range(1, 21))
+        for window_size, series in means.items():
+            expected = pl.Series(outcomes).rolling_mean(window_size, min_periods=1)
+            assert series.is_null().to_list() == expected.is_null().to_list()
+            assert series.to_list() == pytest.approx(expected.to_list(), nan_ok=True)
+
+    def test_empty_series(self):
+        means = rolling_means((), window_sizes=(1, 2))
+        assert [(window_size, len(series)) for window_size, series in means.items()] == [
+            (1, 0), (2, 0)]
+
+
+class TestTrendChartData:
+    def test_moving_averages_for_each_window(self):
+        full_df = _trend_df()
+        data, rolling, _, _ = trend_chart_data(full_df, "points", False, ["b"], ("gp",),
+                                               window_sizes=(1, 2))
+        assert data["Bob"] == (100.0, 80.0)
+        assert rolling[1]["Bob"].to_list() == [100.0, 80.0]
+        assert rolling[2]["Bob"].to_list() == [100.0, 90.0]
+
+
+class TestSolverRatingSeries:
+    def test_sorted_per_solver_in_requested_order(self):
+        timeseries = pl.DataFrame({
+            "user_pseudo_id": ["a", "b", "a", "c"],
+            "comp_idx": [2, 1, 1, 1],
+            "rating": [1510.0, 1400.0, 1500.0, 1300.0],
+        })
+        series = solver_rating_series(timeseries, ["b", "a", "z"])
+        assert list(series) == ["b", "a"]
+        assert series["a"].get_column("rating").to_list() == [1500.0, 1510.0]
@@ -0,0 +1,104 @@
+"""Tests for the ratings query helpers."""
+
+import os
+import tempfile
+
+import polars as pl
+import pytest
+
+from shared.data.loaders.ratings import (
+    build_leaderboard_history, get_leaderboard_at_round, get_solver_timeseries,
+    load_ratings_timeseries, with_name_parts, write_ratings_timeseries)
+
+
+def _timeseries():
+    rows = [
+        # (user_pseudo_id, comp_idx, rating, rank)
+        ("Bob", 1, 500.0, 2),
+        ("Alice", 1, 520.0, 1),
+        ("Alice", 2, 540.0, 1),
+        ("Carol", 2, 530.0, 2),
+        ("Bob", 3, 560.0, 1),
+    ]
+    return pl.DataFrame({
+        "user_pseudo_id": [r[0] for r in rows],
+        "year": [2024] * len(rows),
+        "round": [r[1] for r in rows],
+        "competition": ["GP"] * len(rows),
+        "comp_idx": [r[1] for r in rows],
+        "rating": [r[2] for r in rows],
+        "rank": [r[3] for r in rows],
+    })
+
+
+@pytest.fixture
+def ratings_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_ratings_timeseries(_timeseries(), tmpdir)
+        yield tmpdir
+
+
+class TestLayout:
+    def test_sorted_by_solver_and_round(self, ratings_dir):
+        stored = pl.read_parquet(f"{ratings_dir}/ratings_timeseries.parquet")
+        assert stored["user_pseudo_id"].to_list() == ["Alice", "Alice", "Bob", "Bob", "Carol"]
+        assert stored["comp_idx"].to_list() == [1, 2, 1, 3, 2]
+
+
+class TestQueries:
+    def test_solver_timeseries(self, ratings_dir):
+        bob = get_solver_timeseries("Bob", ratings_dir)
+        assert bob["comp_idx"].to_list() == [1, 3]
+        assert bob["rating"].to_list() == [500.0, 560.0]
+
+    def test_leaderboard_uses_latest_rating_up_to_round(self, ratings_dir):
+        leaderboard = get_leaderboard_at_round(2, ratings_dir)
+        assert leaderboard["user_pseudo_id"].to_list() == ["Alice", "Carol", "Bob"]
+        assert leaderboard["rank"].to_list() == [1, 2, 3]
+
+    def test_leaderboard_top_n(self, ratings_dir):
+        leaderboard = get_leaderboard_at_round(3, ratings_dir, top_n=1)
+        assert leaderboard["user_pseudo_id"].to_list() == ["Bob"]
+
+    def test_solver_ids_attached(self, ratings_dir):
+        timeseries = load_ratings_timeseries(ratings_dir)
+        ids = dict(timeseries.select("user_pseudo_id", "solver_id").unique().iter_rows())
+        bob = get_solver_timeseries("Bob", ratings_dir)
+        assert bob["solver_id"].to_list() == [ids["Bob"]] * 2
+        for top_n in (2, 500):  # from the stored history, and computed
+            leaderboard = get_leaderboard_at_round(2, ratings_dir, top_n=top_n)
+            assert leaderboard["solver_id"].to_list() == [
+                ids[solver] for solver in leaderboard["user_pseudo_id"]]
+
+
+class TestLeaderboardHistory:
+    def test_every_comp_idx_stored(self):
+        history = build_leaderboard_history(_timeseries())
+        assert history.group_by("as_of").len().sort("as_of").rows() == [(1, 2), (2, 3), (3, 3)]
+
+    def test_top_k(self):
+        history = build_leaderboard_history(_timeseries(), top_k=1)
+        assert history.select("as_of", "user_pseudo_id").rows() == [
+            (1, "Alice"), (2, "Alice"), (3, "Bob")]
+
+    def test_lookup_matches_computed_leaderboard(self, ratings_dir):
+        stored = [get_leaderboard_at_round(idx, ratings_dir) for idx in (1, 2, 3)]
+        os.remove(f"{ratings_dir}/leaderboard_history.parquet")
+        computed = [get_leaderboard_at_round(idx, ratings_dir) for idx in (1, 2, 3)]
+        for left, right in zip(stored, computed):
+            assert left.equals(right)
+
+
+class TestNameParts:
+    def test_full_identifier(self):
+        df = with_name_parts(pl.DataFrame({"user_pseudo_id": ["Jan Novák (jn) - Czech Rep."]}))
+        assert df.select("Name", "Nick", "Country").row(0) == ("Jan Novák", "jn", "Czech Rep.")
+
+    def test_country_follows_last_separator(self):
+        df = with_name_parts(pl.DataFrame({"user_pseudo_id": ["Ann Lee (al) - Korea - South"]}))
+        assert df.select("Name", "Nick", "Country").row(0) == ("Ann Lee", "al", "South")
+
+    def test_missing_parts_are_empty(self):
+        df = with_name_parts(pl.DataFrame({"user_pseudo_id": ["Bob", "Carol - UK", "Dan (d)"]}))
+        assert df.select("Name", "Nick", "Country").rows() == [
+            ("Bob", "", ""), ("Carol", "", "UK"), ("Dan", "d", "")]
@@ -0,0 +1,70 @@
+"""Tests for the solver identifier registry."""
+
+import threading
+
+import polars as pl
+
+from shared.data.registry import (
+    load_registry, register_solvers, solver_key, with_solver_ids)
+
+
+class TestRegistry:
+    def test_new_solvers_numbered_in_sorted_order(self):
+        registry = register_solvers(["Bob", "Alice", None, "Bob"])
+        assert registry.rows() == [(0, "Alice"), (1, "Bob")]
+
+    def test_identifiers_are_stable(self):
+        register_solvers(["Bob", "Alice"])
+        registry = register_solvers(["Aaron", "Bob"])
+        assert registry.rows() == [(0, "Alice"), (1, "Bob"), (2, "Aaron")]
+
+    def test_persisted(self, solver_registry):
+        register_solvers(["Alice"])
+        assert solver_registry.exists()
+        assert load_registry(str(solver_registry)).rows() == [(0, "Alice")]
+
+    def test_with_solver_ids_keeps_rows_in_order(self):
+        df = pl.DataFrame({"user_pseudo_id": ["Bob", "Alice", None, "Bob"], "x": [1, 2, 3, 4]})
+        result = with_solver_ids(df)
+        assert result["x"].to_list() == [1, 2, 3, 4]
+        assert result["solver_id"].to_list() == [1, 0, None, 1]
+        assert result["solver_id"].dtype == pl.UInt32
+
+    def test_existing_solver_id_replaced(self):
+        df = pl.DataFrame({"user_pseudo_id": ["Alice"], "solver_id": [99]})
+        assert with_solver_ids(df)["solver_id"].to_list() == [0]
+
+    def test_concurrent_registrations_get_distinct_identifiers(self):
+        barrier = threading.Barrier(8)
+
+        def register(worker):
+            barrier.wait()
+            register_solvers([f"Solver {worker}-{n}" for n in range(20)])
+
+        threads = [threading.Thread(target=register, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        registry = load_registry()
+        assert registry["user_pseudo_id"].n_unique() == 160
+        assert registry["solver_id"].to_list() == list(range(160))
+
+    def test_additions_by_another_process_kept(self, solver_registry):
+        register_solvers(["Alice"])
+        pl.DataFrame({"solver_id": pl.Series([0, 1], dtype=pl.UInt32),
+                      "user_pseudo_id": ["Alice", "Bob"]}).write_parquet(solver_registry)
+        registry = register_solvers(["Carol"])
+        assert registry.rows() == [(0, "Alice"), (1, "Bob"), (2, "Carol")]
+
+
+class TestSolverKey:
+    def test_integer_key_when_all_have_it(self):
+        a = pl.DataFrame({"user_pseudo_id": ["A"], "solver_id": [0]})
+        assert solver_key(a, a) == "solver_id"
+
+    def test_falls_back_to_string_key(self):
+        a = pl.DataFrame({"user_pseudo_id": ["A"], "solver_id": [0]})
+        b = pl.DataFrame({"user_pseudo_id": ["A"]})
+        assert solver_key(a, b) == "user_pseudo_id"
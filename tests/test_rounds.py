@@ -0,0 +1,71 @@
+"""Tests for the long round results table."""
+
+import polars as pl
+import pytest
+
+from shared.data.rounds import (
+    ROUND_RESULTS_SCHEMA, build_round_results, round_results, rounds_held, solver_rounds,
+    wide_round_columns)
+
+
+def _gp():
+    return pl.DataFrame({
+        "solver_id": pl.Series([2, 1, 1], dtype=pl.UInt32),
+        "year": [2024, 2024, 2025],
+        "GP_t1 points": [100.0, 90.5, 80.0],
+        "GP_t1 position": [1.0, 2.0, 1.0],
+        "GP_t2 points": [None, 70.0, None],
+        "GP_t2 position": [None, 1.0, None],
+    })
+
+
+def _wsc():
+    return pl.DataFrame({
+        "solver_id": pl.Series([1, 2, 3], dtype=pl.UInt32),
+        "year": [2024, 2024, 2024],
+        "WSC_t3 points": [50.0, 60.0, 60.0],
+    })
+
+
+@pytest.fixture
+def table():
+    return build_round_results({"GP": _gp(), "WSC": _wsc()})
+
+
+class TestRoundResults:
+    def test_one_row_per_round_played(self):
+        rounds = round_results(_gp(), "GP").sort("solver_id", "year", "round")
+        assert rounds.schema == pl.Schema(ROUND_RESULTS_SCHEMA)
+        assert rounds.select("solver_id", "year", "round", "points", "position").rows() == [
+            (1, 2024, 1, 90.5, 2), (1, 2024, 2, 70.0, 1), (1, 2025, 1, 80.0, 1),
+            (2, 2024, 1, 100.0, 1)]
+
+    def test_positions_ranked_when_missing(self):
+        rounds = round_results(_wsc(), "WSC").sort("solver_id")
+        assert rounds.get_column("position").to_list() == [3, 1, 1]
+
+    def test_unknown_competition_raises(self):
+        with pytest.raises(ValueError, match="unexpected competition"):
+            round_results(_gp(), "XYZ")
+
+
+class TestRoundTable:
+    def test_sorted_by_solver(self, table):
+        assert table.select("solver_id", "competition", "year", "round").rows() == [
+            (1, "GP", 2024, 1), (1, "GP", 2024, 2), (1, "GP", 2025, 1), (1, "WSC", 2024, 3),
+            (2, "GP", 2024, 1), (2, "WSC", 2024, 3), (3, "WSC", 2024, 3)]
+
+    def test_solver_rounds(self, table):
+        rows = solver_rounds(table, [3, 2]).select("solver_id", "competition").rows()
+        assert rows == [(3, "WSC"), (2, "GP"), (2, "WSC")]
+        assert solver_rounds(table, [99]).is_empty()
+
+    def test_rounds_held(self, table):
+        assert rounds_held(table, "GP", 2024) == [1, 2]
+        assert rounds_held(table, "WSC", 2024) == [3]
+        assert rounds_held(table, "WSC", 2025) == []
+
+    def test_wide_columns_round_trip(self, table):
+        wide = wide_round_columns(table, "GP").sort("solver_id", "year")
+        expected = _gp().with_columns(pl.col("year").cast(pl.Int16)).sort("solver_id", "year")
+        assert wide.equals(expected)
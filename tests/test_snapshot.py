@@ -0,0 +1,88 @@
+"""Tests for the Parquet snapshot layer used by the loaders."""
+
+import os
+import tempfile
+
+import polars as pl
+
+from shared.data.loaders import snapshot
+
+
+def _write(directory, filename, content):
+    path = os.path.join(directory, filename)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+class _CountingBuilder:
+    def __init__(self, value):
+        self.calls = 0
+        self.value = value
+
+    def __call__(self):
+        self.calls += 1
+        return pl.DataFrame({"a": [self.value]})
+
+
+class TestFingerprint:
+    def test_content_change_changes_fingerprint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = _write(tmpdir, "x.csv", "a\n1\n")
+            before = snapshot.compute_fingerprint(snapshot.fingerprint_directory(tmpdir))
+            stat = os.stat(path)
+            _write(tmpdir, "x.csv", "a\n2\n")
+            # Same size and mtime: only the content hash differs.
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            after = snapshot.compute_fingerprint(snapshot.fingerprint_directory(tmpdir))
+        assert before != after
+
+    def test_new_file_changes_fingerprint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write(tmpdir, "x.csv", "a\n1\n")
+            before = snapshot.compute_fingerprint(snapshot.fingerprint_directory(tmpdir))
+            _write(tmpdir, "y.csv", "a\n1\n")
+            after = snapshot.compute_fingerprint(snapshot.fingerprint_directory(tmpdir))
+        assert before != after
+
+    def test_other_suffixes_ignored(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write(tmpdir, "x.csv", "a\n1\n")
+            before = snapshot.compute_fingerprint(snapshot.fingerprint_directory(tmpdir))
+            _write(tmpdir, "notes.txt", "ignore me")
+            after = snapshot.compute_fingerprint(snapshot.fingerprint_directory(tmpdir))
+        assert before == after
+
+    def test_override_tables_change_fingerprint(self):
+        assert (snapshot.compute_fingerprint({2024: {1: "a"}}) !=
+                snapshot.compute_fingerprint({2024: {1: "b"}}))
+
+
+class TestLoadOrBuild:
+    def test_second_load_reads_snapshot(self):
+        builder = _CountingBuilder(1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = snapshot.load_or_build("t", "abc", builder, tmpdir)
+            second = snapshot.load_or_build("t", "abc", builder, tmpdir)
+        assert builder.calls == 1
+        assert first.equals(second)
+
+    def test_new_fingerprint_rebuilds_and_removes_stale(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot.load_or_build("t", "abc", _CountingBuilder(1), tmpdir)
+            rebuilt = snapshot.load_or_build("t", "def", _CountingBuilder(2), tmpdir)
+            files = sorted(os.listdir(tmpdir))
+        assert rebuilt["a"].to_list() == [2]
+        assert files == [snapshot.snapshot_path("t", "def", tmpdir).name]
+
+    def test_other_snapshot_names_untouched(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot.load_or_build("t-other", "abc", _CountingBuilder(1), tmpdir)
+            snapshot.load_or_build("t", "def", _CountingBuilder(2), tmpdir)
+            assert len(os.listdir(tmpdir)) == 2
+
+    def test_none_directory_disables_snapshot(self):
+        builder = _CountingBuilder(1)
+        snapshot.load_or_build("t", "abc", builder, None)
+        snapshot.load_or_build("t", "abc", builder, None)
+        assert builder.calls == 2
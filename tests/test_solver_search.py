@@ -0,0 +1,44 @@
+"""Tests for the solver search index."""
+
+import pytest
+
+from shared.data.solver_search import build_search_index, search_solvers
+
+SOLVERS = [
+    "Ken Endo (EKBM) - Japan",
+    "Kentaro Sumigawa (smiken) - Japan",
+    "Przemysław Dębiak (Psyho) - Poland",
+    "Deb Mohanty (debmohanty) - India",
+    "Jan Novák (jn) - Czech Rep.",
+]
+
+
+@pytest.fixture
+def index():
+    return build_search_index(SOLVERS)
+
+
+class TestSearchSolvers:
+    def test_empty_query_lists_in_order(self, index):
+        assert search_solvers(index, "", limit=2) == SOLVERS[:2]
+        assert search_solvers(index, "  ( ", limit=2) == SOLVERS[:2]
+
+    def test_prefix_matches_name_nick_and_country(self, index):
+        assert search_solvers(index, "psy") == ["Przemysław Dębiak (Psyho) - Poland"]
+        assert search_solvers(index, "czech") == ["Jan Novák (jn) - Czech Rep."]
+
+    def test_all_terms_must_match(self, index):
+        assert search_solvers(index, "ken japan") == SOLVERS[:2]
+        assert search_solvers(index, "ken poland") == []
+
+    def test_full_word_matches_rank_first(self, index):
+        assert search_solvers(index, "deb") == [
+            "Deb Mohanty (debmohanty) - India", "Przemysław Dębiak (Psyho) - Poland"]
+
+    def test_accents_and_case_ignored(self, index):
+        assert search_solvers(index, "NOVAK") == ["Jan Novák (jn) - Czech Rep."]
+        assert search_solvers(index, "dębiak") == ["Przemysław Dębiak (Psyho) - Poland"]
+
+    def test_limit(self, index):
+        assert len(search_solvers(index, "", limit=3)) == 3
+        assert search_solvers(index, "ken", limit=1) == ["Ken Endo (EKBM) - Japan"]
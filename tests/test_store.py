@@ -0,0 +1,113 @@
+"""Tests for the partitioned results store."""
+
+import tempfile
+
+import polars as pl
+import pytest
+
+import shared.data.registry
+from shared.data.loaders import store
+from shared.data.loaders.store import (
+    ensure_current, read_results, scan_results, stored_fingerprint, store_years,
+    write_competition)
+
+
+def _results():
+    return pl.DataFrame({
+        "Name": ["Alice Smith", "Bob Jones", "Alice Smith", "Carol White"],
+        "ESC_total": [100.0, 90.0, 80.0, 70.0],
+        "year": pl.Series([2026, 2026, 2025, 2025], dtype=pl.Int64),
+    })
+
+
+@pytest.fixture
+def store_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_competition("ESC", _results(), tmpdir)
+        yield tmpdir
+
+
+class TestStore:
+    def test_round_trip(self, store_dir):
+        stored = read_results("ESC", store_dir=store_dir)
+        assert stored.schema == _results().schema
+        assert stored.sort("year", "Name").equals(_results().sort("year", "Name"))
+
+    def test_years(self, store_dir):
+        assert store_years("ESC", store_dir) == [2025, 2026]
+
+    def test_year_and_column_selection(self, store_dir):
+        stored = read_results("ESC", years=[2025], columns=["Name"], store_dir=store_dir)
+        assert stored.columns == ["Name", "year"]
+        assert stored["Name"].to_list() == ["Alice Smith", "Carol White"]
+
+    def test_only_selected_partition_scanned(self, store_dir):
+        plan = scan_results("ESC", years=[2025], store_dir=store_dir).explain()
+        assert "year=2025" in plan
+        assert "year=2026" not in plan
+
+    def test_rewrite_drops_old_years(self, store_dir):
+        write_competition("ESC", _results().filter(pl.col("year") == 2026), store_dir)
+        assert store_years("ESC", store_dir) == [2026]
+
+    def test_unknown_competition(self, store_dir):
+        with pytest.raises(ValueError):
+            read_results("XYZ", store_dir=store_dir)
+
+    def test_missing_competition(self, store_dir):
+        with pytest.raises(FileNotFoundError):
+            read_results("WSC", store_dir=store_dir)
+
+
+class TestEnsureCurrent:
+    @pytest.fixture
+    def inputs(self, monkeypatch):
+        """Stand-in ESC loader and fingerprint, counting the builds."""
+        state = {"fingerprint": "v1", "builds": 0}
+
+        def loader():
+            state["builds"] += 1
+            return _results()
+
+        monkeypatch.setitem(store.COMPETITION_LOADERS, "ESC", loader)
+        monkeypatch.setitem(store.COMPETITION_FINGERPRINTS, "ESC", lambda: state["fingerprint"])
+        return state
+
+    def test_missing_competition_built(self, inputs):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ensure_current("ESC", tmpdir)
+            assert stored_fingerprint("ESC", tmpdir) == "v1"
+            assert store_years("ESC", tmpdir) == [2025, 2026]
+
+    def test_current_store_reused(self, inputs):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ensure_current("ESC", tmpdir)
+            ensure_current("ESC", tmpdir)
+            assert inputs["builds"] == 1
+
+    def test_changed_inputs_rebuild(self, inputs):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ensure_current("ESC", tmpdir)
+            inputs["fingerprint"] = "v2"
+            ensure_current("ESC", tmpdir)
+            assert inputs["builds"] == 2
+            assert stored_fingerprint("ESC", tmpdir) == "v2"
+
+    def test_store_without_fingerprint_rebuilt(self, inputs, store_dir):
+        assert stored_fingerprint("ESC", store_dir) is None
+        ensure_current("ESC", store_dir)
+        assert inputs["builds"] == 1
+
+
+class TestSolverIds:
+    def test_stored_ids_follow_registry(self):
+        results = _results().with_columns(
+            pl.col("Name").alias("user_pseudo_id"), pl.lit(99, dtype=pl.UInt32).alias("solver_id"))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_competition("ESC", results, tmpdir)
+            stored = read_results("ESC", store_dir=tmpdir)
+        registry = shared.data.registry.load_registry()
+        expected = stored.drop("solver_id").join(registry, on="user_pseudo_id", how="left")
+        assert stored.columns == results.columns
+        assert stored["solver_id"].to_list() == expected["solver_id"].to_list()
+        assert 99 not in stored["solver_id"].to_list()
@@ -0,0 +1,44 @@
+"""Tests for the general utility functions."""
+
+import polars as pl
+
+from shared.utils import cumulative_top_k_sums, sum_top_k_of_n_rounds
+
+
+# ── cumulative_top_k_sums ─────────────────────────────────────────────────────
+
+class TestCumulativeTopKSums:
+    def _df(self):
+        return pl.DataFrame({
+            "GP_t1 points": [10, 5],
+            "GP_t2 points": [30, None],
+            "GP_t3 points": [20, 40],
+        })
+
+    def test_best_k_of_each_prefix(self):
+        sums = cumulative_top_k_sums(self._df(), ["GP_t1 points", "GP_t2 points", "GP_t3 points"],
+                                     k=2)
+        assert sums.columns == ["GP_t1 points", "GP_t2 points", "GP_t3 points"]
+        assert sums.rows() == [(10.0, 40.0, 50.0), (5.0, 5.0, 45.0)]
+
+    def test_no_limit_counts_every_round(self):
+        sums = cumulative_top_k_sums(self._df(), ["GP_t1 points", "GP_t2 points", "GP_t3 points"])
+        assert sums.rows() == [(10.0, 40.0, 60.0), (5.0, 5.0, 45.0)]
+
+    def test_absent_round_counts_as_unplayed(self):
+        sums = cumulative_top_k_sums(self._df(), ["GP_t1 points", "GP_t9 points"])
+        assert sums.rows() == [(10.0, 10.0), (5.0, 5.0)]
+
+    def test_no_rounds_gives_empty_result(self):
+        sums = cumulative_top_k_sums(self._df(), [], k=2)
+        assert sums.is_empty()
+        assert sums.columns == []
+
+    def test_no_rounds_sum_to_zero(self):
+        best = sum_top_k_of_n_rounds(self._df(), 2, 1, [])
+        assert best.to_series().to_list() == [0.0, 0.0]
+
+    def test_matches_sum_top_k_of_n_rounds(self):
+        columns = ["GP_t1 points", "GP_t2 points", "GP_t3 points"]
+        best = sum_top_k_of_n_rounds(self._df(), 2, 1, columns)
+        assert best.to_series().to_list() == [30.0, 5.0]
@@ -0,0 +1,69 @@
+"""Time `attempted_mapping` and the GP adjustments as the override tables grow.
+
+Run from the repository root:
+
+    python utilities/benchmark_overrides.py
+
+Overrides are applied as hash lookups, so the timings should stay roughly flat as the synthetic
+override tables grow from tens to thousands of entries.
+"""
+
+import os
+import sys
+import timeit
+
+import polars as pl
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shared.competitions  # pylint: disable=wrong-import-position
+import shared.data  # pylint: disable=wrong-import-position
+from shared.data.loaders.eurosudoku import load_eurosudoku  # pylint: disable=wrong-import-position
+from shared.data.loaders.gp import load_gp  # pylint: disable=wrong-import-position
+from shared.data.loaders.wsc import load_wsc  # pylint: disable=wrong-import-position
+
+SIZES = (0, 10, 100, 1000, 5000)
+REPEATS = 5
+
+
+def synthetic_override(base, size):
+    """Extend `base` with `size` entries that never match a real name."""
+    override = dict(base)
+    override.update({f"Synthetic Solver {i}": f"Synthetic Solver {i} (Nickless) - Nowhere"
+                     for i in range(size)})
+    return override
+
+
+def main():
+    """Print the mean time for each override table size."""
+    gp = load_gp()
+    wsc = load_wsc()
+    esc = load_eurosudoku()
+
+    print(f"{'overrides':>10} {'WSC mapping (ms)':>18} {'ESC mapping (ms)':>18}")
+    for size in SIZES:
+        wsc_override = synthetic_override(shared.competitions.WSC_NAME_TO_GP_ID_OVERRIDE, size)
+        esc_override = synthetic_override(shared.competitions.ESC_NAME_TO_GP_ID_OVERRIDE, size)
+
+        wsc_time = timeit.timeit(
+            lambda: shared.data.attempted_mapping(wsc, gp, manual_override=wsc_override),
+            number=REPEATS) / REPEATS
+        esc_time = timeit.timeit(
+            lambda: shared.data.attempted_mapping(esc, gp, manual_override=esc_override),
+            number=REPEATS) / REPEATS
+
+        print(f"{len(wsc_override):>10} {wsc_time * 1000:>18.1f} {esc_time * 1000:>18.1f}")
+
+    names = gp.select(pl.col("Name").cast(pl.String))
+    print(f"\n{'overrides':>10} {'GP name lookup (ms)':>20}")
+    for size in SIZES:
+        table = {f"Synthetic Solver {i}": f"nick{i}" for i in range(size)}
+        table["Bobo Lo"] = "Seyeonnie"
+        lookup = pl.col("Name").replace_strict(table, default=pl.col("Name"),
+                                               return_dtype=pl.String)
+        elapsed = timeit.timeit(lambda: names.with_columns(lookup), number=REPEATS) / REPEATS
+        print(f"{len(table):>10} {elapsed * 1000:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
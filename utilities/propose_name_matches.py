@@ -0,0 +1,60 @@
+"""Propose GP identities for WSC and ESC names that do not match automatically.
+
+Run from the repository root:
+
+    python utilities/propose_name_matches.py [output_directory]
+
+Writes `wsc_candidates.csv` and `esc_candidates.csv` (by default to `data/name_candidates`) with
+the best GP candidates for every name that neither the name index nor the override tables in
+`shared.competitions` resolve. Review the `accepted` column, then pass the reviewed table to
+`attempted_mapping` as `manual_override` or copy its accepted rows into the override tables.
+"""
+
+import os
+import sys
+
+import polars as pl
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shared.competitions  # pylint: disable=wrong-import-position
+from shared.data.fuzzy_match import propose_matches  # pylint: disable=wrong-import-position
+from shared.data.loaders.eurosudoku import load_eurosudoku  # pylint: disable=wrong-import-position
+from shared.data.loaders.gp import load_gp_snapshot  # pylint: disable=wrong-import-position
+from shared.data.loaders.wsc import load_wsc  # pylint: disable=wrong-import-position
+from shared.data.name_index import build_name_index, resolve_names  # pylint: disable=wrong-import-position
+
+
+def unresolved_names(df, name_index, override):
+    """Return the distinct names in `df` that neither `name_index` nor `override` resolve."""
+    resolved = resolve_names(df.get_column("Name"), name_index)
+    return (resolved
+            .filter(pl.col("user_pseudo_id").is_null()
+                    & ~pl.col("normalized_name").is_in(list(override))
+                    & ~pl.col("flipped_name").is_in(list(override)))
+            .get_column("Name"))
+
+
+def main():
+    """Write a candidate table for each competition."""
+    output_directory = sys.argv[1] if len(sys.argv) > 1 else "data/name_candidates"
+    os.makedirs(output_directory, exist_ok=True)
+
+    gp = load_gp_snapshot()
+    name_index = build_name_index(gp)
+
+    for competition, df, override in (
+        ("wsc", load_wsc(), shared.competitions.WSC_NAME_TO_GP_ID_OVERRIDE),
+        ("esc", load_eurosudoku(), shared.competitions.ESC_NAME_TO_GP_ID_OVERRIDE),
+    ):
+        names = unresolved_names(df, name_index, override)
+        candidates = propose_matches(names, gp)
+        path = os.path.join(output_directory, f"{competition}_candidates.csv")
+        candidates.write_csv(path)
+        print(f"{competition.upper()}: {len(names)} unresolved names, "
+              f"{candidates.get_column('Name').n_unique()} with candidates, "
+              f"{candidates.get_column('accepted').sum()} accepted -> {path}")
+
+
+if __name__ == "__main__":
+    main()